@@ -0,0 +1,12 @@
+"""Benchmarks for the task tracker database.
+
+The scale suite lives in ``benchmarks.scale`` (``python -m benchmarks.scale``) and
+the connection profile comparison in ``benchmarks.profiles``; the ``bench_*.py``
+files are standalone scripts for individual optimizations.
+"""
+
+import sys
+from pathlib import Path
+
+# Allow running from a source checkout without installing the package.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Benchmark: task creation throughput in rows per second.
+
+Compares one ``create_task`` call per row with a single ``create_tasks`` call.
+
+Usage:
+    python benchmarks/bench_bulk_create.py [--rows 2000] [--tags 2]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from task_tracker_mcp.database import DatabaseManager  # noqa: E402
+
+
+def make_tasks(count: int, tags_per_task: int) -> list[dict]:
+    """Build ``count`` task payloads with ``tags_per_task`` tags each."""
+    return [
+        {
+            "title": f"Imported task {i}",
+            "description": f"Backlog item number {i}",
+            "priority": ("low", "medium", "high")[i % 3],
+            "due_date": f"2026-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+            "tags": [f"tag-{(i + j) % 20}" for j in range(tags_per_task)],
+        }
+        for i in range(count)
+    ]
+
+
+async def run_single(db: DatabaseManager, tasks: list[dict]) -> None:
+    for item in tasks:
+        fields = {k: v for k, v in item.items() if k != "tags"}
+        task = await db.create_task(**fields)
+        for tag_name in item["tags"]:
+            await db.add_tag(task["id"], tag_name)
+
+
+async def run_bulk(db: DatabaseManager, tasks: list[dict]) -> None:
+    await db.create_tasks(tasks)
+
+
+async def measure(name: str, fn, tasks: list[dict]) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(str(Path(tmp) / "bench.db"))
+        await db.initialize()
+        start = time.perf_counter()
+        await fn(db, tasks)
+        elapsed = time.perf_counter() - start
+        await db.close()
+    print(f"{name:>14} {len(tasks):>8} rows {elapsed:>9.3f} s {len(tasks) / elapsed:>12.0f} rows/s")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--tags", type=int, default=2)
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.rows, args.tags)
+    await measure("create_task", run_single, tasks)
+    await measure("create_tasks", run_bulk, tasks)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
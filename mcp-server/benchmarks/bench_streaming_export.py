@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Benchmark: peak memory of exporting every task as JSON.
+
+Compares loading all tasks with ``list_tasks`` and ``json.dumps`` against
+streaming them with ``iter_tasks`` and ``write_json_document`` into a file.
+Peak memory is measured with tracemalloc.
+
+Usage:
+    python benchmarks/bench_streaming_export.py [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from task_tracker_mcp.database import DatabaseManager  # noqa: E402
+from task_tracker_mcp.streaming import write_json_document  # noqa: E402
+
+
+async def seed(db: DatabaseManager, count: int) -> None:
+    """Insert ``count`` tasks, each with two tags."""
+    tasks = [
+        {
+            "title": f"Exported task {i}",
+            "description": "A moderately long description " * 3,
+            "priority": ("low", "medium", "high")[i % 3],
+            "due_date": f"2026-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+            "tags": [f"tag-{i % 10}", f"tag-{i % 7 + 10}"],
+        }
+        for i in range(count)
+    ]
+    for start in range(0, count, 10000):
+        await db.create_tasks(tasks[start : start + 10000])
+
+
+async def export_materialized(db: DatabaseManager, count: int, fp) -> None:
+    tasks = await db.list_tasks(limit=count)
+    fp.write(json.dumps({"tasks": tasks}, indent=2))
+
+
+async def export_streaming(db: DatabaseManager, count: int, fp) -> None:
+    await write_json_document(fp, "tasks", db.iter_tasks())
+
+
+async def measure(fn, db: DatabaseManager, count: int) -> tuple[float, float]:
+    """Return (peak MiB, seconds) for one export into the null device."""
+    with open(os.devnull, "w") as fp:
+        tracemalloc.start()
+        start = time.perf_counter()
+        await fn(db, count, fp)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return peak / (1024 * 1024), elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'tasks':>8} {'list+dumps MiB':>15} {'stream MiB':>11} {'list s':>8} {'stream s':>9}")
+    for count in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseManager(str(Path(tmp) / "bench.db"))
+            await db.initialize()
+            await seed(db, count)
+            full_mib, full_s = await measure(export_materialized, db, count)
+            stream_mib, stream_s = await measure(export_streaming, db, count)
+            await db.close()
+        print(f"{count:>8} {full_mib:>15.1f} {stream_mib:>11.1f} {full_s:>8.2f} {stream_s:>9.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Benchmark: tag hydration latency against page size.
+
+Compares the batched tag hydration used by ``DatabaseManager.list_tasks`` with
+the previous one-query-per-task (N+1) approach.
+
+Usage:
+    python benchmarks/bench_tag_hydration.py [--tasks 5000] [--repeat 20]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from task_tracker_mcp.database import DatabaseManager  # noqa: E402
+
+PAGE_SIZES = [10, 50, 100, 500, 1000]
+
+
+async def seed(db: DatabaseManager, num_tasks: int, num_tags: int = 50) -> None:
+    """Populate the database with tasks carrying 0-4 random tags each."""
+    rng = random.Random(42)
+    conn = db.connection
+    await conn.executemany(
+        "INSERT INTO tags (name) VALUES (?)", [(f"tag-{i}",) for i in range(num_tags)]
+    )
+    await conn.executemany(
+        "INSERT INTO tasks (title, priority, due_date) VALUES (?, ?, ?)",
+        [
+            (
+                f"Task {i}",
+                rng.choice(["low", "medium", "high"]),
+                f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            )
+            for i in range(num_tasks)
+        ],
+    )
+    links = {
+        (task_id, rng.randint(1, num_tags))
+        for task_id in range(1, num_tasks + 1)
+        for _ in range(rng.randint(0, 4))
+    }
+    await conn.executemany("INSERT INTO task_tags (task_id, tag_id) VALUES (?, ?)", links)
+    await conn.commit()
+
+
+async def list_tasks_n_plus_one(db: DatabaseManager, limit: int) -> list[dict]:
+    """The pre-batching implementation: one tag query per returned task."""
+    conn = db.connection
+    cursor = await conn.execute(
+        """SELECT * FROM tasks
+        ORDER BY priority = 'high' DESC, due_date ASC
+        LIMIT ?""",
+        (limit,),
+    )
+    tasks = []
+    for row in await cursor.fetchall():
+        task = dict(row)
+        tags_cursor = await conn.execute(
+            """SELECT t.id, t.name FROM tags t
+            JOIN task_tags tt ON t.id = tt.tag_id
+            WHERE tt.task_id = ?""",
+            (task["id"],),
+        )
+        task["tags"] = [dict(tag) for tag in await tags_cursor.fetchall()]
+        tasks.append(task)
+    return tasks
+
+
+async def time_call(fn, repeat: int) -> float:
+    """Return the median wall time of ``fn`` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(str(Path(tmp) / "bench.db"))
+        await db.initialize()
+        await seed(db, args.tasks)
+
+        print(f"{'page size':>10} {'batched ms':>12} {'n+1 ms':>12} {'speedup':>9}")
+        for page_size in PAGE_SIZES:
+            batched = await time_call(lambda: db.list_tasks(limit=page_size), args.repeat)
+            naive = await time_call(
+                lambda: list_tasks_n_plus_one(db, page_size), args.repeat
+            )
+            print(f"{page_size:>10} {batched:>12.2f} {naive:>12.2f} {naive / batched:>8.1f}x")
+
+        await db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
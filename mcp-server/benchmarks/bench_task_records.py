@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Benchmark: memory and time of serving one 1000-task page as JSON.
+
+Compares ``list_tasks_page`` returning dicts encoded with ``json.dumps`` against
+``TaskRecord`` rows encoded with ``dumps_task_document``. For each page it
+reports the blocks and KiB held by the fetched page, the peak traced memory of
+fetching and encoding it (tracemalloc) and the median time without tracing.
+
+Usage:
+    python benchmarks/bench_task_records.py [--size 20000] [--page 1000] [--iterations 30]
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from task_tracker_mcp.database import DatabaseManager  # noqa: E402
+from task_tracker_mcp.records import dumps_task_document  # noqa: E402
+
+
+async def seed(db: DatabaseManager, count: int) -> None:
+    """Insert ``count`` tasks with zero to two tags each."""
+    tasks = [
+        {
+            "title": f"Listed task {i}",
+            "description": "A moderately long description " * 3,
+            "priority": ("low", "medium", "high")[i % 3],
+            "due_date": f"2026-{i % 12 + 1:02d}-{i % 28 + 1:02d}" if i % 4 else None,
+            "tags": [f"tag-{i % 10}", f"tag-{i % 7 + 10}"][: i % 3],
+        }
+        for i in range(count)
+    ]
+    for start in range(0, count, 10000):
+        await db.create_tasks(tasks[start : start + 10000])
+
+
+def dict_mode(db: DatabaseManager, page: int):
+    async def fetch(cursor):
+        return await db.list_tasks_page(limit=page, cursor=cursor)
+
+    def encode(tasks, next_cursor):
+        document = {"count": len(tasks), "tasks": tasks, "next_cursor": next_cursor}
+        return json.dumps(document, indent=2)
+
+    return fetch, encode
+
+
+def record_mode(db: DatabaseManager, page: int):
+    async def fetch(cursor):
+        return await db.list_tasks_page(limit=page, cursor=cursor, records=True)
+
+    def encode(tasks, next_cursor):
+        return dumps_task_document(
+            {"count": len(tasks), "tasks": tasks, "next_cursor": next_cursor}
+        )
+
+    return fetch, encode
+
+
+async def measure(fetch, encode, cursors: list, iterations: int) -> dict:
+    """Return page memory, peak memory and median milliseconds per page."""
+    held_blocks, held_bytes, peaks = [], [], []
+    tracemalloc.start()
+    for cursor in cursors:
+        gc.collect()
+        blocks = sys.getallocatedblocks()
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        tasks, next_cursor = await fetch(cursor)
+        held_blocks.append(sys.getallocatedblocks() - blocks)
+        held_bytes.append(tracemalloc.get_traced_memory()[0] - before)
+        encode(tasks, next_cursor)
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+        del tasks
+    tracemalloc.stop()
+
+    timings = []
+    for i in range(iterations):
+        started = time.perf_counter()
+        tasks, next_cursor = await fetch(cursors[i % len(cursors)])
+        encode(tasks, next_cursor)
+        timings.append(time.perf_counter() - started)
+    return {
+        "page_blocks": statistics.median(held_blocks),
+        "page_kib": statistics.median(held_bytes) / 1024,
+        "peak_kib": statistics.median(peaks) / 1024,
+        "p50_ms": statistics.median(timings) * 1000,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument("--page", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=30)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(str(Path(tmp) / "bench.db"), profile_queries=False)
+        await db.initialize()
+        await seed(db, args.size)
+
+        cursors = [None]
+        while len(cursors) < 5:
+            _, next_cursor = await db.list_tasks_page(limit=args.page, cursor=cursors[-1])
+            if next_cursor is None:
+                break
+            cursors.append(next_cursor)
+
+        dicts, _ = await db.list_tasks_page(limit=args.page, cursor=cursors[-1])
+        records, _ = await db.list_tasks_page(limit=args.page, cursor=cursors[-1], records=True)
+        expected = json.dumps({"tasks": dicts}, indent=2)
+        assert dumps_task_document({"tasks": records}) == expected, "encodings differ"
+
+        print(f"{'mode':<8} {'page blocks':>12} {'page KiB':>9} {'peak KiB':>9} {'p50 ms':>8}")
+        for name, mode in (("dicts", dict_mode), ("records", record_mode)):
+            fetch, encode = mode(db, args.page)
+            result = await measure(fetch, encode, cursors, args.iterations)
+            print(
+                f"{name:<8} {result['page_blocks']:>12.0f} {result['page_kib']:>9.0f}"
+                f" {result['peak_kib']:>9.0f} {result['p50_ms']:>8.2f}"
+            )
+        await db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
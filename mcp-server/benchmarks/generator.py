@@ -0,0 +1,104 @@
+"""Seeded synthetic task data for benchmarks.
+
+The same seed and size always produce the same projects, tags and tasks, so
+benchmark runs on different releases operate on identical data.
+"""
+
+import json
+import random
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterator, Optional
+
+from task_tracker_mcp.database import DatabaseManager
+
+# Words used to build titles and descriptions; common enough to give search
+# queries large result sets, with a few rare words for selective queries.
+WORDS = (
+    "deploy fix review update migrate refactor test document release design "
+    "api database cache search login billing report dashboard export import "
+    "queue worker schema index latency memory client server config monitor"
+).split()
+RARE_WORDS = ("zeppelin", "quasar", "nebula", "obsidian")
+
+STATUS_WEIGHTS = {"pending": 40, "in_progress": 20, "completed": 30, "blocked": 10}
+PRIORITY_WEIGHTS = {"low": 30, "medium": 50, "high": 20}
+
+
+def tag_names(count: int) -> list[str]:
+    """Return the tag vocabulary, most popular first."""
+    return [f"tag-{i:04d}" for i in range(count)]
+
+
+def zipf_weights(count: int, skew: float) -> list[float]:
+    """Weights for a Zipf-like distribution: rank ``r`` gets ``1 / r**skew``."""
+    return [1 / rank**skew for rank in range(1, count + 1)]
+
+
+def generate_tasks(
+    count: int,
+    seed: int = 42,
+    projects: int = 0,
+    tags: int = 200,
+    tag_skew: float = 1.1,
+    max_tags_per_task: int = 4,
+    today: Optional[date] = None,
+) -> Iterator[dict]:
+    """Yield ``count`` task records in the ``import_tasks`` format.
+
+    Tags follow a Zipf distribution over ``tags`` names (``tag_skew`` 0 is
+    uniform), so a few tags are on most tasks and most tags are rare. Due
+    dates fall between 60 days before and 90 days after ``today``, with 30% of
+    tasks undated, so overdue and due-soon queries have realistic hit rates.
+    Project IDs are drawn from 1..``projects``.
+    """
+    rng = random.Random(seed)
+    today = today or date.today()
+    vocabulary = tag_names(tags)
+    weights = zipf_weights(tags, tag_skew)
+    statuses, status_weights = zip(*STATUS_WEIGHTS.items())
+    priorities, priority_weights = zip(*PRIORITY_WEIGHTS.items())
+
+    for i in range(count):
+        words = rng.choices(WORDS, k=4)
+        if rng.random() < 0.001:
+            words.append(rng.choice(RARE_WORDS))
+        tag_count = rng.randint(0, max_tags_per_task)
+        due = None
+        if rng.random() >= 0.3:
+            due = (today + timedelta(days=rng.randint(-60, 90))).isoformat()
+        yield {
+            "title": f"{' '.join(words[:3]).capitalize()} #{i}",
+            "description": " ".join(rng.choices(WORDS, k=12) + words[3:]),
+            "status": rng.choices(statuses, status_weights)[0],
+            "priority": rng.choices(priorities, priority_weights)[0],
+            "project_id": rng.randint(1, projects) if projects else None,
+            "due_date": due,
+            "tags": sorted(set(rng.choices(vocabulary, weights, k=tag_count))),
+        }
+
+
+async def build_database(
+    path: str, count: int, seed: int = 42, projects: int = 0, tags: int = 200, **options
+) -> DatabaseManager:
+    """Create an initialized database at ``path`` holding generated data.
+
+    Projects are created through ``create_project`` and tasks are loaded with
+    the bulk ``import_tasks`` path. ``options`` are passed to
+    ``DatabaseManager``.
+    """
+    db = DatabaseManager(path, **options)
+    await db.initialize()
+    for i in range(projects):
+        await db.create_project(f"Project {i + 1}", f"Generated project {i + 1}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        records = Path(tmp) / "tasks.ndjson"
+        with open(records, "w", encoding="utf-8") as fp:
+            for record in generate_tasks(count, seed=seed, projects=projects, tags=tags):
+                fp.write(json.dumps(record))
+                fp.write("\n")
+        with open(records, encoding="utf-8") as fp:
+            await db.import_tasks(fp)
+    return db
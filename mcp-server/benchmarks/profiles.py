@@ -0,0 +1,114 @@
+"""Benchmark: effect of each SQLite connection profile on the tool workloads.
+
+Builds the same seeded database once per profile in ``CONNECTION_PROFILES`` and
+runs the scale suite's read and write cases on it, printing p50/p99 latency per
+profile and optionally writing the results as JSON.
+
+Usage:
+    python -m benchmarks.profiles [--size 20000] [--iterations 50]
+        [--profiles durable balanced] [--cases get_task create_task] [--output report.json]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from task_tracker_mcp.database import CONNECTION_PROFILES
+
+from .generator import build_database
+from .scale import CASES, TAGS, Context, run_case
+
+DEFAULT_CASES = [
+    "get_task",
+    "list_tasks_page",
+    "filter_status",
+    "search_common",
+    "task_statistics",
+    "overdue_tasks",
+    "create_task",
+    "update_task",
+    "add_tags",
+]
+
+
+async def run_profile(profile: str, args: argparse.Namespace) -> dict:
+    """Build a database with ``profile`` and run the selected cases on it."""
+    projects = max(1, args.size // 1000)
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        db = await build_database(
+            str(Path(tmp) / "bench.db"),
+            args.size,
+            seed=args.seed,
+            projects=projects,
+            tags=TAGS,
+            cache_size=0,
+            profile=profile,
+        )
+        build_seconds = time.perf_counter() - started
+        ctx = Context(db, args.size, projects, args.seed)
+        try:
+            cases = {
+                name: await run_case(ctx, CASES[name], args.iterations, args.budget)
+                for name in args.cases
+            }
+        finally:
+            await db.close()
+    return {"build_seconds": round(build_seconds, 2), "cases": cases}
+
+
+def print_table(results: dict) -> None:
+    """Print p50/p99 latency of every case, one column per profile."""
+    profiles = list(results)
+    header = "".join(f"{profile + ' p50/p99 ms':>26}" for profile in profiles)
+    print(f"{'case':<18}{header}", file=sys.stderr)
+    print(
+        f"{'build (s)':<18}"
+        + "".join(f"{results[p]['build_seconds']:>26.2f}" for p in profiles),
+        file=sys.stderr,
+    )
+    for name in next(iter(results.values()))["cases"]:
+        row = ""
+        for profile in profiles:
+            case = results[profile]["cases"][name]
+            row += f"{case['p50_ms']:>17.3f} /{case['p99_ms']:>7.2f}"
+        print(f"{name:<18}{row}", file=sys.stderr)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument(
+        "--budget", type=float, default=10.0, help="Maximum seconds spent on one case"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        choices=list(CONNECTION_PROFILES),
+        default=list(CONNECTION_PROFILES),
+    )
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=DEFAULT_CASES)
+    parser.add_argument("--output", help="Write the JSON results here")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    results = {}
+    for profile in args.profiles:
+        print(f"Running profile {profile}...", file=sys.stderr)
+        results[profile] = await run_profile(profile, args)
+    print_table(results)
+
+    if args.output:
+        report = {"size": args.size, "seed": args.seed, "profiles": results}
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,272 @@
+"""Benchmark: DatabaseManager latency and throughput across data sizes.
+
+Builds a seeded synthetic database for every size and times each public read
+and write method, reporting p50/p95/p99 latency and rows/sec as JSON so runs on
+different releases can be compared.
+
+Usage:
+    python -m benchmarks.scale [--sizes 10000 100000 1000000] [--iterations 30]
+        [--seed 42] [--output report.json] [--compare baseline.json]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import platform
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+import task_tracker_mcp
+from task_tracker_mcp.database import TASK_PRIORITIES, TASK_STATUSES, DatabaseManager
+
+from .generator import RARE_WORDS, build_database, tag_names
+
+DEFAULT_SIZES = [10_000, 100_000]
+TAGS = 200
+
+
+class Context:
+    """Database and generated-data facts shared by the benchmark cases."""
+
+    def __init__(self, db: DatabaseManager, size: int, projects: int, seed: int):
+        self.db = db
+        self.size = size
+        self.projects = projects
+        self.tags = tag_names(TAGS)
+        self.rng = random.Random(seed)
+        self.page_cursor: Optional[str] = None
+        self.created = 0
+
+    def task_id(self) -> int:
+        return self.rng.randint(1, self.size)
+
+    def project_id(self) -> int:
+        return self.rng.randint(1, self.projects)
+
+
+async def _list_tasks_page(ctx: Context) -> int:
+    tasks, ctx.page_cursor = await ctx.db.list_tasks_page(limit=50, cursor=ctx.page_cursor)
+    return len(tasks)
+
+
+async def _create_task(ctx: Context) -> int:
+    ctx.created += 1
+    await ctx.db.create_task(f"Benchmark task {ctx.created}", due_date="2030-01-01")
+    return 1
+
+
+async def _update_task(ctx: Context) -> int:
+    task = await ctx.db.update_task(ctx.task_id(), status=ctx.rng.choice(TASK_STATUSES))
+    return 1 if task else 0
+
+
+async def _add_tags(ctx: Context) -> int:
+    task_ids = [ctx.task_id() for _ in range(10)]
+    await ctx.db.add_tags(task_ids, ctx.rng.sample(ctx.tags, 2))
+    return len(task_ids)
+
+
+async def _remove_tags(ctx: Context) -> int:
+    task_ids = [ctx.task_id() for _ in range(10)]
+    await ctx.db.remove_tags(task_ids, ctx.rng.sample(ctx.tags[:10], 2))
+    return len(task_ids)
+
+
+def _rows(result: Any) -> int:
+    """Count the rows in a method result."""
+    if isinstance(result, tuple):
+        result = result[0]
+    if isinstance(result, list):
+        return len(result)
+    return 1 if result else 0
+
+
+def _read(call: Callable[[Context], Awaitable[Any]]) -> Callable[[Context], Awaitable[int]]:
+    """Wrap a read call so the case returns its row count."""
+
+    async def run(ctx: Context) -> int:
+        return _rows(await call(ctx))
+
+    return run
+
+
+# Benchmark cases: name -> coroutine returning the number of rows read or written.
+CASES: dict[str, Callable[[Context], Awaitable[int]]] = {
+    "get_task": _read(lambda ctx: ctx.db.get_task(ctx.task_id())),
+    "get_project": _read(lambda ctx: ctx.db.get_project(ctx.project_id())),
+    "list_tasks": _read(lambda ctx: ctx.db.list_tasks(limit=50)),
+    "list_tasks_deep_offset": _read(
+        lambda ctx: ctx.db.list_tasks(limit=50, offset=ctx.rng.randint(0, ctx.size - 50))
+    ),
+    "list_tasks_page": _list_tasks_page,
+    "list_projects": _read(lambda ctx: ctx.db.list_projects()),
+    "list_tags": _read(lambda ctx: ctx.db.list_tags()),
+    "filter_status": _read(lambda ctx: ctx.db.filter_tasks(status=ctx.rng.choice(TASK_STATUSES))),
+    "filter_priority": _read(
+        lambda ctx: ctx.db.filter_tasks(priority=ctx.rng.choice(TASK_PRIORITIES))
+    ),
+    "filter_project": _read(lambda ctx: ctx.db.filter_tasks(project_id=ctx.project_id())),
+    "filter_tag_and_status": _read(
+        lambda ctx: ctx.db.filter_tasks(tag_name=ctx.rng.choice(ctx.tags[:20]), status="pending")
+    ),
+    "filter_tags_all": _read(
+        lambda ctx: ctx.db.filter_tasks(tags_all=ctx.rng.sample(ctx.tags[:20], 2))
+    ),
+    "filter_tags_any_none": _read(
+        lambda ctx: ctx.db.filter_tasks(
+            tags_any=ctx.rng.sample(ctx.tags[20:], 3), tags_none=ctx.tags[:5], status="pending"
+        )
+    ),
+    "search_common": _read(lambda ctx: ctx.db.search_tasks_page("deploy", limit=20)),
+    "search_prefix": _read(lambda ctx: ctx.db.search_tasks_page("mig*", limit=20)),
+    "search_rare": _read(
+        lambda ctx: ctx.db.search_tasks_page(ctx.rng.choice(RARE_WORDS), limit=20)
+    ),
+    "search_tag": _read(lambda ctx: ctx.db.search_tasks_page("tags:tag", limit=20)),
+    "task_statistics": _read(lambda ctx: ctx.db.get_task_statistics()),
+    "overdue_tasks": _read(lambda ctx: ctx.db.get_overdue_tasks()),
+    "due_soon_tasks": _read(lambda ctx: ctx.db.get_due_soon_tasks(72)),
+    "project_tasks": _read(lambda ctx: ctx.db.get_project_tasks(ctx.project_id())),
+    "create_task": _create_task,
+    "update_task": _update_task,
+    "add_tags": _add_tags,
+    "remove_tags": _remove_tags,
+}
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+async def run_case(
+    ctx: Context, case: Callable[[Context], Awaitable[int]], iterations: int, budget: float
+) -> dict:
+    """Time ``case`` for ``iterations`` calls, stopping early after ``budget`` seconds."""
+    await case(ctx)  # warm-up, not recorded
+    latencies = []
+    rows = 0
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        rows += await case(ctx)
+        latencies.append(time.perf_counter() - call_started)
+        if time.perf_counter() - started > budget and len(latencies) >= 5:
+            break
+
+    total = sum(latencies)
+    latencies.sort()
+    return {
+        "calls": len(latencies),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "mean_ms": round(total / len(latencies) * 1000, 3),
+        "rows": rows,
+        "rows_per_sec": round(rows / total) if total else 0,
+    }
+
+
+async def run_size(size: int, args: argparse.Namespace, cases: list[str]) -> dict:
+    """Build a database of ``size`` tasks and run every selected case on it."""
+    projects = max(1, size // 1000)
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        # The entity cache is disabled so get_task/get_project measure SQLite.
+        db = await build_database(
+            str(Path(tmp) / "bench.db"),
+            size,
+            seed=args.seed,
+            projects=projects,
+            tags=TAGS,
+            cache_size=0,
+        )
+        build_seconds = time.perf_counter() - started
+        print(f"{size} tasks: built in {build_seconds:.1f}s", file=sys.stderr)
+
+        ctx = Context(db, size, projects, args.seed)
+        results = {}
+        try:
+            for name in cases:
+                results[name] = await run_case(ctx, CASES[name], args.iterations, args.budget)
+                print(
+                    f"  {name:<24} p50 {results[name]['p50_ms']:>9.3f} ms"
+                    f"  p99 {results[name]['p99_ms']:>9.3f} ms",
+                    file=sys.stderr,
+                )
+        finally:
+            await db.close()
+    return {
+        "tasks": size,
+        "projects": projects,
+        "build_seconds": round(build_seconds, 2),
+        "cases": results,
+    }
+
+
+def compare(report: dict, baseline: dict) -> None:
+    """Print p50/p99 ratios of ``report`` against ``baseline`` (>1 is slower)."""
+    print(f"{'size':>8} {'case':<24} {'p50 x':>8} {'p99 x':>8}", file=sys.stderr)
+    for size, result in report["sizes"].items():
+        old_cases = baseline.get("sizes", {}).get(size, {}).get("cases", {})
+        for name, new in result["cases"].items():
+            old = old_cases.get(name)
+            if not old or not old["p50_ms"] or not old["p99_ms"]:
+                continue
+            print(
+                f"{size:>8} {name:<24} {new['p50_ms'] / old['p50_ms']:>8.2f}"
+                f" {new['p99_ms'] / old['p99_ms']:>8.2f}",
+                file=sys.stderr,
+            )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument(
+        "--budget", type=float, default=10.0, help="Maximum seconds spent on one case"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    parser.add_argument("--compare", help="Baseline JSON report to compare against")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    report = {
+        "meta": {
+            "version": task_tracker_mcp.__version__,
+            "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "iterations": args.iterations,
+        },
+        "sizes": {},
+    }
+    for size in args.sizes:
+        report["sizes"][str(size)] = await run_size(size, args, args.cases)
+
+    encoded = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(encoded + "\n")
+    else:
+        print(encoded)
+
+    if args.compare:
+        compare(report, json.loads(Path(args.compare).read_text()))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
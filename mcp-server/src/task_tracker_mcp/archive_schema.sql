@@ -0,0 +1,31 @@
+-- Archive tier for completed tasks. {schema} is 'main', or 'archive' when the
+-- archive lives in an attached database file.
+
+-- Archived tasks keep their IDs; tasks uses AUTOINCREMENT, so they are never reused.
+CREATE TABLE IF NOT EXISTS {schema}.tasks_archive (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT,
+    status TEXT,
+    priority TEXT,
+    project_id INTEGER,
+    due_date DATE,
+    created_at TIMESTAMP,
+    updated_at TIMESTAMP,
+    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Tag links of archived tasks; tag IDs refer to the tags table of the main database.
+CREATE TABLE IF NOT EXISTS {schema}.task_tags_archive (
+    task_id INTEGER NOT NULL,
+    tag_id INTEGER NOT NULL,
+    PRIMARY KEY (task_id, tag_id)
+) WITHOUT ROWID;
+
+-- Full-text index of archived tasks, same layout as tasks_fts.
+CREATE VIRTUAL TABLE IF NOT EXISTS {schema}.tasks_archive_fts USING fts5(
+    title,
+    description,
+    tags,
+    prefix='2 3'
+);
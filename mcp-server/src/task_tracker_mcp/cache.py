@@ -0,0 +1,125 @@
+"""In-process LRU cache for entities read through DatabaseManager."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class EntityCache:
+    """LRU cache with a per-entry TTL and hit/miss counters.
+
+    ``generation`` increases on every invalidation. Readers capture it before
+    querying the database and pass it to ``put`` so that a value read before a
+    concurrent write is never stored after that write invalidated the key.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        """Create a cache holding at most ``maxsize`` entries for ``ttl`` seconds.
+
+        A ``maxsize`` of 0 disables caching.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for ``key``, or ``None`` on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any, generation: int) -> None:
+        """Store ``value`` unless the cache was invalidated since ``generation``."""
+        if self.maxsize <= 0 or generation != self.generation:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop ``key`` from the cache."""
+        self.generation += 1
+        self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable, Any], bool]) -> None:
+        """Drop every entry for which ``predicate(key, value)`` is true."""
+        self.generation += 1
+        for key in [k for k, (_, v) in self._entries.items() if predicate(k, v)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self.generation += 1
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and occupancy."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups * 100) if lookups > 0 else 0,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+        }
+
+
+class ResourceCache:
+    """Serialized resource bodies keyed by URI and data version.
+
+    A body is served again only while ``DatabaseManager.data_version()`` returns
+    the version it was rendered at, so no invalidation is needed.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        """Create a cache holding the bodies of at most ``maxsize`` URIs."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[str, str]] = OrderedDict()
+
+    def get(self, uri: str, version: str) -> Optional[str]:
+        """Return the body cached for ``uri`` at ``version``, or ``None``."""
+        entry = self._entries.get(uri)
+        if entry is None or entry[0] != version:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(uri)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, uri: str, version: str, body: str) -> None:
+        """Store the ``body`` of ``uri`` rendered at ``version``."""
+        if self.maxsize <= 0:
+            return
+        self._entries[uri] = (version, body)
+        self._entries.move_to_end(uri)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and occupancy."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups * 100) if lookups > 0 else 0,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
@@ -0,0 +1,124 @@
+"""Command line entry point: run the MCP server or bulk import/export tasks."""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+import aiosqlite
+
+from .database import CONNECTION_PROFILES, DEFAULT_PROFILE, IMPORT_BATCH_SIZE, DatabaseManager
+from .streaming import RECORD_FORMATS
+
+
+def _resolve_format(path: str, fmt: Optional[str]) -> str:
+    """Use ``fmt`` if given, otherwise infer it from the file extension."""
+    if fmt:
+        return fmt
+    return "csv" if Path(path).suffix.lower() == ".csv" else "ndjson"
+
+
+async def _export(args: argparse.Namespace) -> None:
+    """Write every task in the database to a file or stdout."""
+    fmt = _resolve_format(args.output, args.format)
+    db = DatabaseManager(args.db, profile=args.profile)
+    await db.initialize()
+    started = time.perf_counter()
+    try:
+        if args.output == "-":
+            count = await db.export_tasks(sys.stdout, fmt)
+        else:
+            with open(args.output, "w", newline="", encoding="utf-8") as fp:
+                count = await db.export_tasks(fp, fmt)
+    finally:
+        await db.close()
+    elapsed = time.perf_counter() - started
+    print(f"Exported {count} tasks in {elapsed:.2f}s", file=sys.stderr)
+
+
+async def _import(args: argparse.Namespace) -> None:
+    """Load tasks from a file or stdin into the database."""
+    fmt = _resolve_format(args.input, args.format)
+    db = DatabaseManager(args.db, profile=args.profile)
+    await db.initialize()
+    started = time.perf_counter()
+    try:
+        if args.input == "-":
+            count = await db.import_tasks(sys.stdin, fmt, batch_size=args.batch_size)
+        else:
+            with open(args.input, newline="", encoding="utf-8") as fp:
+                count = await db.import_tasks(fp, fmt, batch_size=args.batch_size)
+    finally:
+        await db.close()
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed if elapsed else 0
+    print(f"Imported {count} tasks in {elapsed:.2f}s ({rate:,.0f} tasks/s)", file=sys.stderr)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the ``task-tracker-mcp`` argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="task-tracker-mcp",
+        description="Task tracker MCP server. Without a command, serves MCP over stdio.",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=sorted(CONNECTION_PROFILES),
+        default=os.environ.get("TASK_TRACKER_PROFILE", DEFAULT_PROFILE),
+        help="SQLite connection tuning profile (default: $TASK_TRACKER_PROFILE or durable)",
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    export = commands.add_parser("export", help="Export all tasks as NDJSON or CSV")
+    export.add_argument("output", nargs="?", default="-", help="Output file, or - for stdout")
+    export.add_argument("--db", default="tasks.db", help="Database file (default: tasks.db)")
+    export.add_argument(
+        "--format", choices=RECORD_FORMATS, help="Record format (default: from extension)"
+    )
+
+    load = commands.add_parser("import", help="Import tasks from NDJSON or CSV")
+    load.add_argument("input", help="Input file, or - for stdin")
+    load.add_argument("--db", default="tasks.db", help="Database file (default: tasks.db)")
+    load.add_argument(
+        "--format", choices=RECORD_FORMATS, help="Record format (default: from extension)"
+    )
+    load.add_argument(
+        "--batch-size",
+        type=int,
+        default=IMPORT_BATCH_SIZE,
+        help=f"Tasks per transaction (default: {IMPORT_BATCH_SIZE})",
+    )
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Run the command selected by ``argv``."""
+    args = build_parser().parse_args(argv)
+
+    if args.command is None:
+        # Imported lazily: the server module sets up its database manager on
+        # import, reading the profile from the environment.
+        os.environ["TASK_TRACKER_PROFILE"] = args.profile
+        from .server import main as serve
+
+        asyncio.run(serve())
+        return
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[logging.StreamHandler(sys.stderr)],
+    )
+    try:
+        asyncio.run(_export(args) if args.command == "export" else _import(args))
+    except (OSError, ValueError, aiosqlite.Error) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
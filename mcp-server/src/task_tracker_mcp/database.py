@@ -1,32 +1,340 @@
 """Database management for task manager MCP server."""
 
 import asyncio
+import base64
+import binascii
+import copy
+import itertools
 import json
 import logging
+import re
+import sqlite3
+import time
 from contextlib import asynccontextmanager
-from datetime import datetime
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TextIO, TypeVar
 
 import aiosqlite
 
+from .cache import EntityCache
+from .overdue import DueDateTracker
+from .profiling import QueryStats
+from .records import TASK_FIELDS, TaskRecord, task_record_factory
+from .streaming import RECORD_FORMATS, read_records, write_records
+from .tagindex import TagIndex
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# A unit of write work: runs statements on the writer connection inside a
+# transaction owned by the caller and must not commit.
+WriteOp = Callable[[aiosqlite.Connection], Awaitable[T]]
+
+# Maximum number of IDs or names bound into a single IN (...) query. Kept well
+# below SQLite's default SQLITE_MAX_VARIABLE_NUMBER.
+ID_BATCH_SIZE = 500
+
+# Fields written by export_tasks and accepted by import_tasks. Tags are exported
+# by name so files can be loaded into another database.
+EXPORT_FIELDS = (*TASK_FIELDS, "tags")
+
+# Tasks inserted per transaction by import_tasks.
+IMPORT_BATCH_SIZE = 50_000
+
+# Triggers that append to the change feed.
+CHANGE_TRIGGERS = (
+    "changes_task_insert",
+    "changes_task_update",
+    "changes_task_delete",
+    "changes_project_insert",
+    "changes_project_update",
+    "changes_project_delete",
+    "changes_task_tag_insert",
+    "changes_task_tag_delete",
+)
+
+# Triggers dropped while import_tasks loads rows; the search index and counters
+# they maintain are rebuilt in one pass afterwards and the change feed gets a
+# single reset entry. Task indexes are dropped too when loading into an empty
+# table and rebuilt with one sort each.
+BULK_LOAD_TRIGGERS = (
+    "tasks_fts_insert",
+    "tasks_fts_update",
+    "tasks_fts_delete",
+    "tasks_fts_tag_insert",
+    "tasks_fts_tag_delete",
+    "task_counters_insert",
+    "task_counters_update",
+    "task_counters_delete",
+    *CHANGE_TRIGGERS,
+)
+
+# Change feed entries older than this many hours are deleted by
+# compact_changes(), which runs at startup and then every CHANGE_COMPACT_INTERVAL
+# seconds.
+CHANGE_RETENTION_HOURS = 168.0
+CHANGE_COMPACT_INTERVAL = 3600.0
+
+# Completed tasks archived per transaction by archive_tasks(), and the pauses of
+# the background archiver between batches and, once caught up, between checks.
+ARCHIVE_BATCH_SIZE = 200
+ARCHIVE_BATCH_DELAY = 0.05
+ARCHIVE_INTERVAL = 600.0
+
+# Connection tuning profiles: DatabaseManager(profile=...). cache_size is in KiB
+# when negative, mmap_size in bytes and busy_timeout in milliseconds.
+CONNECTION_PROFILES: dict[str, dict[str, Any]] = {
+    # SQLite's defaults: rollback journal synced on every commit. Survives power loss.
+    "durable": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "cache_size": -2000,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000,
+    },
+    # WAL synced at checkpoints: a power loss may drop the latest commits but
+    # never corrupts the database.
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16000,
+        "mmap_size": 256 * 1024**2,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # WAL without syncs: safe if the process crashes, but an OS crash or power
+    # loss can corrupt the database.
+    "throughput": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -64000,
+        "mmap_size": 1024**3,
+        "temp_store": "MEMORY",
+        "busy_timeout": 10000,
+    },
+    # Journal in memory, no syncs: for scratch databases and tests only; any
+    # crash during a write can corrupt the database.
+    "ephemeral": {
+        "journal_mode": "MEMORY",
+        "synchronous": "OFF",
+        "cache_size": -64000,
+        "mmap_size": 1024**3,
+        "temp_store": "MEMORY",
+        "busy_timeout": 0,
+    },
+}
+DEFAULT_PROFILE = "durable"
+
+# Pages copied per step of the incremental backup run by snapshot(), and the
+# pause between steps that leaves CPU and disk time for concurrent tool calls.
+SNAPSHOT_PAGES_PER_STEP = 256
+SNAPSHOT_STEP_DELAY = 0.001
+
+# First bytes of every SQLite database file; snapshot() only replaces such files.
+SQLITE_HEADER = b"SQLite format 3\x00"
+
+# bm25() column weights for tasks_fts (title, description, tags).
+SEARCH_WEIGHTS = (10.0, 1.0, 5.0)
+
+# snippet() arguments: highlight markers, ellipsis and maximum tokens.
+SNIPPET_START = "**"
+SNIPPET_END = "**"
+SNIPPET_ELLIPSIS = "…"
+SNIPPET_TOKENS = 16
+
+# Allowed values of the tasks.status and tasks.priority CHECK constraints.
+TASK_STATUSES = ("pending", "in_progress", "completed", "blocked")
+TASK_PRIORITIES = ("low", "medium", "high")
+
+# Facets filter_tasks_faceted() can count, mapped to the grouped expression and
+# the joins it needs over the matched task IDs (alias m).
+FILTER_FACETS = {
+    "status": ("m.status", ""),
+    "priority": ("m.priority", ""),
+    "project": ("m.project_id", ""),
+    "tag": ("tg.name", "JOIN task_tags tt ON tt.task_id = m.id JOIN tags tg ON tg.id = tt.tag_id"),
+}
+
+# Generated columns added to databases created before they were part of
+# schema.sql. Must match the definitions in schema.sql.
+GENERATED_COLUMNS = {
+    "tasks": [
+        ("priority_rank", "INTEGER GENERATED ALWAYS AS (priority != 'high') VIRTUAL"),
+        ("due_key", "TEXT GENERATED ALWAYS AS (COALESCE(due_date, '')) VIRTUAL"),
+    ],
+}
+
+
+# DatabaseManager methods that execute_batch may call.
+BATCH_OPERATIONS = frozenset(
+    {
+        "create_project",
+        "update_project",
+        "delete_project",
+        "create_task",
+        "create_tasks",
+        "update_task",
+        "delete_task",
+        "add_tag",
+        "remove_tag",
+        "add_tags",
+        "remove_tags",
+    }
+)
+
+# execute_batch argument referring to an earlier result, e.g. "$0.id" or "$1.0.id".
+BATCH_REFERENCE = re.compile(r"^\$(\d+)((?:\.\w+)+)$")
+
+
+def _task_columns(alias: str = "") -> str:
+    """Return the public task column list, optionally qualified by ``alias``."""
+    prefix = f"{alias}." if alias else ""
+    return ", ".join(prefix + field for field in TASK_FIELDS)
+
+
+def _task_order_by(alias: str = "") -> str:
+    """Return the canonical task listing order: high priority first, then by due
+    date (undated first), with the task ID as a unique tie-breaker.
+    """
+    prefix = f"{alias}." if alias else ""
+    return f"{prefix}priority_rank, {prefix}due_key, {prefix}id"
+
+
+class _Transaction:
+    """State of an open ``DatabaseManager.transaction()`` block."""
+
+    def __init__(self):
+        self.depth = 0
+        # Side effects on in-process state (cache, due tracker, tag dictionary)
+        # deferred until the outermost transaction commits.
+        self.callbacks: list[tuple[Callable[..., None], tuple]] = []
+
 
 class DatabaseManager:
     """Manages all database operations for task management system."""
 
-    def __init__(self, db_path: str = "tasks.db"):
-        """Initialize database manager with given path."""
+    def __init__(
+        self,
+        db_path: str = "tasks.db",
+        read_pool_size: int = 0,
+        group_commit: bool = False,
+        commit_window: float = 0.002,
+        commit_batch_size: int = 64,
+        write_queue_size: int = 1024,
+        cache_size: int = 1024,
+        cache_ttl: float = 60.0,
+        profile_queries: bool = True,
+        slow_query_ms: float = 100.0,
+        change_retention_hours: float = CHANGE_RETENTION_HOURS,
+        archive_after_days: float = 0,
+        archive_path: Optional[str] = None,
+        profile: str = DEFAULT_PROFILE,
+    ):
+        """Initialize database manager with given path.
+
+        Args:
+            db_path: Path to the SQLite database file.
+            read_pool_size: Number of read-only connections to open. When greater
+                than zero the database is switched to WAL mode and reads are
+                spread across the pool while all writes go through the single
+                writer connection. ``0`` keeps the single-connection mode.
+            group_commit: Queue writes and commit them in batches instead of
+                committing every write on its own.
+            commit_window: Maximum seconds a queued write waits for others to
+                join its batch.
+            commit_batch_size: Maximum number of writes committed together.
+            write_queue_size: Maximum queued writes; further writers wait.
+            cache_size: Maximum tasks and projects kept in the read-through
+                entity cache used by ``get_task``/``get_project``. ``0``
+                disables the cache.
+            cache_ttl: Seconds a cached entity stays valid. Bounds staleness
+                when other processes write to the same database file.
+            profile_queries: Time every statement and keep per-statement
+                counters, reported by ``query_stats``.
+            slow_query_ms: Statements taking at least this long, including
+                fetching their rows, go to the slow-query log with their query
+                plan. ``0`` disables the log.
+            change_retention_hours: Hours change feed entries are kept for
+                ``changes_since``. ``0`` disables compaction.
+            archive_after_days: Move tasks completed (last updated) more than
+                this many days ago to the archive tables in the background.
+                ``0`` disables the archiver; ``archive_tasks`` still works.
+            archive_path: Database file attached to hold the archive tables.
+                ``None`` keeps them in the main database.
+            profile: Name of the ``CONNECTION_PROFILES`` entry that sets the
+                journal mode, sync level, page cache, mmap, temp store and busy
+                timeout. With a read pool the journal mode is always WAL.
+
+        Raises:
+            ValueError: If ``profile`` is not a known profile.
+        """
+        if profile not in CONNECTION_PROFILES:
+            raise ValueError(
+                f"Unknown profile {profile!r}; expected one of {sorted(CONNECTION_PROFILES)}"
+            )
         self.db_path = Path(db_path)
+        self.profile = profile
+        self.read_pool_size = read_pool_size
+        self.group_commit = group_commit
+        self.commit_window = commit_window
+        self.commit_batch_size = commit_batch_size
+        self.write_queue_size = write_queue_size
+        self.change_retention_hours = change_retention_hours
+        self.archive_after_days = archive_after_days
+        self.archive_path = Path(archive_path) if archive_path else None
+        # Schema name of the archive tables in SQL.
+        self._archive = "archive" if archive_path else "main"
         self.connection: Optional[aiosqlite.Connection] = None
+        self._readers: list[aiosqlite.Connection] = []
+        self._reader_load: list[int] = []
+        self._write_lock = asyncio.Lock()
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._background_tasks: list[asyncio.Task] = []
+        self._cache = EntityCache(maxsize=cache_size, ttl=cache_ttl)
+        self._due_tracker = DueDateTracker()
+        self._tag_index = TagIndex()
+        # Tag name -> id for tags known to exist. Filled as tags are resolved and
+        # only updated after the resolving transaction commits.
+        self._tag_ids: dict[str, int] = {}
+        self._transaction: ContextVar[Optional[_Transaction]] = ContextVar(
+            f"transaction_{id(self)}", default=None
+        )
+        # Progress of the running or most recent snapshot().
+        self._snapshot: Optional[dict] = None
+        self._query_stats = QueryStats(slow_query_ms) if profile_queries else None
+        # Commits made through this manager; PRAGMA data_version only counts
+        # commits by other connections. The epoch tells instances apart.
+        self._write_generation = 0
+        self._epoch = f"{time.time_ns():x}"
+        # Write transactions open on the writer connection. Without a read pool
+        # other tasks read through that connection and see their uncommitted rows.
+        self._open_writes = 0
 
     async def initialize(self) -> None:
         """Initialize database connection and schema."""
         try:
-            self.connection = await aiosqlite.connect(str(self.db_path))
-            self.connection.row_factory = aiosqlite.Row
+            self.connection = self._profiled(await aiosqlite.connect(str(self.db_path)))
+            if self.archive_path:
+                await self.connection.execute(
+                    "ATTACH DATABASE ? AS archive", (str(self.archive_path),)
+                )
+            await self._apply_profile(self.connection, writer=True)
             await self._create_schema()
+            await self._open_readers()
+            await self.reload_due_tracker()
+            await self.reload_tag_index()
+            if self.group_commit:
+                self._write_queue = asyncio.Queue(maxsize=self.write_queue_size)
+                self._writer_task = asyncio.create_task(self._group_commit_loop())
+            if self.change_retention_hours > 0:
+                self._background_tasks.append(asyncio.create_task(self._compaction_loop()))
+            if self.archive_after_days > 0:
+                self._background_tasks.append(asyncio.create_task(self._archive_loop()))
             logger.info(f"Database initialized at {self.db_path}")
         except Exception as e:
             logger.error(f"Failed to initialize database: {e}")
@@ -34,10 +342,71 @@ class DatabaseManager:
 
     async def close(self) -> None:
         """Close database connection."""
+        for task in self._background_tasks:
+            task.cancel()
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        self._background_tasks = []
+        if self._writer_task:
+            # Drain queued writes before closing the writer connection.
+            await self._write_queue.put(None)
+            await self._writer_task
+            self._writer_task = None
+            self._write_queue = None
+        for reader in self._readers:
+            await reader.close()
+        self._readers = []
+        self._reader_load = []
         if self.connection:
             await self.connection.close()
             logger.info("Database connection closed")
 
+    async def _open_readers(self) -> None:
+        """Open the read-only connection pool (pooled mode only)."""
+        uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+        for _ in range(self.read_pool_size):
+            reader = self._profiled(await aiosqlite.connect(uri, uri=True))
+            if self.archive_path:
+                await reader.execute(
+                    "ATTACH DATABASE ? AS archive",
+                    (f"{self.archive_path.resolve().as_uri()}?mode=ro",),
+                )
+            await self._apply_profile(reader, writer=False)
+            self._readers.append(reader)
+            self._reader_load.append(0)
+        if self._readers:
+            logger.info(f"Opened {len(self._readers)} read-only connections")
+
+    async def _apply_profile(self, conn: aiosqlite.Connection, writer: bool) -> None:
+        """Apply the connection profile's PRAGMAs to ``conn``.
+
+        The journal mode is a property of the database file and is only set
+        from the writer; readers need WAL, so a read pool forces it.
+        """
+        settings = CONNECTION_PROFILES[self.profile]
+        journal_mode = "WAL" if self.read_pool_size > 0 else settings["journal_mode"]
+        for schema in ("main", "archive") if self.archive_path else ("main",):
+            if writer:
+                # Leaving WAL needs exclusive access; keep the current mode if
+                # another connection has the file open.
+                try:
+                    cursor = await conn.execute(f"PRAGMA {schema}.journal_mode = {journal_mode}")
+                    (mode,) = await cursor.fetchone()
+                except sqlite3.OperationalError as e:
+                    mode = str(e)
+                if mode.upper() != journal_mode:
+                    logger.warning(f"{schema} database not switched to {journal_mode}: {mode}")
+            for name in ("synchronous", "cache_size", "mmap_size"):
+                await conn.execute(f"PRAGMA {schema}.{name} = {settings[name]}")
+        await conn.execute(f"PRAGMA temp_store = {settings['temp_store']}")
+        await conn.execute(f"PRAGMA busy_timeout = {settings['busy_timeout']}")
+
+    def _profiled(self, conn: aiosqlite.Connection) -> aiosqlite.Connection:
+        """Set up a new connection, instrumenting it when profiling is enabled."""
+        conn.row_factory = aiosqlite.Row
+        if self._query_stats is None:
+            return conn
+        return self._query_stats.wrap(conn)
+
     async def _create_schema(self) -> None:
         """Create database schema from schema.sql."""
         schema_path = Path(__file__).parent / "schema.sql"
@@ -48,10 +417,75 @@ class DatabaseManager:
         with open(schema_path) as f:
             schema = f.read()
 
+        # An interrupted import_tasks leaves its triggers dropped; schema.sql
+        # recreates them, but the data they maintain must be rebuilt.
+        interrupted_import = await self._bulk_load_interrupted()
+        needs_search_rebuild = await self._migrate_schema()
         await self.connection.executescript(schema)
+        archive_schema = (Path(__file__).parent / "archive_schema.sql").read_text()
+        await self.connection.executescript(archive_schema.replace("{schema}", self._archive))
         await self.connection.commit()
+
+        if needs_search_rebuild or interrupted_import:
+            await self.rebuild_search_index()
+        if interrupted_import:
+            await self._run_write(self._record_reset)
+
+        cursor = await self.connection.execute("SELECT COUNT(*) FROM task_counters")
+        if interrupted_import or (await cursor.fetchone())[0] == 0:
+            await self.rebuild_task_counters()
         logger.info("Database schema created/verified")
 
+    async def _bulk_load_interrupted(self) -> bool:
+        """Return True if an existing database is missing bulk-load triggers."""
+        # Databases created before the change feed never had its triggers.
+        triggers = [name for name in BULK_LOAD_TRIGGERS if name not in CHANGE_TRIGGERS]
+        placeholders = ", ".join("?" * len(triggers))
+        cursor = await self.connection.execute(
+            f"""SELECT
+                EXISTS (SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks'),
+                (SELECT COUNT(*) FROM sqlite_master
+                 WHERE type = 'trigger' AND name IN ({placeholders}))""",
+            triggers,
+        )
+        has_tasks, existing = await cursor.fetchone()
+        return bool(has_tasks) and existing < len(triggers)
+
+    async def _migrate_schema(self) -> bool:
+        """Upgrade objects created by older versions of schema.sql.
+
+        Runs before schema.sql so that its indexes can reference new columns and
+        it can recreate replaced objects.
+
+        Returns:
+            True if the search index was replaced and must be repopulated.
+        """
+        for table, columns in GENERATED_COLUMNS.items():
+            cursor = await self.connection.execute(f"PRAGMA table_xinfo({table})")
+            existing = {row["name"] for row in await cursor.fetchall()}
+            if not existing:
+                continue
+            for name, definition in columns:
+                if name not in existing:
+                    await self.connection.execute(
+                        f"ALTER TABLE {table} ADD COLUMN {name} {definition}"
+                    )
+                    logger.info(f"Added column {table}.{name}")
+
+        # tasks_fts used to be an external-content index over (title, description)
+        # without tag names or prefix indexes.
+        cursor = await self.connection.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'tasks_fts'"
+        )
+        row = await cursor.fetchone()
+        if row is None or "tags" in row["sql"]:
+            return False
+        for trigger in ("tasks_fts_insert", "tasks_fts_update", "tasks_fts_delete"):
+            await self.connection.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        await self.connection.execute("DROP TABLE tasks_fts")
+        logger.info("Dropped old tasks_fts search index")
+        return True
+
     @asynccontextmanager
     async def _get_connection(self):
         """Context manager for database operations."""
@@ -59,38 +493,272 @@ class DatabaseManager:
             await self.initialize()
         yield self.connection
 
+    @asynccontextmanager
+    async def _get_read_connection(self):
+        """Context manager for read-only database operations.
+
+        Hands out the least busy reader from the pool, or the writer connection
+        when pooling is disabled.
+        """
+        if not self.connection:
+            await self.initialize()
+        if not self._readers or self._transaction.get() is not None:
+            # Inside a transaction reads must see its uncommitted writes.
+            yield self.connection
+            return
+
+        index = min(range(len(self._readers)), key=self._reader_load.__getitem__)
+        self._reader_load[index] += 1
+        try:
+            yield self._readers[index]
+        finally:
+            self._reader_load[index] -= 1
+
+    async def _run_write(self, op: WriteOp[T]) -> T:
+        """Run ``op`` on the writer connection in its own transaction.
+
+        Writes are serialized so concurrent callers never share a transaction.
+        With group commit enabled the op is queued and committed together with
+        other writes that arrive in the same window. Inside ``transaction()``
+        the op joins the open transaction under its own savepoint instead.
+        """
+        tx = self._transaction.get()
+        if tx is not None:
+            async with self._savepoint(tx):
+                return await op(self.connection)
+
+        async with self._get_connection() as conn:
+            if self._write_queue is not None:
+                future = asyncio.get_running_loop().create_future()
+                await self._write_queue.put((op, future))
+                return await future
+
+            async with self._write_lock:
+                self._open_writes += 1
+                try:
+                    await conn.execute("BEGIN IMMEDIATE")
+                    result = await op(conn)
+                    await conn.commit()
+                    self._write_generation += 1
+                except BaseException:
+                    await conn.rollback()
+                    self._rolled_back()
+                    raise
+                finally:
+                    self._open_writes -= 1
+                return result
+
+    @asynccontextmanager
+    async def transaction(self):
+        """Group several operations into one atomic unit of work.
+
+        Write methods called inside the block join its transaction instead of
+        committing on their own, and reads see its uncommitted changes. Nested
+        ``transaction()`` blocks become savepoints, so an exception escaping a
+        nested block rolls back only that block. Cache, due-date, tag dictionary
+        and tag index updates are applied once the outermost block commits.
+
+        Other writers wait until the outermost block exits, so keep it short
+        and run its operations from the task that opened it.
+        """
+        tx = self._transaction.get()
+        if tx is not None:
+            async with self._savepoint(tx):
+                yield self
+            return
+
+        tx = _Transaction()
+        async with self._get_connection() as conn:
+            async with self._write_lock:
+                token = self._transaction.set(tx)
+                self._open_writes += 1
+                try:
+                    await conn.execute("BEGIN IMMEDIATE")
+                    try:
+                        yield self
+                        await conn.commit()
+                        self._write_generation += 1
+                    except BaseException:
+                        await conn.rollback()
+                        self._rolled_back()
+                        raise
+                finally:
+                    self._open_writes -= 1
+                    self._transaction.reset(token)
+
+        for callback, args in tx.callbacks:
+            callback(*args)
+
+    @asynccontextmanager
+    async def _savepoint(self, tx: _Transaction):
+        """Run a block of ``tx`` under a savepoint that is undone if it raises."""
+        tx.depth += 1
+        name = f"transaction_{tx.depth}"
+        mark = len(tx.callbacks)
+        await self.connection.execute(f"SAVEPOINT {name}")
+        try:
+            yield
+        except BaseException:
+            await self.connection.execute(f"ROLLBACK TO {name}")
+            await self.connection.execute(f"RELEASE {name}")
+            del tx.callbacks[mark:]
+            self._rolled_back()
+            raise
+        else:
+            await self.connection.execute(f"RELEASE {name}")
+        finally:
+            tx.depth -= 1
+
+    def _rolled_back(self) -> None:
+        """Drop cached state that may hold rows of a rolled-back write.
+
+        Clearing the entity cache also rejects puts of values read before
+        this point. Advancing the write generation changes ``data_version()``,
+        so resources rendered from those rows are never served.
+        """
+        self._cache.clear()
+        self._write_generation += 1
+
+    def _may_read_uncommitted(self) -> bool:
+        """Whether reads outside a transaction may see another write's rows."""
+        return self._open_writes > 0 and not self._readers
+
+    def _after_commit(self, callback: Callable[..., None], *args: Any) -> None:
+        """Call ``callback(*args)`` once the current write is committed.
+
+        Outside ``transaction()`` writes are already committed when this runs,
+        so the callback is invoked immediately.
+        """
+        tx = self._transaction.get()
+        if tx is None:
+            callback(*args)
+        else:
+            tx.callbacks.append((callback, args))
+
+    async def _group_commit_loop(self) -> None:
+        """Collect queued writes into batches and commit each batch once."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._write_queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            deadline = loop.time() + self.commit_window
+            while len(batch) < self.commit_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._write_queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._commit_batch(batch)
+
+    async def _commit_batch(self, batch: list[tuple[WriteOp, asyncio.Future]]) -> None:
+        """Run a batch of write ops in one transaction.
+
+        Each op runs under its own savepoint, so a failing op is rolled back
+        and reported to its caller without affecting the rest of the batch.
+        """
+        conn = self.connection
+        outcomes = []
+        try:
+            async with self._write_lock:
+                self._open_writes += 1
+                try:
+                    await conn.execute("BEGIN IMMEDIATE")
+                    for op, future in batch:
+                        if future.cancelled():
+                            continue
+                        await conn.execute("SAVEPOINT group_commit_op")
+                        try:
+                            result = await op(conn)
+                        except Exception as e:
+                            await conn.execute("ROLLBACK TO group_commit_op")
+                            await conn.execute("RELEASE group_commit_op")
+                            self._rolled_back()
+                            outcomes.append((future, None, e))
+                        else:
+                            await conn.execute("RELEASE group_commit_op")
+                            outcomes.append((future, result, None))
+                    await conn.commit()
+                    self._write_generation += 1
+                except BaseException:
+                    await conn.rollback()
+                    self._rolled_back()
+                    raise
+                finally:
+                    self._open_writes -= 1
+        except Exception as e:
+            logger.error(f"Group commit of {len(batch)} writes failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, result, error in outcomes:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
     # ==================== PROJECT OPERATIONS ====================
 
     async def create_project(self, name: str, description: str = "") -> dict:
         """Create a new project."""
-        try:
-            async with self._get_connection() as conn:
-                cursor = await conn.execute(
-                    "INSERT INTO projects (name, description) VALUES (?, ?)",
-                    (name, description),
-                )
-                await conn.commit()
-                project_id = cursor.lastrowid
 
-                # Fetch and return the created project
-                cursor = await conn.execute(
-                    "SELECT * FROM projects WHERE id = ?", (project_id,)
-                )
-                row = await cursor.fetchone()
-                return self._row_to_dict(row)
+        async def op(conn: aiosqlite.Connection) -> dict:
+            cursor = await conn.execute(
+                "INSERT INTO projects (name, description) VALUES (?, ?)",
+                (name, description),
+            )
+            project_id = cursor.lastrowid
+
+            # Fetch and return the created project
+            cursor = await conn.execute(
+                "SELECT * FROM projects WHERE id = ?", (project_id,)
+            )
+            row = await cursor.fetchone()
+            return self._row_to_dict(row)
+
+        try:
+            return await self._run_write(op)
         except Exception as e:
             logger.error(f"Failed to create project: {e}")
             raise
 
     async def get_project(self, project_id: int) -> Optional[dict]:
         """Get project by ID."""
+        key = ("project", project_id)
+        # Inside a transaction the cache would miss uncommitted changes.
+        use_cache = self._transaction.get() is None
+        cached = self._cache.get(key) if use_cache else None
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        generation = self._cache.generation
         try:
-            async with self._get_connection() as conn:
+            async with self._get_read_connection() as conn:
                 cursor = await conn.execute(
                     "SELECT * FROM projects WHERE id = ?", (project_id,)
                 )
                 row = await cursor.fetchone()
-                return self._row_to_dict(row) if row else None
+                if not row:
+                    return None
+
+                project = self._row_to_dict(row)
+                if use_cache and not self._may_read_uncommitted():
+                    self._cache.put(key, copy.deepcopy(project), generation)
+                return project
         except Exception as e:
             logger.error(f"Failed to get project: {e}")
             return None
@@ -98,7 +766,7 @@ class DatabaseManager:
     async def list_projects(self) -> list[dict]:
         """List all projects."""
         try:
-            async with self._get_connection() as conn:
+            async with self._get_read_connection() as conn:
                 cursor = await conn.execute(
                     "SELECT * FROM projects ORDER BY name"
                 )
@@ -120,12 +788,13 @@ class DatabaseManager:
             set_clause = ", ".join([f"{k} = ?" for k in update_fields.keys()])
             values = list(update_fields.values()) + [project_id]
 
-            async with self._get_connection() as conn:
-                await conn.execute(
+            await self._run_write(
+                lambda conn: conn.execute(
                     f"UPDATE projects SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
                     values,
                 )
-                await conn.commit()
+            )
+            self._after_commit(self._cache.invalidate, ("project", project_id))
 
             return await self.get_project(project_id)
         except Exception as e:
@@ -135,10 +804,16 @@ class DatabaseManager:
     async def delete_project(self, project_id: int) -> bool:
         """Delete a project."""
         try:
-            async with self._get_connection() as conn:
-                await conn.execute("DELETE FROM projects WHERE id = ?", (project_id,))
-                await conn.commit()
-                return True
+            await self._run_write(
+                lambda conn: conn.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+            )
+            # ON DELETE SET NULL may have detached this project's tasks.
+            self._after_commit(self._cache.invalidate, ("project", project_id))
+            self._after_commit(
+                self._cache.invalidate_where,
+                lambda key, value: key[0] == "task" and value["project_id"] == project_id,
+            )
+            return True
         except Exception as e:
             logger.error(f"Failed to delete project: {e}")
             return False
@@ -155,80 +830,226 @@ class DatabaseManager:
         due_date: Optional[str] = None,
     ) -> dict:
         """Create a new task."""
+
+        async def op(conn: aiosqlite.Connection) -> int:
+            cursor = await conn.execute(
+                """INSERT INTO tasks
+                (title, description, priority, status, project_id, due_date)
+                VALUES (?, ?, ?, ?, ?, ?)""",
+                (title, description, priority, status, project_id, due_date),
+            )
+            return cursor.lastrowid
+
         try:
-            async with self._get_connection() as conn:
-                cursor = await conn.execute(
-                    """INSERT INTO tasks
-                    (title, description, priority, status, project_id, due_date)
-                    VALUES (?, ?, ?, ?, ?, ?)""",
-                    (title, description, priority, status, project_id, due_date),
+            task_id = await self._run_write(op)
+            task = await self.get_task(task_id)
+            self._after_commit(self._track_due, task)
+            return task
+        except Exception as e:
+            logger.error(f"Failed to create task: {e}")
+            raise
+
+    async def create_tasks(self, tasks: list[dict]) -> list[dict]:
+        """Create many tasks in a single transaction.
+
+        Each item accepts the same fields as ``create_task`` plus an optional
+        ``tags`` list of tag names. Rows are inserted with ``executemany`` and
+        the created tasks are returned, with tags, in input order.
+        """
+        if not tasks:
+            return []
+
+        rows = []
+        for item in tasks:
+            if not item.get("title"):
+                raise ValueError("Every task requires a title")
+            rows.append(
+                (
+                    item["title"],
+                    item.get("description", ""),
+                    item.get("priority", "medium"),
+                    item.get("status", "pending"),
+                    item.get("project_id"),
+                    item.get("due_date"),
                 )
-                await conn.commit()
-                task_id = cursor.lastrowid
+            )
+
+        resolved: dict[str, int] = {}
+        links: list[tuple[int, str]] = []
+
+        async def op(conn: aiosqlite.Connection) -> list[dict]:
+            # IDs are assigned explicitly from the AUTOINCREMENT sequence so the
+            # created rows can be read back as one contiguous range.
+            cursor = await conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'tasks'")
+            seq_row = await cursor.fetchone()
+            first_id = (seq_row[0] if seq_row else 0) + 1
+            last_id = first_id + len(rows) - 1
+
+            await conn.executemany(
+                """INSERT INTO tasks
+                (id, title, description, priority, status, project_id, due_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                [(first_id + i, *row) for i, row in enumerate(rows)],
+            )
+
+            links[:] = [
+                (first_id + i, tag_name)
+                for i, item in enumerate(tasks)
+                for tag_name in item.get("tags") or []
+            ]
+            if links:
+                resolved.update(await self._insert_tag_links(conn, links))
+
+            cursor = await conn.execute(
+                f"SELECT {_task_columns()} FROM tasks WHERE id BETWEEN ? AND ? ORDER BY id",
+                (first_id, last_id),
+            )
+            return await self._hydrate_tags(conn, await cursor.fetchall())
 
-                return await self.get_task(task_id)
+        try:
+            created = await self._run_write(op)
+            self._after_commit(self._tag_ids.update, resolved)
+            for tag_name in dict.fromkeys(tag_name for _, tag_name in links):
+                task_ids = [task_id for task_id, name in links if name == tag_name]
+                self._after_commit(self._tag_index.add, tag_name, task_ids)
+            for task in created:
+                self._after_commit(self._track_due, task)
+            return created
         except Exception as e:
-            logger.error(f"Failed to create task: {e}")
+            logger.error(f"Failed to create tasks: {e}")
             raise
 
-    async def get_task(self, task_id: int) -> Optional[dict]:
-        """Get task by ID with tags."""
+    async def get_task(self, task_id: int, include_archived: bool = False) -> Optional[dict]:
+        """Get task by ID with tags.
+
+        Args:
+            task_id: ID of the task.
+            include_archived: Also look in the archive if the task is not
+                active. Archived tasks carry an ``archived_at`` field.
+        """
+        key = ("task", task_id)
+        # Inside a transaction the cache would miss uncommitted changes.
+        use_cache = self._transaction.get() is None
+        cached = self._cache.get(key) if use_cache else None
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        generation = self._cache.generation
         try:
-            async with self._get_connection() as conn:
+            async with self._get_read_connection() as conn:
                 # Get task
                 cursor = await conn.execute(
-                    "SELECT * FROM tasks WHERE id = ?", (task_id,)
+                    f"SELECT {_task_columns()} FROM tasks WHERE id = ?", (task_id,)
                 )
                 row = await cursor.fetchone()
                 if not row:
+                    if include_archived:
+                        return await self._get_archived_task(conn, task_id)
                     return None
 
-                task = self._row_to_dict(row)
-
-                # Get tags
-                cursor = await conn.execute(
-                    """SELECT t.id, t.name FROM tags t
-                    JOIN task_tags tt ON t.id = tt.tag_id
-                    WHERE tt.task_id = ?""",
-                    (task_id,),
-                )
-                tags = [dict(tag) for tag in await cursor.fetchall()]
-                task["tags"] = tags
-
+                task = (await self._hydrate_tags(conn, [row]))[0]
+                if use_cache and not self._may_read_uncommitted():
+                    self._cache.put(key, copy.deepcopy(task), generation)
                 return task
         except Exception as e:
             logger.error(f"Failed to get task: {e}")
             return None
 
     async def list_tasks(self, limit: int = 100, offset: int = 0) -> list[dict]:
-        """List all tasks with pagination."""
+        """List all tasks with pagination.
+
+        Offset pagination walks every skipped row; prefer ``list_tasks_page``
+        for deep pages.
+        """
         try:
-            async with self._get_connection() as conn:
+            async with self._get_read_connection() as conn:
                 cursor = await conn.execute(
-                    """SELECT * FROM tasks
-                    ORDER BY priority = 'high' DESC, due_date ASC
+                    f"""SELECT {_task_columns()} FROM tasks
+                    ORDER BY {_task_order_by()}
                     LIMIT ? OFFSET ?""",
                     (limit, offset),
                 )
                 rows = await cursor.fetchall()
-                tasks = []
-                for row in rows:
-                    task = self._row_to_dict(row)
-                    # Get tags for each task
-                    tags_cursor = await conn.execute(
-                        """SELECT t.id, t.name FROM tags t
-                        JOIN task_tags tt ON t.id = tt.tag_id
-                        WHERE tt.task_id = ?""",
-                        (task["id"],),
-                    )
-                    tags = [dict(tag) for tag in await tags_cursor.fetchall()]
-                    task["tags"] = tags
-                    tasks.append(task)
-                return tasks
+                return await self._hydrate_tags(conn, rows)
         except Exception as e:
             logger.error(f"Failed to list tasks: {e}")
             return []
 
+    async def list_tasks_page(
+        self, limit: int = 100, cursor: Optional[str] = None, records: bool = False
+    ) -> tuple[list[dict], Optional[str]]:
+        """List tasks using keyset (cursor) pagination.
+
+        Pages follow the same order as ``list_tasks`` and seek directly to the
+        ``(priority_rank, due_key, id)`` position encoded in ``cursor``, so every
+        page costs the same regardless of depth. With ``records`` the tasks are
+        returned as ``TaskRecord`` tuples instead of dicts.
+
+        Returns:
+            The page of tasks and an opaque cursor for the next page, or ``None``
+            when there are no more tasks.
+
+        Raises:
+            ValueError: If ``limit`` is less than 1 or ``cursor`` is not a cursor
+                returned by this method.
+        """
+        if limit < 1:
+            raise ValueError(f"limit must be at least 1, got {limit}")
+        if cursor:
+            # SQLite seeks a row-value comparison only on its leading
+            # (priority_rank, due_key) pair, then walks the rest of that tie
+            # group. Each branch here seeks on a full index prefix instead; the
+            # branches are disjoint and in listing order, so UNION ALL keeps it.
+            rank, due_key, task_id = self._decode_cursor(cursor)
+            branches = [
+                ("priority_rank = ? AND due_key = ? AND id > ?", (rank, due_key, task_id)),
+                ("priority_rank = ? AND due_key > ?", (rank, due_key)),
+                ("priority_rank > ?", (rank,)),
+            ]
+        else:
+            branches = [("1=1", ())]
+        sql = " UNION ALL ".join(
+            f"""SELECT * FROM (SELECT {_task_columns()} FROM tasks WHERE {where}
+            ORDER BY {_task_order_by()} LIMIT ?)"""
+            for where, _ in branches
+        )
+        params = [value for _, values in branches for value in (*values, limit + 1)]
+
+        try:
+            async with self._get_read_connection() as conn:
+                db_cursor = await conn.execute(f"{sql} LIMIT ?", (*params, limit + 1))
+                if records:
+                    db_cursor.row_factory = task_record_factory
+                rows = await db_cursor.fetchall()
+                tasks = await self._hydrate_tags(conn, rows[:limit])
+        except Exception as e:
+            logger.error(f"Failed to list tasks page: {e}")
+            return [], None
+
+        next_cursor = self._encode_cursor(tasks[-1]) if tasks and len(rows) > limit else None
+        return tasks, next_cursor
+
+    async def iter_tasks(self, batch_size: int = 500) -> AsyncIterator[dict]:
+        """Iterate over all tasks in listing order without loading them all.
+
+        Rows are pulled from a single cursor with ``fetchmany(batch_size)`` and
+        tags are hydrated per batch, so memory stays proportional to
+        ``batch_size`` rather than to the number of tasks.
+        """
+        async with self._get_read_connection() as conn:
+            cursor = await conn.execute(
+                f"SELECT {_task_columns()} FROM tasks ORDER BY {_task_order_by()}"
+            )
+            try:
+                while True:
+                    rows = await cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for task in await self._hydrate_tags(conn, rows):
+                        yield task
+            finally:
+                await cursor.close()
+
     async def update_task(self, task_id: int, **kwargs) -> Optional[dict]:
         """Update task fields."""
         try:
@@ -241,14 +1062,20 @@ class DatabaseManager:
             set_clause = ", ".join([f"{k} = ?" for k in update_fields.keys()])
             values = list(update_fields.values()) + [task_id]
 
-            async with self._get_connection() as conn:
-                await conn.execute(
+            await self._run_write(
+                lambda conn: conn.execute(
                     f"UPDATE tasks SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
                     values,
                 )
-                await conn.commit()
-
-            return await self.get_task(task_id)
+            )
+            self._after_commit(self._cache.invalidate, ("task", task_id))
+
+            task = await self.get_task(task_id)
+            if task:
+                self._after_commit(self._track_due, task)
+            else:
+                self._after_commit(self._due_tracker.discard, task_id)
+            return task
         except Exception as e:
             logger.error(f"Failed to update task: {e}")
             return None
@@ -256,10 +1083,13 @@ class DatabaseManager:
     async def delete_task(self, task_id: int) -> bool:
         """Delete a task."""
         try:
-            async with self._get_connection() as conn:
-                await conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-                await conn.commit()
-                return True
+            await self._run_write(
+                lambda conn: conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+            )
+            self._after_commit(self._cache.invalidate, ("task", task_id))
+            self._after_commit(self._due_tracker.discard, task_id)
+            self._after_commit(self._tag_index.discard_tasks, [task_id])
+            return True
         except Exception as e:
             logger.error(f"Failed to delete task: {e}")
             return False
@@ -269,29 +1099,8 @@ class DatabaseManager:
     async def add_tag(self, task_id: int, tag_name: str) -> bool:
         """Add a tag to a task."""
         try:
-            async with self._get_connection() as conn:
-                # Get or create tag
-                cursor = await conn.execute(
-                    "SELECT id FROM tags WHERE name = ?", (tag_name,)
-                )
-                tag = await cursor.fetchone()
-
-                if not tag:
-                    cursor = await conn.execute(
-                        "INSERT INTO tags (name) VALUES (?)", (tag_name,)
-                    )
-                    await conn.commit()
-                    tag_id = cursor.lastrowid
-                else:
-                    tag_id = tag["id"]
-
-                # Add to task
-                await conn.execute(
-                    "INSERT OR IGNORE INTO task_tags (task_id, tag_id) VALUES (?, ?)",
-                    (task_id, tag_id),
-                )
-                await conn.commit()
-                return True
+            await self.add_tags([task_id], [tag_name])
+            return True
         except Exception as e:
             logger.error(f"Failed to add tag: {e}")
             return False
@@ -299,29 +1108,82 @@ class DatabaseManager:
     async def remove_tag(self, task_id: int, tag_name: str) -> bool:
         """Remove a tag from a task."""
         try:
-            async with self._get_connection() as conn:
-                cursor = await conn.execute(
-                    "SELECT id FROM tags WHERE name = ?", (tag_name,)
-                )
-                tag = await cursor.fetchone()
-
-                if not tag:
-                    return False
-
-                await conn.execute(
-                    "DELETE FROM task_tags WHERE task_id = ? AND tag_id = ?",
-                    (task_id, tag["id"]),
-                )
-                await conn.commit()
-                return True
+            removed = await self.remove_tags([task_id], [tag_name])
+            return removed is not None
         except Exception as e:
             logger.error(f"Failed to remove tag: {e}")
             return False
 
+    async def add_tags(self, task_ids: list[int], tag_names: list[str]) -> int:
+        """Add every tag in ``tag_names`` to every task in ``task_ids``.
+
+        Tag names are resolved through the in-process tag dictionary; missing
+        tags are created with one multi-row upsert and all links are written with
+        one ``executemany`` in a single transaction.
+
+        Returns:
+            The number of links that did not exist before.
+        """
+        if not task_ids or not tag_names:
+            return 0
+        resolved: dict[str, int] = {}
+
+        async def op(conn: aiosqlite.Connection) -> int:
+            resolved.update(await self._resolve_tag_ids(conn, tag_names, create=True))
+            cursor = await conn.executemany(
+                "INSERT OR IGNORE INTO task_tags (task_id, tag_id) VALUES (?, ?)",
+                [(task_id, resolved[name]) for task_id in task_ids for name in tag_names],
+            )
+            return cursor.rowcount
+
+        try:
+            added = await self._run_write(op)
+            self._after_commit(self._tag_ids.update, resolved)
+            for tag_name in tag_names:
+                self._after_commit(self._tag_index.add, tag_name, task_ids)
+            for task_id in task_ids:
+                self._after_commit(self._cache.invalidate, ("task", task_id))
+            return added
+        except Exception as e:
+            logger.error(f"Failed to add tags: {e}")
+            raise
+
+    async def remove_tags(self, task_ids: list[int], tag_names: list[str]) -> Optional[int]:
+        """Remove every tag in ``tag_names`` from every task in ``task_ids``.
+
+        Returns:
+            The number of links removed, or ``None`` if none of the tags exist.
+        """
+        if not task_ids or not tag_names:
+            return 0
+        resolved: dict[str, int] = {}
+
+        async def op(conn: aiosqlite.Connection) -> Optional[int]:
+            resolved.update(await self._resolve_tag_ids(conn, tag_names, create=False))
+            if not resolved:
+                return None
+            cursor = await conn.executemany(
+                "DELETE FROM task_tags WHERE task_id = ? AND tag_id = ?",
+                [(task_id, tag_id) for task_id in task_ids for tag_id in resolved.values()],
+            )
+            return cursor.rowcount
+
+        try:
+            removed = await self._run_write(op)
+            self._after_commit(self._tag_ids.update, resolved)
+            for tag_name in resolved:
+                self._after_commit(self._tag_index.remove, tag_name, task_ids)
+            for task_id in task_ids:
+                self._after_commit(self._cache.invalidate, ("task", task_id))
+            return removed
+        except Exception as e:
+            logger.error(f"Failed to remove tags: {e}")
+            raise
+
     async def list_tags(self) -> list[dict]:
         """List all tags."""
         try:
-            async with self._get_connection() as conn:
+            async with self._get_read_connection() as conn:
                 cursor = await conn.execute("SELECT * FROM tags ORDER BY name")
                 rows = await cursor.fetchall()
                 return [self._row_to_dict(row) for row in rows]
@@ -331,145 +1193,430 @@ class DatabaseManager:
 
     # ==================== SEARCH OPERATIONS ====================
 
-    async def search_tasks(self, query: str) -> list[dict]:
-        """Search tasks using full-text search."""
+    async def search_tasks(
+        self, query: str, limit: int = 50, include_archived: bool = False
+    ) -> list[dict]:
+        """Search tasks using full-text search.
+
+        Returns the ``limit`` best matches; see ``search_tasks_page``.
+        """
+        tasks, _ = await self.search_tasks_page(
+            query, limit=limit, include_archived=include_archived
+        )
+        return tasks
+
+    async def search_tasks_page(
+        self,
+        query: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_archived: bool = False,
+    ) -> tuple[list[dict], Optional[str]]:
+        """Search tasks using full-text search, one ranked page at a time.
+
+        Title, description and tag names are searched. Matches are ordered by
+        ``bm25()`` with ``SEARCH_WEIGHTS``, ties broken by task ID. Each result
+        carries a highlighted ``snippet`` and its ``score`` (lower is better)
+        instead of the full description. With ``include_archived`` the archive
+        index is searched too and every result carries ``archived_at`` (None
+        for active tasks).
+
+        Returns:
+            The page of matches and an opaque cursor for the next page, or
+            ``None`` when there are no more matches.
+
+        Raises:
+            ValueError: If ``limit`` is less than 1 or ``cursor`` is not a cursor
+                returned by this method.
+        """
+        if limit < 1:
+            raise ValueError(f"limit must be at least 1, got {limit}")
+        # bm25() has to score every match before the first page can be cut, and
+        # scores shift as the corpus changes, so the cursor is a plain offset.
+        offset = self._decode_search_cursor(cursor) if cursor else 0
+        match_params = (SNIPPET_START, SNIPPET_END, SNIPPET_ELLIPSIS, SNIPPET_TOKENS, query)
+        if include_archived:
+            # bm25() scores of the two indexes are computed over different
+            # corpora but are close enough to interleave the results.
+            sql = f"""SELECT * FROM (
+                {self._search_select("tasks_fts", "tasks", archived_at="NULL")}
+                UNION ALL
+                {self._search_select(
+                    "tasks_archive_fts", "tasks_archive", self._archive, "t.archived_at"
+                )}
+            ) ORDER BY score, id LIMIT ? OFFSET ?"""
+            params = (*match_params, *match_params, limit + 1, offset)
+        else:
+            sql = f"""{self._search_select("tasks_fts", "tasks")}
+                ORDER BY score, t.id LIMIT ? OFFSET ?"""
+            params = (*match_params, limit + 1, offset)
         try:
-            async with self._get_connection() as conn:
-                cursor = await conn.execute(
-                    """SELECT t.* FROM tasks t
-                    JOIN tasks_fts f ON t.id = f.rowid
-                    WHERE tasks_fts MATCH ?
-                    ORDER BY rank""",
-                    (query,),
-                )
-                rows = await cursor.fetchall()
-                tasks = []
-                for row in rows:
-                    task = self._row_to_dict(row)
-                    tags_cursor = await conn.execute(
-                        """SELECT t.id, t.name FROM tags t
-                        JOIN task_tags tt ON t.id = tt.tag_id
-                        WHERE tt.task_id = ?""",
-                        (task["id"],),
-                    )
-                    tags = [dict(tag) for tag in await tags_cursor.fetchall()]
-                    task["tags"] = tags
-                    tasks.append(task)
-                return tasks
+            async with self._get_read_connection() as conn:
+                db_cursor = await conn.execute(sql, params)
+                rows = await db_cursor.fetchall()
+                if include_archived:
+                    tasks = await self._hydrate_mixed_tags(conn, rows[:limit])
+                else:
+                    tasks = await self._hydrate_tags(conn, rows[:limit])
         except Exception as e:
             logger.error(f"Failed to search tasks: {e}")
-            return []
+            return [], None
 
-    async def filter_tasks(self, **filters) -> list[dict]:
-        """Filter tasks by various criteria."""
-        try:
-            async with self._get_connection() as conn:
-                query = "SELECT * FROM tasks WHERE 1=1"
-                params = []
+        next_cursor = self._encode_search_cursor(offset + limit) if len(rows) > limit else None
+        return tasks, next_cursor
 
-                if "status" in filters:
-                    query += " AND status = ?"
-                    params.append(filters["status"])
-
-                if "priority" in filters:
-                    query += " AND priority = ?"
-                    params.append(filters["priority"])
-
-                if "project_id" in filters:
-                    query += " AND project_id = ?"
-                    params.append(filters["project_id"])
-
-                if "tag_name" in filters:
-                    query = f"""SELECT DISTINCT t.* FROM tasks t
-                    JOIN task_tags tt ON t.id = tt.task_id
-                    JOIN tags tg ON tt.tag_id = tg.id
-                    WHERE tg.name = ? AND {' AND '.join([k + ' = ?' for k in [k for k in filters.keys() if k != 'tag_name']])}"""
-                    params = [filters["tag_name"]] + [
-                        v
-                        for k, v in filters.items()
-                        if k != "tag_name" and k in ["status", "priority", "project_id"]
-                    ]
+    @staticmethod
+    def _search_select(
+        fts: str, table: str, schema: str = "main", archived_at: Optional[str] = None
+    ) -> str:
+        """Build the ranked full-text SELECT over index ``fts`` joined to ``table``.
+
+        Both live in ``schema``. The statement's parameters are the four
+        snippet() arguments followed by the query. ``archived_at`` adds an
+        ``archived_at`` column with that expression.
+        """
+        columns = ", ".join(f"t.{field}" for field in TASK_FIELDS if field != "description")
+        if archived_at:
+            columns += f", {archived_at} AS archived_at"
+        weights = ", ".join(str(weight) for weight in SEARCH_WEIGHTS)
+        return f"""SELECT {columns},
+                snippet({fts}, -1, ?, ?, ?, ?) AS snippet,
+                bm25({fts}, {weights}) AS score
+            FROM {schema}.{fts} f
+            JOIN {schema}.{table} t ON t.id = f.rowid
+            WHERE {fts} MATCH ?"""
+
+    async def rebuild_search_index(self) -> None:
+        """Repopulate ``tasks_fts`` from tasks and their tag names in one pass."""
+
+        async def op(conn: aiosqlite.Connection) -> None:
+            # Recreating the table is much cheaper than deleting every row,
+            # which makes FTS5 remove each row's tokens one by one.
+            cursor = await conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'tasks_fts'"
+            )
+            (definition,) = await cursor.fetchone()
+            await conn.execute("DROP TABLE tasks_fts")
+            await conn.execute(definition)
+            await conn.execute(
+                """INSERT INTO tasks_fts (rowid, title, description, tags)
+                SELECT t.id, t.title, t.description,
+                    (SELECT group_concat(tg.name, ' ') FROM task_tags tt
+                     JOIN tags tg ON tg.id = tt.tag_id
+                     WHERE tt.task_id = t.id)
+                FROM tasks t"""
+            )
+            await conn.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('optimize')")
 
-                query += " ORDER BY priority = 'high' DESC, due_date ASC"
+        try:
+            await self._run_write(op)
+            logger.info("Search index rebuilt")
+        except Exception as e:
+            logger.error(f"Failed to rebuild search index: {e}")
+            raise
 
-                cursor = await conn.execute(query, params)
-                rows = await cursor.fetchall()
-                tasks = []
-                for row in rows:
-                    task = self._row_to_dict(row)
-                    tags_cursor = await conn.execute(
-                        """SELECT t.id, t.name FROM tags t
-                        JOIN task_tags tt ON t.id = tt.tag_id
-                        WHERE tt.task_id = ?""",
-                        (task["id"],),
+    async def filter_tasks(
+        self,
+        tags_any: Optional[list[str]] = None,
+        tags_all: Optional[list[str]] = None,
+        tags_none: Optional[list[str]] = None,
+        records: bool = False,
+        **filters,
+    ) -> list[dict]:
+        """Filter tasks by status, priority, project and tags.
+
+        Tag conditions are evaluated on the in-memory tag index; SQLite then
+        reads only the matching IDs, ``ID_BATCH_SIZE`` per query, with the
+        other filters applied.
+
+        Args:
+            tags_any: Keep tasks with at least one of these tags.
+            tags_all: Keep tasks with every one of these tags.
+            tags_none: Drop tasks with any of these tags.
+            records: Return ``TaskRecord`` tuples instead of dicts.
+            filters: ``status``, ``priority`` and ``project_id``; ``tag_name``
+                is one more tag for ``tags_all``.
+
+        Returns:
+            Matching tasks with tags, in listing order.
+        """
+        tags_all = list(tags_all or [])
+        if filters.get("tag_name"):
+            tags_all.append(filters["tag_name"])
+        conditions, params = self._filter_conditions(
+            {key: value for key, value in filters.items() if key != "tag_name"}
+        )
+        task_ids = self._tag_index.match(tags_any or (), tags_all, tags_none or ())
+        try:
+            async with self._get_read_connection() as conn:
+                if task_ids is None:
+                    cursor = await conn.execute(
+                        f"""SELECT {_task_columns('t')} FROM tasks t
+                        WHERE {" AND ".join(conditions) or "1=1"}
+                        ORDER BY {_task_order_by('t')}""",
+                        params,
                     )
-                    tags = [dict(tag) for tag in await tags_cursor.fetchall()]
-                    task["tags"] = tags
-                    tasks.append(task)
-                return tasks
+                    if records:
+                        cursor.row_factory = task_record_factory
+                    rows = await cursor.fetchall()
+                    if tags_none:
+                        excluded = set(self._tag_index.tasks_with_any(tags_none))
+                        rows = [row for row in rows if row["id"] not in excluded]
+                else:
+                    rows = []
+                    for start in range(0, len(task_ids), ID_BATCH_SIZE):
+                        batch = task_ids[start : start + ID_BATCH_SIZE]
+                        placeholders = ", ".join("?" * len(batch))
+                        cursor = await conn.execute(
+                            f"""SELECT {_task_columns('t')} FROM tasks t
+                            WHERE {" AND ".join([f"t.id IN ({placeholders})", *conditions])}""",
+                            [*batch, *params],
+                        )
+                        if records:
+                            cursor.row_factory = task_record_factory
+                        rows.extend(await cursor.fetchall())
+                    # Same order as _task_order_by().
+                    rows.sort(
+                        key=lambda r: (r["priority"] != "high", r["due_date"] or "", r["id"])
+                    )
+                return await self._hydrate_tags(conn, rows)
         except Exception as e:
             logger.error(f"Failed to filter tasks: {e}")
             return []
 
-    # ==================== ANALYTICS OPERATIONS ====================
-
-    async def get_task_statistics(self) -> dict:
-        """Get task statistics."""
+    async def filter_tasks_faceted(
+        self, facets: list[str], limit: Optional[int] = None, **filters
+    ) -> dict:
+        """Filter tasks and count the matches per facet value.
+
+        All facets are counted by one statement: the matching tasks are
+        materialized once and grouped by each requested facet, like
+        ``GROUPING SETS``, which SQLite lacks.
+
+        Args:
+            facets: Names from ``FILTER_FACETS`` (status, priority, project, tag).
+            limit: Maximum number of tasks returned; ``None`` returns all and
+                ``0`` only the counts. Facets always cover every match.
+            filters: Same filters as ``filter_tasks``.
+
+        Returns:
+            Dictionary with ``tasks``, ``total`` (number of matches) and
+            ``facets``, mapping each facet to value -> count. Status and
+            priority list every value; projects and tags only those present.
+            A task without a project is counted under ``"none"``.
+
+        Raises:
+            ValueError: If a facet is unknown.
+        """
+        unknown = [facet for facet in facets if facet not in FILTER_FACETS]
+        if unknown:
+            raise ValueError(f"Unknown facets {unknown}; expected some of {list(FILTER_FACETS)}")
+
+        conditions, params = self._filter_conditions(filters)
+        where = " AND ".join(conditions) or "1=1"
+        groups = [
+            f"""SELECT '{facet}', {FILTER_FACETS[facet][0]}, COUNT(*)
+            FROM matched m {FILTER_FACETS[facet][1]} GROUP BY 2"""
+            for facet in dict.fromkeys(facets)
+        ]
+        counts = {
+            "status": dict.fromkeys(TASK_STATUSES, 0) if "status" in facets else None,
+            "priority": dict.fromkeys(TASK_PRIORITIES, 0) if "priority" in facets else None,
+        }
+        result = {facet: counts.get(facet) or {} for facet in dict.fromkeys(facets)}
         try:
-            async with self._get_connection() as conn:
-                cursor = await conn.execute("SELECT COUNT(*) as total FROM tasks")
-                total = (await cursor.fetchone())["total"]
-
+            async with self._get_read_connection() as conn:
                 cursor = await conn.execute(
-                    "SELECT COUNT(*) as completed FROM tasks WHERE status = 'completed'"
+                    f"""WITH matched AS MATERIALIZED (
+                        SELECT id, status, priority, project_id FROM tasks t WHERE {where}
+                    )
+                    SELECT 'total', NULL, COUNT(*) FROM matched
+                    {"".join(f" UNION ALL {group}" for group in groups)}""",
+                    params,
                 )
-                completed = (await cursor.fetchone())["completed"]
+                total = 0
+                for facet, value, count in await cursor.fetchall():
+                    if facet == "total":
+                        total = count
+                    else:
+                        result[facet]["none" if value is None else str(value)] = count
 
-                cursor = await conn.execute(
-                    "SELECT COUNT(*) as pending FROM tasks WHERE status = 'pending'"
-                )
-                pending = (await cursor.fetchone())["pending"]
+                tasks = []
+                if limit != 0:
+                    query = f"""SELECT {_task_columns('t')} FROM tasks t WHERE {where}
+                    ORDER BY {_task_order_by('t')}"""
+                    query_params = list(params)
+                    if limit is not None:
+                        query += " LIMIT ?"
+                        query_params.append(limit)
+                    cursor = await conn.execute(query, query_params)
+                    tasks = await self._hydrate_tags(conn, await cursor.fetchall())
+        except Exception as e:
+            logger.error(f"Failed to filter tasks with facets: {e}")
+            return {"tasks": [], "total": 0, "facets": {}}
 
-                cursor = await conn.execute(
-                    "SELECT COUNT(*) as high_priority FROM tasks WHERE priority = 'high'"
-                )
-                high_priority = (await cursor.fetchone())["high_priority"]
+        if "tag" in result:
+            result["tag"] = dict(sorted(result["tag"].items(), key=lambda item: -item[1]))
+        return {"tasks": tasks, "total": total, "facets": result}
+
+    @staticmethod
+    def _filter_conditions(filters: dict) -> tuple[list[str], list[Any]]:
+        """Build WHERE conditions on tasks (alias t) for ``filter_tasks`` filters."""
+        conditions = []
+        params = []
+        for column in ("status", "priority", "project_id"):
+            if column in filters:
+                conditions.append(f"t.{column} = ?")
+                params.append(filters[column])
+
+        def tagged(select: str, names: set[str]) -> str:
+            params.extend(names)
+            return f"""(SELECT {select} FROM task_tags tt JOIN tags tg ON tg.id = tt.tag_id
+                WHERE tt.task_id = t.id AND tg.name IN ({", ".join("?" * len(names))}))"""
+
+        tags_any = set(filters.get("tags_any") or ())
+        tags_all = set(filters.get("tags_all") or ())
+        tags_none = set(filters.get("tags_none") or ())
+        if filters.get("tag_name"):
+            tags_all.add(filters["tag_name"])
+        if tags_any:
+            conditions.append(f"EXISTS {tagged('1', tags_any)}")
+        if tags_all:
+            conditions.append(f"{tagged('COUNT(*)', tags_all)} = {len(tags_all)}")
+        if tags_none:
+            conditions.append(f"NOT EXISTS {tagged('1', tags_none)}")
+        return conditions, params
+
+    # ==================== ANALYTICS OPERATIONS ====================
 
-                return {
-                    "total": total,
-                    "completed": completed,
-                    "pending": pending,
-                    "in_progress": total - completed - pending,
-                    "high_priority": high_priority,
-                    "completion_rate": (completed / total * 100) if total > 0 else 0,
-                }
+    async def get_task_statistics(self) -> dict:
+        """Get task statistics.
+
+        Reads the trigger-maintained ``task_counters`` table, so the cost does
+        not grow with the number of tasks.
+        """
+        try:
+            async with self._get_read_connection() as conn:
+                cursor = await conn.execute("SELECT kind, value, count FROM task_counters")
+                counts = {(kind, value): count for kind, value, count in await cursor.fetchall()}
+                if not counts:
+                    counts = await self._count_tasks(conn)
+                return self._build_statistics(counts)
         except Exception as e:
             logger.error(f"Failed to get statistics: {e}")
             return {}
 
+    async def rebuild_task_counters(self) -> dict:
+        """Recompute ``task_counters`` from the tasks table in a single scan."""
+
+        async def op(conn: aiosqlite.Connection) -> dict:
+            counts = await self._count_tasks(conn)
+            await conn.execute("DELETE FROM task_counters")
+            await conn.executemany(
+                "INSERT INTO task_counters (kind, value, count) VALUES (?, ?, ?)",
+                [(kind, value, count) for (kind, value), count in counts.items()],
+            )
+            return counts
+
+        try:
+            counts = await self._run_write(op)
+            logger.info("Task counters rebuilt")
+            return self._build_statistics(counts)
+        except Exception as e:
+            logger.error(f"Failed to rebuild task counters: {e}")
+            raise
+
+    async def verify_task_counters(self) -> bool:
+        """Check ``task_counters`` against a full conditional aggregation."""
+        try:
+            async with self._get_read_connection() as conn:
+                expected = await self._count_tasks(conn)
+                cursor = await conn.execute("SELECT kind, value, count FROM task_counters")
+                actual = {(kind, value): count for kind, value, count in await cursor.fetchall()}
+        except Exception as e:
+            logger.error(f"Failed to verify task counters: {e}")
+            return False
+
+        mismatched = {
+            key: (actual.get(key), count)
+            for key, count in expected.items()
+            if actual.get(key) != count
+        }
+        if mismatched:
+            logger.warning(f"Task counters out of sync (actual, expected): {mismatched}")
+        return not mismatched
+
     async def get_overdue_tasks(self) -> list[dict]:
-        """Get overdue tasks."""
+        """Get overdue tasks.
+
+        Overdue IDs come from the in-memory due-date heap; only those rows are
+        read from SQLite.
+        """
+        today = datetime.now(timezone.utc).date().isoformat()
+        return await self._get_open_tasks(self._due_tracker.due_before(today))
+
+    async def get_due_soon_tasks(self, hours: float = 24) -> list[dict]:
+        """Get open tasks that become overdue within the next ``hours`` hours.
+
+        A task becomes overdue when the UTC day after its due date starts,
+        matching ``date('now')`` in SQLite.
+        """
+        now = datetime.now(timezone.utc)
+        today = now.date().isoformat()
+        cutoff = (now + timedelta(hours=hours)).date().isoformat()
+        return await self._get_open_tasks(self._due_tracker.due_before(cutoff, start=today))
+
+    async def reload_due_tracker(self) -> None:
+        """Load open tasks with a due date into the in-memory due-date heap.
+
+        Called on startup; call again after other processes write to the file.
+        """
         try:
-            async with self._get_connection() as conn:
+            async with self._get_read_connection() as conn:
                 cursor = await conn.execute(
-                    """SELECT * FROM tasks
-                    WHERE due_date < date('now') AND status != 'completed'
-                    ORDER BY due_date ASC"""
+                    """SELECT id, due_date FROM tasks
+                    WHERE status != 'completed' AND due_date IS NOT NULL"""
                 )
-                rows = await cursor.fetchall()
-                tasks = []
-                for row in rows:
-                    task = self._row_to_dict(row)
-                    tags_cursor = await conn.execute(
-                        """SELECT t.id, t.name FROM tags t
-                        JOIN task_tags tt ON t.id = tt.tag_id
-                        WHERE tt.task_id = ?""",
-                        (task["id"],),
+                self._due_tracker.load(await cursor.fetchall())
+                logger.info(f"Tracking {len(self._due_tracker)} open tasks with due dates")
+        except Exception as e:
+            logger.error(f"Failed to load due dates: {e}")
+            raise
+
+    async def reload_tag_index(self) -> None:
+        """Load every task's tags into the in-memory tag index.
+
+        Called on startup; call again after other processes write to the file.
+        """
+        try:
+            async with self._get_read_connection() as conn:
+                # In primary key order, so each tag's IDs arrive sorted.
+                cursor = await conn.execute(
+                    """SELECT tg.name, tt.task_id FROM task_tags tt
+                    JOIN tags tg ON tg.id = tt.tag_id ORDER BY tt.task_id"""
+                )
+                self._tag_index.load(await cursor.fetchall())
+                logger.info(f"Indexed {len(self._tag_index)} task tags")
+        except Exception as e:
+            logger.error(f"Failed to load the tag index: {e}")
+            raise
+
+    async def _get_open_tasks(self, task_ids: list[int]) -> list[dict]:
+        """Fetch open tasks by ID, ordered by due date."""
+        try:
+            async with self._get_read_connection() as conn:
+                rows = []
+                for start in range(0, len(task_ids), ID_BATCH_SIZE):
+                    batch = task_ids[start : start + ID_BATCH_SIZE]
+                    placeholders = ", ".join("?" * len(batch))
+                    cursor = await conn.execute(
+                        f"""SELECT {_task_columns()} FROM tasks
+                        WHERE id IN ({placeholders}) AND status != 'completed'""",
+                        batch,
                     )
-                    tags = [dict(tag) for tag in await tags_cursor.fetchall()]
-                    task["tags"] = tags
-                    tasks.append(task)
-                return tasks
+                    rows.extend(await cursor.fetchall())
+                rows.sort(key=lambda row: (row["due_date"], row["id"]))
+                return await self._hydrate_tags(conn, rows)
         except Exception as e:
             logger.error(f"Failed to get overdue tasks: {e}")
             return []
@@ -477,32 +1624,846 @@ class DatabaseManager:
     async def get_project_tasks(self, project_id: int) -> list[dict]:
         """Get all tasks for a project."""
         try:
-            async with self._get_connection() as conn:
+            async with self._get_read_connection() as conn:
                 cursor = await conn.execute(
-                    """SELECT * FROM tasks WHERE project_id = ?
-                    ORDER BY priority = 'high' DESC, due_date ASC""",
+                    f"""SELECT {_task_columns()} FROM tasks WHERE project_id = ?
+                    ORDER BY {_task_order_by()}""",
                     (project_id,),
                 )
                 rows = await cursor.fetchall()
-                tasks = []
-                for row in rows:
-                    task = self._row_to_dict(row)
-                    tags_cursor = await conn.execute(
-                        """SELECT t.id, t.name FROM tags t
-                        JOIN task_tags tt ON t.id = tt.tag_id
-                        WHERE tt.task_id = ?""",
-                        (task["id"],),
-                    )
-                    tags = [dict(tag) for tag in await tags_cursor.fetchall()]
-                    task["tags"] = tags
-                    tasks.append(task)
-                return tasks
+                return await self._hydrate_tags(conn, rows)
         except Exception as e:
             logger.error(f"Failed to get project tasks: {e}")
             return []
 
+    def cache_stats(self) -> dict:
+        """Get hit/miss counters for the get_task/get_project entity cache."""
+        return self._cache.stats()
+
+    async def data_version(self) -> str:
+        """Get a token that changes whenever committed data may have changed.
+
+        Combines ``PRAGMA data_version`` of the writer connection, which moves
+        when another connection or process commits, with the number of commits
+        made through this manager. Equal tokens mean nothing was written in
+        between, so results derived from the data can be reused.
+        """
+        async with self._get_connection() as conn:
+            cursor = await conn.execute("PRAGMA data_version")
+            (version,) = await cursor.fetchone()
+        return f"{self._epoch}-{version}-{self._write_generation}"
+
+    def query_stats(self, limit: int = 50) -> Optional[dict]:
+        """Get per-statement timing counters and the slow-query log.
+
+        Args:
+            limit: Maximum number of statements returned, most total time first.
+
+        Returns:
+            Counters keyed by statement fingerprint, or None if profiling is off.
+        """
+        if self._query_stats is None:
+            return None
+        return self._query_stats.snapshot(limit)
+
+    # ==================== BATCH OPERATIONS ====================
+
+    async def execute_batch(self, operations: list[dict]) -> list[Any]:
+        """Run a list of write operations atomically in one transaction.
+
+        Each operation is ``{"op": name, "args": {...}}`` where ``name`` is one
+        of ``BATCH_OPERATIONS``. A string argument of the form
+        ``"$<index>.<field>"`` is replaced by that field of an earlier result,
+        e.g. ``"$0.id"`` for the project created by the first operation or
+        ``"$1.0.id"`` for the first task created by a ``create_tasks`` call.
+
+        Returns:
+            The result of every operation, in order.
+
+        Raises:
+            ValueError: If an operation is unknown, has a bad reference or
+                fails. Nothing is committed in that case.
+        """
+        results: list[Any] = []
+        async with self.transaction():
+            for index, operation in enumerate(operations):
+                name = operation.get("op")
+                if name not in BATCH_OPERATIONS:
+                    raise ValueError(f"Operation {index}: unknown op {name!r}")
+                args = self._resolve_batch_references(operation.get("args") or {}, results)
+                try:
+                    result = await getattr(self, name)(**args)
+                except Exception as e:
+                    raise ValueError(f"Operation {index} ({name}) failed: {e}") from e
+                # Methods that swallow their errors report them as None/False.
+                if result is None or result is False:
+                    raise ValueError(f"Operation {index} ({name}) failed")
+                results.append(result)
+        return results
+
+    # ==================== IMPORT / EXPORT OPERATIONS ====================
+
+    async def export_tasks(self, fp: TextIO, fmt: str = "ndjson", batch_size: int = 1000) -> int:
+        """Stream every task to ``fp`` as NDJSON or CSV.
+
+        Tasks are read with ``iter_tasks`` and written one record at a time with
+        their tag names, so memory stays proportional to ``batch_size``.
+
+        Returns:
+            The number of tasks written.
+        """
+
+        async def records() -> AsyncIterator[dict]:
+            async for task in self.iter_tasks(batch_size):
+                task["tags"] = [tag["name"] for tag in task["tags"]]
+                yield task
+
+        try:
+            count = await write_records(fp, fmt, EXPORT_FIELDS, records())
+            logger.info(f"Exported {count} tasks as {fmt}")
+            return count
+        except Exception as e:
+            logger.error(f"Failed to export tasks: {e}")
+            raise
+
+    async def import_tasks(
+        self, fp: TextIO, fmt: str = "ndjson", batch_size: int = IMPORT_BATCH_SIZE
+    ) -> int:
+        """Load tasks from an NDJSON or CSV stream in the ``export_tasks`` format.
+
+        Records are parsed one at a time and inserted ``batch_size`` per
+        transaction. A record keeps its ``id`` and timestamps when present, and
+        its tags are given by name and created as needed. The search and counter
+        triggers (and, for an empty table, the task indexes) are dropped for the
+        duration of the load; ``tasks_fts`` and ``task_counters`` are rebuilt in
+        one pass at the end, in the transaction that restores them. The next
+        batch is parsed in a worker thread while the current one is written.
+
+        Returns:
+            The number of tasks imported.
+
+        Raises:
+            ValueError: If ``fmt`` is unknown or a record is malformed. Batches
+                committed before a failing record stay imported.
+        """
+        if fmt not in RECORD_FORMATS:
+            raise ValueError(f"Unknown format {fmt!r}; expected one of {RECORD_FORMATS}")
+        records = read_records(fp, fmt, list_fields=("tags",))
+        parsed = 0
+
+        def parse_batch() -> list[tuple]:
+            nonlocal parsed
+            rows = [
+                self._import_row(parsed + number, record)
+                for number, record in enumerate(itertools.islice(records, batch_size), 1)
+            ]
+            parsed += len(rows)
+            return rows
+
+        imported = 0
+        try:
+            definitions = await self._run_write(self._begin_bulk_load)
+            try:
+                rows = await asyncio.to_thread(parse_batch)
+                while rows:
+                    write = asyncio.ensure_future(
+                        self._run_write(
+                            lambda conn, rows=rows: self._insert_import_batch(conn, rows)
+                        )
+                    )
+                    try:
+                        next_rows = await asyncio.to_thread(parse_batch)
+                    finally:
+                        resolved = await write
+                    self._after_commit(self._tag_ids.update, resolved)
+                    imported += len(rows)
+                    logger.info(f"Imported {imported} tasks")
+                    rows = next_rows
+            finally:
+                async with self.transaction():
+                    await self._run_write(lambda conn: self._restore_definitions(conn, definitions))
+                    await self.rebuild_search_index()
+                    await self.rebuild_task_counters()
+                    if imported:
+                        await self._run_write(self._record_reset)
+                self._after_commit(self._cache.clear)
+                await self.reload_due_tracker()
+                await self.reload_tag_index()
+            return imported
+        except Exception as e:
+            logger.error(f"Failed to import tasks after {imported} records: {e}")
+            raise
+
+    async def _begin_bulk_load(self, conn: aiosqlite.Connection) -> list[str]:
+        """Drop ``BULK_LOAD_TRIGGERS`` and, if tasks is empty, its indexes.
+
+        Returns:
+            The ``sqlite_master`` definitions of the dropped objects.
+        """
+        placeholders = ", ".join("?" * len(BULK_LOAD_TRIGGERS))
+        cursor = await conn.execute(
+            f"""SELECT type, name, sql FROM sqlite_master
+            WHERE (type = 'trigger' AND name IN ({placeholders}))
+               OR (type = 'index' AND tbl_name = 'tasks' AND sql IS NOT NULL
+                   AND NOT EXISTS (SELECT 1 FROM tasks))""",
+            BULK_LOAD_TRIGGERS,
+        )
+        objects = await cursor.fetchall()
+        for object_type, name, _ in objects:
+            await conn.execute(f"DROP {object_type.upper()} {name}")
+        return [sql for _, _, sql in objects]
+
+    @staticmethod
+    async def _restore_definitions(conn: aiosqlite.Connection, definitions: list[str]) -> None:
+        """Recreate schema objects from their ``sqlite_master`` definitions."""
+        for sql in definitions:
+            await conn.execute(sql)
+
+    async def _insert_import_batch(
+        self, conn: aiosqlite.Connection, rows: list[tuple]
+    ) -> dict[str, int]:
+        """Insert one batch of ``_import_row`` tuples and link their tags.
+
+        Rows with an explicit ID are inserted first; the rest get IDs assigned
+        from the AUTOINCREMENT sequence so their tags can be linked without
+        reading the rows back. ``_import_row`` has already validated status and
+        priority, so CHECK constraints are skipped for the batch.
+
+        Returns:
+            The resolved tag name to ID mapping.
+        """
+        await conn.execute("PRAGMA ignore_check_constraints = ON")
+        try:
+            return await self._insert_import_rows(conn, rows)
+        finally:
+            await conn.execute("PRAGMA ignore_check_constraints = OFF")
+
+    async def _insert_import_rows(
+        self, conn: aiosqlite.Connection, rows: list[tuple]
+    ) -> dict[str, int]:
+        """Insert ``rows`` and their tag links; see ``_insert_import_batch``."""
+        insert = """INSERT INTO tasks
+            (id, title, description, status, priority, project_id, due_date,
+             created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?,
+                    COALESCE(?, CURRENT_TIMESTAMP), COALESCE(?, CURRENT_TIMESTAMP))"""
+        explicit = [row for row in rows if row[0] is not None]
+        implicit = [row for row in rows if row[0] is None]
+        if explicit:
+            await conn.executemany(insert, [row[:-1] for row in explicit])
+        if implicit:
+            cursor = await conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'tasks'")
+            seq_row = await cursor.fetchone()
+            first_id = (seq_row[0] if seq_row else 0) + 1
+            implicit = [(first_id + i, *row[1:]) for i, row in enumerate(implicit)]
+            await conn.executemany(insert, [row[:-1] for row in implicit])
+
+        links = [(row[0], name) for row in itertools.chain(explicit, implicit) for name in row[-1]]
+        if not links:
+            return {}
+        return await self._insert_tag_links(conn, links)
+
+    # ==================== CHANGE FEED OPERATIONS ====================
+
+    async def changes_since(self, seq: int = 0, limit: int = 100) -> dict:
+        """Get change feed entries recorded after sequence number ``seq``.
+
+        Clients mirroring task state start with ``seq`` 0 and pass the returned
+        ``next_seq`` on the next call. When ``reset_required`` is True the
+        entries after ``seq`` are gone (compacted, or replaced by a bulk load)
+        and the client must re-read everything, then continue from
+        ``next_seq``; entries from there on may repeat what it just read.
+
+        Args:
+            seq: Last sequence number the client has applied.
+            limit: Maximum number of entries returned.
+
+        Returns:
+            Dictionary with ``changes`` (seq, entity, entity_id, op, changed_at),
+            ``next_seq``, ``has_more`` and ``reset_required``.
+
+        Raises:
+            ValueError: If ``limit`` is less than 1.
+        """
+        if limit < 1:
+            raise ValueError(f"limit must be at least 1, got {limit}")
+        try:
+            async with self._get_read_connection() as conn:
+                cursor = await conn.execute(
+                    """SELECT seq, entity, entity_id, op, changed_at FROM changes
+                    WHERE seq > ? ORDER BY seq LIMIT ?""",
+                    (seq, limit + 1),
+                )
+                rows = await cursor.fetchall()
+                if not rows:
+                    # compact_changes() keeps the newest entry, so an empty page
+                    # means the client is current unless the database is older
+                    # than its position (e.g. restored from a snapshot).
+                    cursor = await conn.execute("SELECT COALESCE(MAX(seq), 0) FROM changes")
+                    latest = (await cursor.fetchone())[0]
+                    return self._change_page([], latest, False, latest < seq)
+
+            if rows[0]["seq"] != seq + 1:
+                # Sequence numbers are contiguous; a gap means compacted entries.
+                return self._change_page([], rows[0]["seq"] - 1, False, True)
+            rows, has_more = rows[:limit], len(rows) > limit
+            for row in rows:
+                if row["op"] == "reset":
+                    return self._change_page([], row["seq"], False, True)
+            return self._change_page(rows, rows[-1]["seq"], has_more, False)
+        except Exception as e:
+            logger.error(f"Failed to read changes since {seq}: {e}")
+            return {}
+
+    async def compact_changes(self, retention_hours: Optional[float] = None) -> int:
+        """Delete change feed entries older than the retention horizon.
+
+        The newest entry is always kept so ``changes_since`` can tell compacted
+        history apart from an idle feed.
+
+        Args:
+            retention_hours: Hours of history to keep; defaults to
+                ``change_retention_hours``.
+
+        Returns:
+            Number of entries deleted.
+        """
+        if retention_hours is None:
+            retention_hours = self.change_retention_hours
+
+        async def op(conn: aiosqlite.Connection) -> int:
+            cursor = await conn.execute(
+                """DELETE FROM changes WHERE seq < COALESCE(
+                    (SELECT seq FROM changes WHERE changed_at >= datetime('now', ?)
+                     ORDER BY seq LIMIT 1),
+                    (SELECT MAX(seq) FROM changes)
+                )""",
+                (f"-{retention_hours} hours",),
+            )
+            return cursor.rowcount
+
+        try:
+            deleted = await self._run_write(op)
+            if deleted:
+                logger.info(f"Compacted {deleted} change feed entries")
+            return deleted
+        except Exception as e:
+            logger.error(f"Failed to compact changes: {e}")
+            return 0
+
+    async def _compaction_loop(self) -> None:
+        """Run compact_changes() now and every CHANGE_COMPACT_INTERVAL seconds."""
+        while True:
+            await self.compact_changes()
+            await asyncio.sleep(CHANGE_COMPACT_INTERVAL)
+
+    @staticmethod
+    async def _record_reset(conn: aiosqlite.Connection) -> None:
+        """Append a change feed entry telling clients to re-read everything."""
+        await conn.execute("INSERT INTO changes (entity, entity_id, op) VALUES ('all', 0, 'reset')")
+
+    @staticmethod
+    def _change_page(rows: list, next_seq: int, has_more: bool, reset_required: bool) -> dict:
+        """Build a changes_since() result."""
+        return {
+            "changes": [dict(row) for row in rows],
+            "next_seq": next_seq,
+            "has_more": has_more,
+            "reset_required": reset_required,
+        }
+
+    # ==================== ARCHIVE OPERATIONS ====================
+
+    async def archive_tasks(
+        self, older_than_days: Optional[float] = None, batch_size: int = ARCHIVE_BATCH_SIZE
+    ) -> int:
+        """Move one batch of old completed tasks to the archive tables.
+
+        Tasks whose status is completed and that were last updated more than
+        ``older_than_days`` days ago are copied with their tag links and search
+        index entry to ``tasks_archive``, ``task_tags_archive`` and
+        ``tasks_archive_fts``, then deleted from the active tables. They no
+        longer appear in listings, filters, statistics or default searches, and
+        the change feed records them as deleted.
+
+        Args:
+            older_than_days: Minimum age in days; defaults to
+                ``archive_after_days``.
+            batch_size: Maximum number of tasks moved in this transaction.
+
+        Returns:
+            Number of tasks archived.
+        """
+        if older_than_days is None:
+            older_than_days = self.archive_after_days
+        archive = self._archive
+        fields = ", ".join(TASK_FIELDS)
+
+        async def op(conn: aiosqlite.Connection) -> list[int]:
+            cursor = await conn.execute(
+                """SELECT id FROM tasks
+                WHERE status = 'completed' AND updated_at < datetime('now', ?)
+                LIMIT ?""",
+                (f"-{older_than_days} days", batch_size),
+            )
+            task_ids = [row[0] for row in await cursor.fetchall()]
+            if not task_ids:
+                return task_ids
+
+            placeholders = ", ".join("?" * len(task_ids))
+            # Copy before deleting: when the archive is a separate WAL-mode file
+            # the two databases commit independently, and an interrupted move
+            # must leave a duplicate that the next batch replaces, not a loss.
+            await conn.execute(
+                f"""INSERT OR REPLACE INTO {archive}.tasks_archive ({fields})
+                SELECT {fields} FROM tasks WHERE id IN ({placeholders})""",
+                task_ids,
+            )
+            await conn.execute(
+                f"DELETE FROM {archive}.tasks_archive_fts WHERE rowid IN ({placeholders})",
+                task_ids,
+            )
+            await conn.execute(
+                f"""INSERT INTO {archive}.tasks_archive_fts (rowid, title, description, tags)
+                SELECT rowid, title, description, tags FROM tasks_fts
+                WHERE rowid IN ({placeholders})""",
+                task_ids,
+            )
+            await conn.execute(
+                f"""INSERT OR IGNORE INTO {archive}.task_tags_archive (task_id, tag_id)
+                SELECT task_id, tag_id FROM task_tags WHERE task_id IN ({placeholders})""",
+                task_ids,
+            )
+            # Tasks first, so the tag triggers find no search index row to update.
+            await conn.execute(f"DELETE FROM tasks WHERE id IN ({placeholders})", task_ids)
+            await conn.execute(f"DELETE FROM task_tags WHERE task_id IN ({placeholders})", task_ids)
+            return task_ids
+
+        try:
+            task_ids = await self._run_write(op)
+            for task_id in task_ids:
+                self._after_commit(self._cache.invalidate, ("task", task_id))
+            self._after_commit(self._tag_index.discard_tasks, task_ids)
+            if task_ids:
+                logger.info(f"Archived {len(task_ids)} completed tasks")
+            return len(task_ids)
+        except Exception as e:
+            logger.error(f"Failed to archive tasks: {e}")
+            return 0
+
+    async def _archive_loop(self) -> None:
+        """Archive old completed tasks in small batches until caught up, then wait."""
+        while True:
+            archived = await self.archive_tasks()
+            await asyncio.sleep(
+                ARCHIVE_BATCH_DELAY if archived >= ARCHIVE_BATCH_SIZE else ARCHIVE_INTERVAL
+            )
+
+    async def _get_archived_task(
+        self, conn: aiosqlite.Connection, task_id: int
+    ) -> Optional[dict]:
+        """Get an archived task by ID with its tags and ``archived_at``."""
+        cursor = await conn.execute(
+            f"""SELECT {_task_columns()}, archived_at FROM {self._archive}.tasks_archive
+            WHERE id = ?""",
+            (task_id,),
+        )
+        row = await cursor.fetchone()
+        if not row:
+            return None
+        return (await self._hydrate_tags(conn, [row], f"{self._archive}.task_tags_archive"))[0]
+
+    # ==================== MAINTENANCE OPERATIONS ====================
+
+    async def snapshot(
+        self,
+        path: str,
+        pages_per_step: int = SNAPSHOT_PAGES_PER_STEP,
+        step_delay: float = SNAPSHOT_STEP_DELAY,
+    ) -> dict:
+        """Copy the live database to ``path`` with the SQLite online backup API.
+
+        The copy runs on a dedicated read-only connection in its own thread,
+        ``pages_per_step`` pages at a time, so the event loop and the writer
+        connection stay free, and sleeps ``step_delay`` seconds between steps
+        so concurrent tool calls keep their latency. In WAL mode the copy reads
+        one consistent snapshot and writers are never blocked. Otherwise any
+        commit would restart the copy, so in-process writes wait until it
+        finishes. The copy is written to ``<path>.partial`` and renamed to
+        ``path`` once complete.
+
+        Returns:
+            The final progress, as reported by ``snapshot_progress``.
+
+        Raises:
+            RuntimeError: If another snapshot is already running.
+            ValueError: If ``path`` is the live database or an existing file
+                that is not an SQLite database.
+        """
+        if self._snapshot and self._snapshot["state"] == "running":
+            raise RuntimeError(f"A snapshot to {self._snapshot['path']} is already running")
+        target = Path(path).resolve()
+        live = {self.db_path.resolve()}
+        if self.archive_path:
+            live.add(self.archive_path.resolve())
+        if target in live:
+            raise ValueError(f"Cannot snapshot over the live database {target}")
+        if target.exists() and not self._is_sqlite_file(target):
+            raise ValueError(f"Refusing to replace {target}: not an SQLite database")
+        if not self.connection:
+            await self.initialize()
+
+        partial = target.with_name(target.name + ".partial")
+        progress = {
+            "path": str(target),
+            "state": "running",
+            "pages_copied": 0,
+            "total_pages": 0,
+            "percent": 0.0,
+            "bytes_copied": 0,
+            "elapsed": 0.0,
+            "bytes_per_second": 0,
+        }
+        self._snapshot = progress
+        started = time.perf_counter()
+
+        source = await aiosqlite.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            cursor = await source.execute("PRAGMA page_size")
+            (page_size,) = await cursor.fetchone()
+            cursor = await source.execute("PRAGMA journal_mode")
+            (journal_mode,) = await cursor.fetchone()
+
+            def on_step(status: int, remaining: int, total: int) -> None:
+                # Runs on the source connection's thread after every step.
+                copied = total - remaining
+                elapsed = time.perf_counter() - started
+                progress.update(
+                    pages_copied=copied,
+                    total_pages=total,
+                    percent=round(100 * copied / total, 1) if total else 100.0,
+                    bytes_copied=copied * page_size,
+                    elapsed=round(elapsed, 3),
+                    bytes_per_second=round(copied * page_size / elapsed) if elapsed else 0,
+                )
+                if step_delay and remaining:
+                    time.sleep(step_delay)
+
+            partial.unlink(missing_ok=True)
+            destination = sqlite3.connect(partial, check_same_thread=False)
+            try:
+                if journal_mode.lower() == "wal":
+                    # Pin one read snapshot so concurrent commits cannot restart the copy.
+                    await source.execute("BEGIN")
+                    await source.execute("SELECT 1 FROM sqlite_master LIMIT 1")
+                    await source.backup(destination, pages=pages_per_step, progress=on_step)
+                    await source.execute("COMMIT")
+                else:
+                    async with self._write_lock:
+                        await source.backup(destination, pages=pages_per_step, progress=on_step)
+            finally:
+                destination.close()
+            partial.replace(target)
+        except Exception as e:
+            progress.update(state="failed", error=str(e))
+            partial.unlink(missing_ok=True)
+            logger.error(f"Failed to snapshot database to {target}: {e}")
+            raise
+        finally:
+            await source.close()
+
+        progress["state"] = "completed"
+        logger.info(
+            f"Snapshot to {target} completed: {progress['bytes_copied']} bytes in "
+            f"{progress['elapsed']:.2f}s ({progress['bytes_per_second'] / 1e6:.1f} MB/s)"
+        )
+        return dict(progress)
+
+    def snapshot_progress(self) -> Optional[dict]:
+        """Get progress of the running or most recent ``snapshot``.
+
+        Reports pages and bytes copied, percent done, elapsed seconds,
+        throughput in bytes per second and a state of ``running``,
+        ``completed`` or ``failed``; ``None`` if no snapshot was taken.
+        """
+        return dict(self._snapshot) if self._snapshot else None
+
     # ==================== UTILITY METHODS ====================
 
+    @staticmethod
+    def _is_sqlite_file(path: Path) -> bool:
+        """Whether ``path`` is a regular file starting with the SQLite header."""
+        if not path.is_file():
+            return False
+        with open(path, "rb") as fp:
+            return fp.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+
+    @staticmethod
+    def _import_row(number: int, record: dict) -> tuple:
+        """Convert an imported record to an insert tuple ending with its tags.
+
+        Accepts both NDJSON values and CSV strings, where empty cells mean NULL.
+        """
+        if not record.get("title"):
+            raise ValueError(f"Record {number}: every task requires a title")
+        status = record.get("status") or "pending"
+        if status not in TASK_STATUSES:
+            raise ValueError(f"Record {number}: invalid status {status!r}")
+        priority = record.get("priority") or "medium"
+        if priority not in TASK_PRIORITIES:
+            raise ValueError(f"Record {number}: invalid priority {priority!r}")
+        try:
+            task_id = record.get("id")
+            project_id = record.get("project_id")
+            return (
+                int(task_id) if task_id not in (None, "") else None,
+                record["title"],
+                record.get("description", ""),
+                status,
+                priority,
+                int(project_id) if project_id not in (None, "") else None,
+                record.get("due_date") or None,
+                record.get("created_at") or None,
+                record.get("updated_at") or None,
+                [name for name in record.get("tags") or [] if name],
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Record {number}: {e}") from e
+
+    @classmethod
+    def _resolve_batch_references(cls, value: Any, results: list[Any]) -> Any:
+        """Replace ``"$<index>.<field>..."`` strings in ``value`` with the
+        referenced part of an earlier ``execute_batch`` result.
+        """
+        if isinstance(value, dict):
+            return {k: cls._resolve_batch_references(v, results) for k, v in value.items()}
+        if isinstance(value, list):
+            return [cls._resolve_batch_references(v, results) for v in value]
+        if not isinstance(value, str):
+            return value
+        match = BATCH_REFERENCE.match(value)
+        if not match:
+            return value
+
+        index = int(match.group(1))
+        if index >= len(results):
+            raise ValueError(f"Reference {value!r} points at an operation that has not run")
+        target = results[index]
+        try:
+            for part in match.group(2)[1:].split("."):
+                target = target[int(part)] if isinstance(target, list) else target[part]
+        except (KeyError, IndexError, ValueError, TypeError):
+            raise ValueError(f"Reference {value!r} does not match the result of operation {index}")
+        return target
+
+    async def _resolve_tag_ids(
+        self, conn: aiosqlite.Connection, tag_names: list[str], create: bool
+    ) -> dict[str, int]:
+        """Map tag names to IDs, consulting the tag dictionary first.
+
+        Names missing from the dictionary are looked up, or with ``create``
+        inserted with one multi-row ``INSERT ... ON CONFLICT`` per
+        ``ID_BATCH_SIZE`` names that returns the IDs of new and existing tags
+        alike. Runs inside the caller's transaction; the caller merges the
+        result into the dictionary once that transaction has committed.
+        """
+        resolved = {name: self._tag_ids[name] for name in tag_names if name in self._tag_ids}
+        missing = sorted({name for name in tag_names if name not in resolved})
+        for start in range(0, len(missing), ID_BATCH_SIZE):
+            batch = missing[start : start + ID_BATCH_SIZE]
+            if create:
+                values = ", ".join(["(?)"] * len(batch))
+                cursor = await conn.execute(
+                    f"""INSERT INTO tags (name) VALUES {values}
+                    ON CONFLICT(name) DO UPDATE SET name = excluded.name
+                    RETURNING id, name""",
+                    batch,
+                )
+            else:
+                placeholders = ", ".join("?" * len(batch))
+                cursor = await conn.execute(
+                    f"SELECT id, name FROM tags WHERE name IN ({placeholders})", batch
+                )
+            for tag_id, name in await cursor.fetchall():
+                resolved[name] = tag_id
+        return resolved
+
+    async def _insert_tag_links(
+        self, conn: aiosqlite.Connection, links: list[tuple[int, str]]
+    ) -> dict[str, int]:
+        """Link tasks to tags by name, creating missing tags.
+
+        Runs inside the caller's transaction and does not commit.
+
+        Returns:
+            The resolved tag name to ID mapping.
+        """
+        tag_ids = await self._resolve_tag_ids(
+            conn, [tag_name for _, tag_name in links], create=True
+        )
+        await conn.executemany(
+            "INSERT OR IGNORE INTO task_tags (task_id, tag_id) VALUES (?, ?)",
+            [(task_id, tag_ids[tag_name]) for task_id, tag_name in links],
+        )
+        return tag_ids
+
+    async def _hydrate_tags(
+        self, conn: aiosqlite.Connection, rows, links: str = "task_tags"
+    ) -> list[dict]:
+        """Convert task rows to dicts and attach their tags.
+
+        Tags for the whole page are fetched with one batched ``IN (...)`` query
+        per ``ID_BATCH_SIZE`` tasks instead of one query per task. ``links`` is
+        the task-tag table to read, e.g. the archive's. ``TaskRecord`` rows stay
+        records; their tags are added as ``(id, name)`` pairs.
+        """
+        if rows and rows[0].__class__ is TaskRecord:
+            tags_by_task = {record[0]: record.tags for record in rows}
+            for task_id, tag_id, tag_name in await self._fetch_tags(conn, tags_by_task, links):
+                tags_by_task[task_id].append((tag_id, tag_name))
+            return rows
+
+        tasks = [self._row_to_dict(row) for row in rows]
+        if not tasks:
+            return tasks
+
+        tags_by_task: dict[int, list[dict]] = {task["id"]: [] for task in tasks}
+        for task_id, tag_id, tag_name in await self._fetch_tags(conn, tags_by_task, links):
+            tags_by_task[task_id].append({"id": tag_id, "name": tag_name})
+
+        for task in tasks:
+            task["tags"] = tags_by_task[task["id"]]
+        return tasks
+
+    @staticmethod
+    async def _fetch_tags(
+        conn: aiosqlite.Connection, task_ids, links: str = "task_tags"
+    ) -> list[tuple[int, int, str]]:
+        """Return ``(task_id, tag_id, tag_name)`` for every tag of ``task_ids``."""
+        task_ids = list(task_ids)
+        tags = []
+        for start in range(0, len(task_ids), ID_BATCH_SIZE):
+            batch = task_ids[start : start + ID_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            cursor = await conn.execute(
+                f"""SELECT tt.task_id, t.id, t.name FROM tags t
+                JOIN {links} tt ON t.id = tt.tag_id
+                WHERE tt.task_id IN ({placeholders})""",
+                batch,
+            )
+            tags.extend(await cursor.fetchall())
+        return tags
+
+    async def _hydrate_mixed_tags(self, conn: aiosqlite.Connection, rows) -> list[dict]:
+        """Like ``_hydrate_tags`` for rows of active and archived tasks.
+
+        Rows with a non-null ``archived_at`` take their tags from the archive.
+        """
+        active = await self._hydrate_tags(conn, [r for r in rows if r["archived_at"] is None])
+        archived = await self._hydrate_tags(
+            conn,
+            [r for r in rows if r["archived_at"] is not None],
+            f"{self._archive}.task_tags_archive",
+        )
+        active_iter, archived_iter = iter(active), iter(archived)
+        return [
+            next(active_iter if row["archived_at"] is None else archived_iter) for row in rows
+        ]
+
+    @staticmethod
+    async def _count_tasks(conn: aiosqlite.Connection) -> dict[tuple[str, str], int]:
+        """Count tasks in total, by status and by priority with one table scan.
+
+        Keys follow the ``task_counters`` layout: ``("total", "")``,
+        ``("status", <status>)`` and ``("priority", <priority>)``.
+        """
+        keys = [("total", "")]
+        columns = ["COUNT(*)"]
+        for kind, values in (("status", TASK_STATUSES), ("priority", TASK_PRIORITIES)):
+            for value in values:
+                keys.append((kind, value))
+                columns.append(f"COALESCE(SUM({kind} = '{value}'), 0)")
+
+        cursor = await conn.execute(f"SELECT {', '.join(columns)} FROM tasks")
+        row = await cursor.fetchone()
+        return dict(zip(keys, row))
+
+    @staticmethod
+    def _build_statistics(counts: dict[tuple[str, str], int]) -> dict:
+        """Shape task counts into the statistics returned to callers."""
+        total = counts.get(("total", ""), 0)
+        by_status = {status: counts.get(("status", status), 0) for status in TASK_STATUSES}
+        by_priority = {
+            priority: counts.get(("priority", priority), 0) for priority in TASK_PRIORITIES
+        }
+        completed = by_status["completed"]
+        pending = by_status["pending"]
+        return {
+            "total": total,
+            "completed": completed,
+            "pending": pending,
+            "in_progress": by_status["in_progress"],
+            "blocked": by_status["blocked"],
+            "high_priority": by_priority["high"],
+            "completion_rate": (completed / total * 100) if total > 0 else 0,
+            "by_status": by_status,
+            "by_priority": by_priority,
+        }
+
+    def _track_due(self, task: dict) -> None:
+        """Update the due-date heap after a write to ``task``."""
+        self._due_tracker.track(task["id"], task["due_date"], task["status"])
+
+    @staticmethod
+    def _pack_cursor(payload: Any) -> str:
+        """Encode a JSON-serializable payload as an opaque URL-safe cursor."""
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def _unpack_cursor(cursor: str) -> Any:
+        """Decode a cursor produced by ``_pack_cursor``."""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            return json.loads(base64.urlsafe_b64decode(padded))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+    @classmethod
+    def _encode_cursor(cls, task: dict) -> str:
+        """Encode the listing sort key of ``task`` as an opaque page cursor."""
+        return cls._pack_cursor(
+            [0 if task["priority"] == "high" else 1, task["due_date"] or "", task["id"]]
+        )
+
+    @classmethod
+    def _decode_cursor(cls, cursor: str) -> tuple[int, str, int]:
+        """Decode a page cursor produced by ``_encode_cursor``."""
+        key = cls._unpack_cursor(cursor)
+        if not (
+            isinstance(key, list)
+            and len(key) == 3
+            and isinstance(key[0], int)
+            and isinstance(key[1], str)
+            and isinstance(key[2], int)
+        ):
+            raise ValueError(f"Invalid cursor: {cursor!r}")
+        return key[0], key[1], key[2]
+
+    @classmethod
+    def _encode_search_cursor(cls, offset: int) -> str:
+        """Encode a search result offset as an opaque page cursor."""
+        return cls._pack_cursor({"offset": offset})
+
+    @classmethod
+    def _decode_search_cursor(cls, cursor: str) -> int:
+        """Decode a search cursor produced by ``_encode_search_cursor``."""
+        payload = cls._unpack_cursor(cursor)
+        offset = payload.get("offset") if isinstance(payload, dict) else None
+        if not isinstance(offset, int) or offset < 0:
+            raise ValueError(f"Invalid cursor: {cursor!r}")
+        return offset
+
     @staticmethod
     def _row_to_dict(row) -> dict:
         """Convert aiosqlite.Row to dictionary."""
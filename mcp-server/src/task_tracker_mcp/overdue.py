@@ -0,0 +1,61 @@
+"""In-memory due-date tracking of open tasks."""
+
+import heapq
+from typing import Iterable, Optional
+
+
+class DueDateTracker:
+    """Min-heap of open tasks ordered by due date.
+
+    Holds ``(due_date, task_id)`` for every task that is not completed and has a
+    due date. Updates push a new heap entry and record the task's current due
+    date; superseded entries are skipped and dropped lazily when they reach the
+    top of the heap. Due dates are compared as strings, like SQLite does for
+    ``YYYY-MM-DD`` values.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[str, int]] = []
+        self._due: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def load(self, entries: Iterable[tuple[int, str]]) -> None:
+        """Replace the tracked tasks with ``(task_id, due_date)`` pairs."""
+        self._due = {task_id: due_date for task_id, due_date in entries}
+        self._heap = [(due_date, task_id) for task_id, due_date in self._due.items()]
+        heapq.heapify(self._heap)
+
+    def track(self, task_id: int, due_date: Optional[str], status: Optional[str]) -> None:
+        """Record the current due date and status of a task."""
+        if not due_date or status == "completed":
+            self.discard(task_id)
+            return
+        if self._due.get(task_id) == due_date:
+            return
+        self._due[task_id] = due_date
+        heapq.heappush(self._heap, (due_date, task_id))
+
+    def discard(self, task_id: int) -> None:
+        """Stop tracking a task."""
+        self._due.pop(task_id, None)
+
+    def due_before(self, cutoff: str, start: Optional[str] = None) -> list[int]:
+        """Return IDs of tasks due before ``cutoff`` (and on/after ``start``).
+
+        Results are ordered by due date, then task ID. Costs O(k log n) for k
+        entries below ``cutoff``; the heap is restored before returning.
+        """
+        popped: list[tuple[str, int]] = []
+        seen: set[int] = set()
+        while self._heap and self._heap[0][0] < cutoff:
+            due_date, task_id = heapq.heappop(self._heap)
+            if self._due.get(task_id) != due_date or task_id in seen:
+                continue  # superseded or duplicate entry
+            seen.add(task_id)
+            popped.append((due_date, task_id))
+
+        for entry in popped:
+            heapq.heappush(self._heap, entry)
+        return [task_id for due_date, task_id in popped if start is None or due_date >= start]
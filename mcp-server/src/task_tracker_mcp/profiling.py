@@ -0,0 +1,229 @@
+"""Per-statement SQL timing, counters and slow-query log."""
+
+import logging
+import re
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Any, Iterable, Optional
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+# Statement kinds worth an EXPLAIN QUERY PLAN in the slow-query log.
+EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_PLACEHOLDER_ROWS = re.compile(r"\(\?\.\.\.\)(?:\s*,\s*\(\?\.\.\.\))+|\(\?\)(?:\s*,\s*\(\?\))+")
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(sql: str) -> str:
+    """Normalize ``sql`` so executions differing only in values share a key.
+
+    Collapses whitespace, replaces literals with ``?`` and folds placeholder
+    lists of any length, e.g. ``IN (?, ?, ?)`` and multi-row ``VALUES``, into
+    ``?...``.
+    """
+    sql = _WHITESPACE.sub(" ", sql).strip()
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _PLACEHOLDER_LIST.sub("?...", sql)
+    return _PLACEHOLDER_ROWS.sub("(?...), ...", sql)
+
+
+class QueryStats:
+    """Aggregated per-fingerprint counters plus a bounded slow-query log."""
+
+    def __init__(self, slow_query_ms: float = 100.0, slow_log_size: int = 100):
+        """Initialize the collector.
+
+        Args:
+            slow_query_ms: Statements taking at least this long, including
+                fetching their rows, are added to the slow-query log. ``0``
+                disables the log.
+            slow_log_size: Number of most recent slow queries kept.
+        """
+        self.slow_query_ms = slow_query_ms
+        self._statements: dict[str, dict] = {}
+        self._slow: deque[dict] = deque(maxlen=slow_log_size)
+        self._plans: dict[str, list[str]] = {}
+
+    def wrap(self, conn: aiosqlite.Connection) -> "ProfiledConnection":
+        """Return ``conn`` with every ``execute``/``executemany`` instrumented."""
+        return ProfiledConnection(conn, self)
+
+    def record(
+        self, key: str, seconds: float, rows: int, calls: int = 1, elapsed: Optional[float] = None
+    ) -> None:
+        """Add one execution, or one fetch of a running one, to ``key``.
+
+        ``elapsed`` is the execution's total time so far and defaults to ``seconds``.
+        """
+        entry = self._statements.get(key)
+        if entry is None:
+            entry = self._statements[key] = {"calls": 0, "seconds": 0.0, "max": 0.0, "rows": 0}
+        entry["calls"] += calls
+        entry["seconds"] += seconds
+        entry["rows"] += rows
+        elapsed = seconds if elapsed is None else elapsed
+        if elapsed > entry["max"]:
+            entry["max"] = elapsed
+
+    async def log_slow(
+        self, conn: aiosqlite.Connection, sql: str, parameters: Any, seconds: float, rows: int
+    ) -> dict:
+        """Add a slow statement to the log with its query plan.
+
+        The plan is captured once per fingerprint with ``EXPLAIN QUERY PLAN``.
+
+        Returns:
+            The log entry, which the caller keeps current while it fetches rows.
+        """
+        key = fingerprint(sql)
+        if key not in self._plans:
+            self._plans[key] = await self._explain(conn, sql, parameters)
+        entry = {
+            "statement": key,
+            "ms": round(seconds * 1000, 3),
+            "rows": rows,
+            "at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "plan": self._plans[key],
+        }
+        self._slow.append(entry)
+        logger.warning(f"Slow query ({entry['ms']} ms): {key}")
+        return entry
+
+    def snapshot(self, limit: int = 50) -> dict:
+        """Return the ``limit`` statements with the most total time and the slow log."""
+        statements = sorted(
+            self._statements.items(), key=lambda item: item[1]["seconds"], reverse=True
+        )
+        return {
+            "slow_query_ms": self.slow_query_ms,
+            "statements": [
+                {
+                    "statement": key,
+                    "calls": entry["calls"],
+                    "total_ms": round(entry["seconds"] * 1000, 3),
+                    "mean_ms": round(entry["seconds"] * 1000 / entry["calls"], 3),
+                    "max_ms": round(entry["max"] * 1000, 3),
+                    "rows": entry["rows"],
+                }
+                for key, entry in statements[:limit]
+                if entry["calls"]
+            ],
+            "slow_queries": list(self._slow),
+        }
+
+    def reset(self) -> None:
+        """Clear all counters and the slow-query log."""
+        self._statements.clear()
+        self._slow.clear()
+        self._plans.clear()
+
+    @staticmethod
+    async def _explain(conn: aiosqlite.Connection, sql: str, parameters: Any) -> list[str]:
+        """Return the ``EXPLAIN QUERY PLAN`` details of ``sql``, if it has any."""
+        if not sql.lstrip().upper().startswith(EXPLAINABLE):
+            return []
+        try:
+            cursor = await conn.execute(f"EXPLAIN QUERY PLAN {sql}", parameters or ())
+            return [row[3] for row in await cursor.fetchall()]
+        except Exception as e:
+            return [f"unavailable: {e}"]
+
+
+class ProfiledConnection:
+    """``aiosqlite.Connection`` proxy that times statements into ``QueryStats``.
+
+    Everything except ``execute``/``executemany`` is passed through unchanged.
+    """
+
+    def __init__(self, conn: aiosqlite.Connection, stats: QueryStats):
+        self._conn = conn
+        self._stats = stats
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    async def execute(self, sql: str, parameters: Any = None) -> "ProfiledCursor":
+        started = time.perf_counter()
+        cursor = await self._conn.execute(sql, parameters)
+        seconds = time.perf_counter() - started
+        profiled = ProfiledCursor(cursor, self, sql, parameters)
+        # Statements without a result set are complete; count affected rows.
+        rows = max(cursor.rowcount, 0) if cursor.description is None else 0
+        await profiled._add(seconds, rows, calls=1)
+        return profiled
+
+    async def executemany(self, sql: str, parameters: Iterable[Any]) -> aiosqlite.Cursor:
+        started = time.perf_counter()
+        cursor = await self._conn.executemany(sql, parameters)
+        seconds = time.perf_counter() - started
+        rows = max(cursor.rowcount, 0)
+        self._stats.record(fingerprint(sql), seconds, rows)
+        if self._stats.slow_query_ms and seconds * 1000 >= self._stats.slow_query_ms:
+            await self._stats.log_slow(self._conn, sql, None, seconds, rows)
+        return cursor
+
+
+class ProfiledCursor:
+    """``aiosqlite.Cursor`` proxy that adds fetch time and rows to its statement."""
+
+    def __init__(self, cursor: aiosqlite.Cursor, conn: ProfiledConnection, sql: str, parameters):
+        self._cursor = cursor
+        self._conn = conn
+        self._sql = sql
+        self._parameters = parameters
+        self._key = fingerprint(sql)
+        self._seconds = 0.0
+        self._rows = 0
+        self._slow_entry: Optional[dict] = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    @property
+    def row_factory(self) -> Any:
+        return self._cursor.row_factory
+
+    @row_factory.setter
+    def row_factory(self, factory: Any) -> None:
+        self._cursor.row_factory = factory
+
+    async def fetchone(self) -> Optional[Any]:
+        started = time.perf_counter()
+        row = await self._cursor.fetchone()
+        await self._add(time.perf_counter() - started, 0 if row is None else 1)
+        return row
+
+    async def fetchmany(self, size: Optional[int] = None) -> Iterable[Any]:
+        started = time.perf_counter()
+        rows = await self._cursor.fetchmany(size)
+        await self._add(time.perf_counter() - started, len(rows))
+        return rows
+
+    async def fetchall(self) -> Iterable[Any]:
+        started = time.perf_counter()
+        rows = await self._cursor.fetchall()
+        await self._add(time.perf_counter() - started, len(rows))
+        return rows
+
+    async def _add(self, seconds: float, rows: int, calls: int = 0) -> None:
+        """Account ``seconds`` and ``rows`` to this execution and its statement."""
+        stats = self._conn._stats
+        self._seconds += seconds
+        self._rows += rows
+        stats.record(self._key, seconds, rows, calls=calls, elapsed=self._seconds)
+        if self._slow_entry is not None:
+            self._slow_entry["ms"] = round(self._seconds * 1000, 3)
+            self._slow_entry["rows"] = self._rows
+        elif stats.slow_query_ms and self._seconds * 1000 >= stats.slow_query_ms:
+            self._slow_entry = await stats.log_slow(
+                self._conn._conn, self._sql, self._parameters, self._seconds, self._rows
+            )
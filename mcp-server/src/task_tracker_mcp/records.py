@@ -0,0 +1,134 @@
+"""Compact task records and their JSON encoder for large task listings."""
+
+import io
+import json
+import sqlite3
+from json.encoder import encode_basestring_ascii
+from typing import Any, TextIO
+
+# Public task columns. The generated sort-key columns (priority_rank, due_key) are
+# internal and never returned to callers.
+TASK_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "project_id",
+    "due_date",
+    "created_at",
+    "updated_at",
+)
+
+RECORD_FIELDS = (*TASK_FIELDS, "tags")
+FIELD_INDEX = {field: index for index, field in enumerate(RECORD_FIELDS)}
+TAGS_INDEX = FIELD_INDEX["tags"]
+
+
+class TaskRecord(tuple):
+    """A task row as a tuple of ``TASK_FIELDS`` values followed by its tags.
+
+    Tags are a list of ``(id, name)`` pairs filled in after the row is read.
+    Fields are read by position or, like ``aiosqlite.Row`` and task dicts,
+    by name, so code that only reads tasks accepts all three.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if key.__class__ is str:
+            key = FIELD_INDEX[key]
+        return tuple.__getitem__(self, key)
+
+    @property
+    def tags(self) -> list[tuple[int, str]]:
+        return tuple.__getitem__(self, TAGS_INDEX)
+
+    def to_dict(self) -> dict:
+        """Return the task in the dict shape returned by ``DatabaseManager``."""
+        task = dict(zip(TASK_FIELDS, self))
+        task["tags"] = [{"id": tag_id, "name": name} for tag_id, name in self.tags]
+        return task
+
+
+def task_record_factory(cursor: sqlite3.Cursor, row: tuple) -> TaskRecord:
+    """Row factory building a ``TaskRecord`` from a ``TASK_FIELDS`` row tuple."""
+    return tuple.__new__(TaskRecord, (*row, []))
+
+
+def _encode_value(value: Any) -> str:
+    """Encode one field value the way ``json.dumps`` does."""
+    if value.__class__ is str:
+        return encode_basestring_ascii(value)
+    if value is None:
+        return "null"
+    if value.__class__ is int:
+        return int.__repr__(value)
+    return json.dumps(value)
+
+
+def _record_template(indent: str) -> str:
+    """Return the ``%``-format template of one record at ``indent``."""
+    inner = indent + "  "
+    fields = ",".join(f"\n{inner}{json.dumps(field)}: %s" for field in RECORD_FIELDS)
+    return f"{{{fields}\n{indent}}}"
+
+
+# Records sit two levels deep: {"tasks": [{...}]}.
+RECORD_TEMPLATE = _record_template(" " * 4)
+TAG_TEMPLATE = '{\n          "id": %s,\n          "name": %s\n        }'
+TAG_SEPARATOR = ",\n        "
+
+
+def _encode_tags(tags: list[tuple[int, str]]) -> str:
+    """Encode the tags of a record at the indentation of ``RECORD_TEMPLATE``."""
+    if not tags:
+        return "[]"
+    encoded = TAG_SEPARATOR.join(
+        TAG_TEMPLATE % (_encode_value(tag_id), _encode_value(name)) for tag_id, name in tags
+    )
+    return f"[\n        {encoded}\n      ]"
+
+
+def write_records_list(fp: TextIO, records: list[TaskRecord]) -> None:
+    """Write ``records`` as a JSON list nested in a top-level object."""
+    if not records:
+        fp.write("[]")
+        return
+    fp.write("[\n    ")
+    for number, record in enumerate(records):
+        if number:
+            fp.write(",\n    ")
+        values = [_encode_value(value) for value in record]
+        values[TAGS_INDEX] = _encode_tags(record.tags)
+        fp.write(RECORD_TEMPLATE % tuple(values))
+    fp.write("\n  ]")
+
+
+def write_task_document(fp: TextIO, document: dict) -> None:
+    """Write ``document`` exactly as ``json.dumps(document, indent=2)`` would.
+
+    Lists of ``TaskRecord`` values are encoded directly from the record tuples
+    into ``fp``, without building task dicts; other values go through
+    ``json.dumps``.
+    """
+    if not document:
+        fp.write("{}")
+        return
+    fp.write("{")
+    for number, (key, value) in enumerate(document.items()):
+        fp.write(",\n  " if number else "\n  ")
+        fp.write(encode_basestring_ascii(key))
+        fp.write(": ")
+        if value.__class__ is list and value and value[0].__class__ is TaskRecord:
+            write_records_list(fp, value)
+        else:
+            fp.write(json.dumps(value, indent=2).replace("\n", "\n  "))
+    fp.write("\n}")
+
+
+def dumps_task_document(document: dict) -> str:
+    """Return ``document`` encoded by ``write_task_document``."""
+    buffer = io.StringIO()
+    write_task_document(buffer, document)
+    return buffer.getvalue()
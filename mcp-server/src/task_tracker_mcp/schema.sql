@@ -19,7 +19,11 @@ CREATE TABLE IF NOT EXISTS tasks (
     project_id INTEGER REFERENCES projects(id) ON DELETE SET NULL,
     due_date DATE,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- Listing sort key (high priority first, undated first). Keep in sync with
+    -- GENERATED_COLUMNS in database.py.
+    priority_rank INTEGER GENERATED ALWAYS AS (priority != 'high') VIRTUAL,
+    due_key TEXT GENERATED ALWAYS AS (COALESCE(due_date, '')) VIRTUAL
 );
 
 -- Tags table
@@ -36,31 +40,142 @@ CREATE TABLE IF NOT EXISTS task_tags (
     PRIMARY KEY (task_id, tag_id)
 );
 
--- Full-text search index for tasks
+-- Task totals by status and priority, kept current by the task_counters_*
+-- triggers. Rows: ('total', ''), ('status', <status>), ('priority', <priority>).
+CREATE TABLE IF NOT EXISTS task_counters (
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (kind, value)
+) WITHOUT ROWID;
+
+-- Full-text search index for tasks. Stores its own copy of title, description
+-- and the space-separated tag names so snippet() works and tags are searchable
+-- without a join. Prefix indexes keep 2- and 3-character prefix queries fast.
 CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
     title,
     description,
-    content=tasks,
-    content_rowid=id
+    tags,
+    prefix='2 3'
 );
 
 -- Triggers to keep FTS index in sync
 CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
-  INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+  INSERT INTO tasks_fts(rowid, title, description, tags)
+  VALUES (new.id, new.title, new.description, '');
 END;
 
-CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE ON tasks BEGIN
-  INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES('delete', old.id, old.title, old.description);
-  INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN
+  UPDATE tasks_fts SET title = new.title, description = new.description
+  WHERE rowid = old.id;
 END;
 
 CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
-  INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES('delete', old.id, old.title, old.description);
+  DELETE FROM tasks_fts WHERE rowid = old.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS tasks_fts_tag_insert AFTER INSERT ON task_tags BEGIN
+  UPDATE tasks_fts SET tags = (
+    SELECT group_concat(tg.name, ' ') FROM task_tags tt
+    JOIN tags tg ON tg.id = tt.tag_id
+    WHERE tt.task_id = new.task_id
+  ) WHERE rowid = new.task_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS tasks_fts_tag_delete AFTER DELETE ON task_tags BEGIN
+  UPDATE tasks_fts SET tags = (
+    SELECT group_concat(tg.name, ' ') FROM task_tags tt
+    JOIN tags tg ON tg.id = tt.tag_id
+    WHERE tt.task_id = old.task_id
+  ) WHERE rowid = old.task_id;
+END;
+
+-- Triggers to keep task counters in sync
+CREATE TRIGGER IF NOT EXISTS task_counters_insert AFTER INSERT ON tasks BEGIN
+  UPDATE task_counters SET count = count + 1
+  WHERE kind = 'total'
+     OR (kind = 'status' AND value = new.status)
+     OR (kind = 'priority' AND value = new.priority);
+END;
+
+CREATE TRIGGER IF NOT EXISTS task_counters_update AFTER UPDATE OF status, priority ON tasks
+WHEN old.status IS NOT new.status OR old.priority IS NOT new.priority BEGIN
+  UPDATE task_counters SET count = count - 1
+  WHERE (kind = 'status' AND value = old.status)
+     OR (kind = 'priority' AND value = old.priority);
+  UPDATE task_counters SET count = count + 1
+  WHERE (kind = 'status' AND value = new.status)
+     OR (kind = 'priority' AND value = new.priority);
+END;
+
+CREATE TRIGGER IF NOT EXISTS task_counters_delete AFTER DELETE ON tasks BEGIN
+  UPDATE task_counters SET count = count - 1
+  WHERE kind = 'total'
+     OR (kind = 'status' AND value = old.status)
+     OR (kind = 'priority' AND value = old.priority);
+END;
+
+-- Change feed: one row per write to a task, a project or a task's tags, in
+-- commit order. AUTOINCREMENT keeps seq increasing after old rows are compacted.
+-- Tag changes are recorded as updates of the task. op 'reset' (entity 'all')
+-- marks bulk loads that bypass the triggers; clients must re-read everything.
+CREATE TABLE IF NOT EXISTS changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    entity TEXT NOT NULL,
+    entity_id INTEGER NOT NULL,
+    op TEXT NOT NULL,
+    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TRIGGER IF NOT EXISTS changes_task_insert AFTER INSERT ON tasks BEGIN
+  INSERT INTO changes (entity, entity_id, op) VALUES ('task', new.id, 'insert');
 END;
 
--- Indexes for common queries
-CREATE INDEX IF NOT EXISTS idx_tasks_project_id ON tasks(project_id);
-CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
-CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks(priority);
+CREATE TRIGGER IF NOT EXISTS changes_task_update AFTER UPDATE ON tasks BEGIN
+  INSERT INTO changes (entity, entity_id, op) VALUES ('task', new.id, 'update');
+END;
+
+CREATE TRIGGER IF NOT EXISTS changes_task_delete AFTER DELETE ON tasks BEGIN
+  INSERT INTO changes (entity, entity_id, op) VALUES ('task', old.id, 'delete');
+END;
+
+CREATE TRIGGER IF NOT EXISTS changes_project_insert AFTER INSERT ON projects BEGIN
+  INSERT INTO changes (entity, entity_id, op) VALUES ('project', new.id, 'insert');
+END;
+
+CREATE TRIGGER IF NOT EXISTS changes_project_update AFTER UPDATE ON projects BEGIN
+  INSERT INTO changes (entity, entity_id, op) VALUES ('project', new.id, 'update');
+END;
+
+CREATE TRIGGER IF NOT EXISTS changes_project_delete AFTER DELETE ON projects BEGIN
+  INSERT INTO changes (entity, entity_id, op) VALUES ('project', old.id, 'delete');
+END;
+
+CREATE TRIGGER IF NOT EXISTS changes_task_tag_insert AFTER INSERT ON task_tags BEGIN
+  INSERT INTO changes (entity, entity_id, op) VALUES ('task', new.task_id, 'update');
+END;
+
+CREATE TRIGGER IF NOT EXISTS changes_task_tag_delete AFTER DELETE ON task_tags BEGIN
+  INSERT INTO changes (entity, entity_id, op) VALUES ('task', old.task_id, 'update');
+END;
+
+-- Indexes for common queries. Listing indexes end with the listing sort key
+-- (priority_rank, due_key, id) so ordered reads never need a temp sort.
 CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks(due_date);
+CREATE INDEX IF NOT EXISTS idx_tasks_open_due ON tasks(due_date)
+    WHERE status != 'completed' AND due_date IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_tasks_completed_updated ON tasks(updated_at)
+    WHERE status = 'completed';
 CREATE INDEX IF NOT EXISTS idx_task_tags_tag_id ON task_tags(tag_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_listing ON tasks(priority_rank, due_key, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_status_listing
+    ON tasks(status, priority_rank, due_key, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_priority_listing
+    ON tasks(priority, priority_rank, due_key, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_project_listing
+    ON tasks(project_id, priority_rank, due_key, id);
+
+-- Superseded by the listing indexes above
+DROP INDEX IF EXISTS idx_tasks_project_id;
+DROP INDEX IF EXISTS idx_tasks_status;
+DROP INDEX IF EXISTS idx_tasks_priority;
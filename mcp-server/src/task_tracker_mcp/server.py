@@ -2,15 +2,22 @@
 """FastMCP server for task tracking system."""
 
 import asyncio
+import io
 import json
 import logging
+import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
 
 from mcp.server.fastmcp import FastMCP
 
-from .database import DatabaseManager
+from .cache import ResourceCache
+from .database import DEFAULT_PROFILE, DatabaseManager
+from .records import dumps_task_document
+from .streaming import write_json_document
+from .workspaces import WorkspacePool
 
 # Configure logging
 logging.basicConfig(
@@ -23,8 +30,77 @@ logger = logging.getLogger(__name__)
 # Initialize FastMCP server
 mcp = FastMCP(name="task-tracker")
 
-# Initialize database manager
-db_manager = DatabaseManager("tasks.db")
+# Initialize database manager. TASK_TRACKER_READ_POOL_SIZE > 0 enables WAL mode
+# with a pool of read-only connections alongside the single writer, and
+# TASK_TRACKER_GROUP_COMMIT=1 batches concurrent writes into shared commits.
+# Statements slower than TASK_TRACKER_SLOW_QUERY_MS are logged with their plan.
+# TASK_TRACKER_ARCHIVE_AFTER_DAYS > 0 moves tasks completed that long ago to the
+# archive tables, stored in TASK_TRACKER_ARCHIVE_PATH if set. TASK_TRACKER_PROFILE
+# picks the connection tuning profile (durable, balanced, throughput, ephemeral).
+manager_options = {
+    "profile": os.environ.get("TASK_TRACKER_PROFILE", DEFAULT_PROFILE),
+    "read_pool_size": int(os.environ.get("TASK_TRACKER_READ_POOL_SIZE", "0")),
+    "group_commit": os.environ.get("TASK_TRACKER_GROUP_COMMIT", "0") == "1",
+    "slow_query_ms": float(os.environ.get("TASK_TRACKER_SLOW_QUERY_MS", "100")),
+    "archive_after_days": float(os.environ.get("TASK_TRACKER_ARCHIVE_AFTER_DAYS", "0")),
+}
+db_manager = DatabaseManager(
+    "tasks.db", archive_path=os.environ.get("TASK_TRACKER_ARCHIVE_PATH"), **manager_options
+)
+
+# Workspace mode: with TASK_TRACKER_WORKSPACE_DIR set, tools called with a
+# workspace ID use <dir>/<workspace>.db, and at most TASK_TRACKER_MAX_WORKSPACES
+# idle workspace databases stay open. Calls without a workspace use tasks.db.
+# Workspaces keep their archive tables in their own database file.
+workspace_dir = os.environ.get("TASK_TRACKER_WORKSPACE_DIR")
+workspaces = (
+    WorkspacePool(
+        workspace_dir,
+        max_open=int(os.environ.get("TASK_TRACKER_MAX_WORKSPACES", "64")),
+        **manager_options,
+    )
+    if workspace_dir
+    else None
+)
+
+
+# snapshot_database writes only below TASK_TRACKER_SNAPSHOT_DIR; unset disables it.
+snapshot_dir = os.environ.get("TASK_TRACKER_SNAPSHOT_DIR")
+
+
+@asynccontextmanager
+async def database(workspace: Optional[str] = None) -> AsyncIterator[DatabaseManager]:
+    """Yield the database for ``workspace``, or the default one for ``None``."""
+    if workspace is None:
+        yield db_manager
+        return
+    if workspaces is None:
+        raise ValueError("Workspaces are disabled; set TASK_TRACKER_WORKSPACE_DIR")
+    async with workspaces.lease(workspace) as db:
+        yield db
+
+
+def snapshot_path(path: str) -> Path:
+    """Resolve a client-supplied snapshot file name inside ``snapshot_dir``.
+
+    Raises:
+        ValueError: If snapshots are disabled, or ``path`` is absolute, contains
+            ``..`` or resolves (through symlinks) outside the snapshot directory
+            or into the workspace directory.
+    """
+    if not snapshot_dir:
+        raise ValueError("Snapshots are disabled; set TASK_TRACKER_SNAPSHOT_DIR")
+    relative = Path(path)
+    if relative.is_absolute() or ".." in relative.parts or not relative.name:
+        raise ValueError(f"Invalid snapshot path {path!r}; give a relative name without '..'")
+    root = Path(snapshot_dir).resolve()
+    target = (root / relative).resolve()
+    if not target.is_relative_to(root) or target == root:
+        raise ValueError(f"Snapshot path {path!r} leaves the snapshot directory")
+    if workspace_dir and target.is_relative_to(Path(workspace_dir).resolve()):
+        raise ValueError(f"Snapshot path {path!r} is inside the workspace directory")
+    target.parent.mkdir(parents=True, exist_ok=True)
+    return target
 
 
 # ==================== TOOLS ====================
@@ -38,6 +114,7 @@ async def create_task(
     status: str = "pending",
     project_id: int = None,
     due_date: str = None,
+    workspace: Optional[str] = None,
 ) -> str:
     """Create a new task.
 
@@ -50,37 +127,76 @@ async def create_task(
         due_date: Due date in YYYY-MM-DD format
     """
     try:
-        task = await db_manager.create_task(
-            title=title,
-            description=description,
-            priority=priority,
-            status=status,
-            project_id=project_id,
-            due_date=due_date,
-        )
-        return json.dumps(task, indent=2)
+        async with database(workspace) as db:
+            task = await db.create_task(
+                title=title,
+                description=description,
+                priority=priority,
+                status=status,
+                project_id=project_id,
+                due_date=due_date,
+            )
+            return json.dumps(task, indent=2)
     except Exception as e:
         return f"Error creating task: {str(e)}"
 
 
 @mcp.tool()
-async def get_task(task_id: int) -> str:
-    """Get a task by ID."""
+async def create_tasks(tasks: list[dict], workspace: Optional[str] = None) -> str:
+    """Create many tasks in one transaction.
+
+    Args:
+        tasks: List of task objects. Each accepts title (required), description,
+            priority, status, project_id, due_date and tags (list of tag names).
+    """
+    try:
+        async with database(workspace) as db:
+            created = await db.create_tasks(tasks)
+            return json.dumps({"count": len(created), "tasks": created}, indent=2)
+    except Exception as e:
+        return f"Error creating tasks: {str(e)}"
+
+
+@mcp.tool()
+async def get_task(
+    task_id: int, include_archived: bool = False, workspace: Optional[str] = None
+) -> str:
+    """Get a task by ID.
+
+    Set include_archived to also find completed tasks moved to the archive.
+    """
     try:
-        task = await db_manager.get_task(task_id)
-        if not task:
-            return f"Task {task_id} not found"
-        return json.dumps(task, indent=2)
+        async with database(workspace) as db:
+            task = await db.get_task(task_id, include_archived=include_archived)
+            if not task:
+                return f"Task {task_id} not found"
+            return json.dumps(task, indent=2)
     except Exception as e:
         return f"Error getting task: {str(e)}"
 
 
 @mcp.tool()
-async def list_tasks(limit: int = 50, offset: int = 0) -> str:
-    """List all tasks with pagination."""
+async def list_tasks(
+    limit: int = 50,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    workspace: Optional[str] = None,
+) -> str:
+    """List all tasks with pagination.
+
+    Pass the returned next_cursor back as cursor to fetch the following page.
+    offset is still accepted for compatibility but gets slower on deep pages.
+    """
     try:
-        tasks = await db_manager.list_tasks(limit=limit, offset=offset)
-        return json.dumps({"count": len(tasks), "tasks": tasks}, indent=2)
+        async with database(workspace) as db:
+            if offset:
+                tasks = await db.list_tasks(limit=limit, offset=offset)
+                return json.dumps({"count": len(tasks), "tasks": tasks}, indent=2)
+
+            tasks, next_cursor = await db.list_tasks_page(limit=limit, cursor=cursor, records=True)
+            return dumps_task_document(
+                {"count": len(tasks), "tasks": tasks, "next_cursor": next_cursor}
+            )
     except Exception as e:
         return f"Error listing tasks: {str(e)}"
 
@@ -93,65 +209,123 @@ async def update_task(
     status: Optional[str] = None,
     priority: Optional[str] = None,
     due_date: Optional[str] = None,
+    workspace: Optional[str] = None,
 ) -> str:
     """Update a task by ID.
 
     Supported fields: title, description, status, priority, due_date
     """
     try:
-        kwargs = {}
-        if title is not None:
-            kwargs["title"] = title
-        if description is not None:
-            kwargs["description"] = description
-        if status is not None:
-            kwargs["status"] = status
-        if priority is not None:
-            kwargs["priority"] = priority
-        if due_date is not None:
-            kwargs["due_date"] = due_date
-
-        task = await db_manager.update_task(task_id, **kwargs)
-        if not task:
-            return f"Task {task_id} not found"
-        return json.dumps(task, indent=2)
+        async with database(workspace) as db:
+            kwargs = {}
+            if title is not None:
+                kwargs["title"] = title
+            if description is not None:
+                kwargs["description"] = description
+            if status is not None:
+                kwargs["status"] = status
+            if priority is not None:
+                kwargs["priority"] = priority
+            if due_date is not None:
+                kwargs["due_date"] = due_date
+
+            task = await db.update_task(task_id, **kwargs)
+            if not task:
+                return f"Task {task_id} not found"
+            return json.dumps(task, indent=2)
     except Exception as e:
         return f"Error updating task: {str(e)}"
 
 
 @mcp.tool()
-async def delete_task(task_id: int) -> str:
+async def delete_task(task_id: int, workspace: Optional[str] = None) -> str:
     """Delete a task by ID."""
     try:
-        success = await db_manager.delete_task(task_id)
-        if success:
-            return f"Task {task_id} deleted successfully"
-        return f"Failed to delete task {task_id}"
+        async with database(workspace) as db:
+            success = await db.delete_task(task_id)
+            if success:
+                return f"Task {task_id} deleted successfully"
+            return f"Failed to delete task {task_id}"
     except Exception as e:
         return f"Error deleting task: {str(e)}"
 
 
 @mcp.tool()
-async def search_tasks(query: str) -> str:
-    """Search tasks using full-text search."""
+async def search_tasks(
+    query: str,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    include_archived: bool = False,
+    workspace: Optional[str] = None,
+) -> str:
+    """Search tasks using full-text search.
+
+    Matches titles, descriptions and tag names (FTS5 syntax, e.g. "deploy*" or
+    "tags:urgent"). Results are ranked best first and carry a highlighted snippet
+    instead of the full description. Pass the returned next_cursor back as
+    cursor to fetch the following page. Set include_archived to also search
+    archived tasks; results then carry archived_at.
+    """
     try:
-        if not query or len(query.strip()) < 2:
-            return "Search query too short (minimum 2 characters)"
-        tasks = await db_manager.search_tasks(query)
-        return json.dumps({"count": len(tasks), "tasks": tasks}, indent=2)
+        async with database(workspace) as db:
+            if not query or len(query.strip()) < 2:
+                return "Search query too short (minimum 2 characters)"
+            tasks, next_cursor = await db.search_tasks_page(
+                query, limit=limit, cursor=cursor, include_archived=include_archived
+            )
+            return json.dumps(
+                {"count": len(tasks), "tasks": tasks, "next_cursor": next_cursor}, indent=2
+            )
     except Exception as e:
         return f"Error searching tasks: {str(e)}"
 
 
 @mcp.tool()
-async def filter_tasks(**filters) -> str:
+async def filter_tasks(
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    project_id: Optional[int] = None,
+    tag_name: Optional[str] = None,
+    tags_any: Optional[list[str]] = None,
+    tags_all: Optional[list[str]] = None,
+    tags_none: Optional[list[str]] = None,
+    facets: Optional[list[str]] = None,
+    limit: Optional[int] = None,
+    workspace: Optional[str] = None,
+) -> str:
     """Filter tasks by various criteria.
 
     Supported filters: status, priority, project_id, tag_name
+
+    ``tags_any``, ``tags_all`` and ``tags_none`` keep tasks with at least one,
+    every one or none of the given tag names; ``tag_name`` is one required tag.
+
+    With ``facets`` (any of status, priority, project, tag) the result also has
+    the number of matching tasks per facet value and ``total``, the number of
+    matches; ``limit`` then caps the returned tasks but not the counts.
     """
     try:
-        tasks = await db_manager.filter_tasks(**filters)
-        return json.dumps({"count": len(tasks), "tasks": tasks}, indent=2)
+        async with database(workspace) as db:
+            filters = {
+                key: value
+                for key, value in (
+                    ("status", status),
+                    ("priority", priority),
+                    ("project_id", project_id),
+                    ("tag_name", tag_name),
+                    ("tags_any", tags_any),
+                    ("tags_all", tags_all),
+                    ("tags_none", tags_none),
+                )
+                if value is not None
+            }
+            if facets:
+                result = await db.filter_tasks_faceted(facets, limit=limit, **filters)
+                return json.dumps({"count": len(result["tasks"]), **result}, indent=2)
+            tasks = await db.filter_tasks(records=True, **filters)
+            if limit is not None:
+                tasks = tasks[:limit]
+            return dumps_task_document({"count": len(tasks), "tasks": tasks})
     except Exception as e:
         return f"Error filtering tasks: {str(e)}"
 
@@ -160,33 +334,36 @@ async def filter_tasks(**filters) -> str:
 
 
 @mcp.tool()
-async def create_project(name: str, description: str = "") -> str:
+async def create_project(name: str, description: str = "", workspace: Optional[str] = None) -> str:
     """Create a new project."""
     try:
-        project = await db_manager.create_project(name, description)
-        return json.dumps(project, indent=2)
+        async with database(workspace) as db:
+            project = await db.create_project(name, description)
+            return json.dumps(project, indent=2)
     except Exception as e:
         return f"Error creating project: {str(e)}"
 
 
 @mcp.tool()
-async def get_project(project_id: int) -> str:
+async def get_project(project_id: int, workspace: Optional[str] = None) -> str:
     """Get a project by ID."""
     try:
-        project = await db_manager.get_project(project_id)
-        if not project:
-            return f"Project {project_id} not found"
-        return json.dumps(project, indent=2)
+        async with database(workspace) as db:
+            project = await db.get_project(project_id)
+            if not project:
+                return f"Project {project_id} not found"
+            return json.dumps(project, indent=2)
     except Exception as e:
         return f"Error getting project: {str(e)}"
 
 
 @mcp.tool()
-async def list_projects() -> str:
+async def list_projects(workspace: Optional[str] = None) -> str:
     """List all projects."""
     try:
-        projects = await db_manager.list_projects()
-        return json.dumps({"count": len(projects), "projects": projects}, indent=2)
+        async with database(workspace) as db:
+            projects = await db.list_projects()
+            return json.dumps({"count": len(projects), "projects": projects}, indent=2)
     except Exception as e:
         return f"Error listing projects: {str(e)}"
 
@@ -196,41 +373,45 @@ async def update_project(
     project_id: int,
     name: Optional[str] = None,
     description: Optional[str] = None,
+    workspace: Optional[str] = None,
 ) -> str:
     """Update a project."""
     try:
-        kwargs = {}
-        if name is not None:
-            kwargs["name"] = name
-        if description is not None:
-            kwargs["description"] = description
-
-        project = await db_manager.update_project(project_id, **kwargs)
-        if not project:
-            return f"Project {project_id} not found"
-        return json.dumps(project, indent=2)
+        async with database(workspace) as db:
+            kwargs = {}
+            if name is not None:
+                kwargs["name"] = name
+            if description is not None:
+                kwargs["description"] = description
+
+            project = await db.update_project(project_id, **kwargs)
+            if not project:
+                return f"Project {project_id} not found"
+            return json.dumps(project, indent=2)
     except Exception as e:
         return f"Error updating project: {str(e)}"
 
 
 @mcp.tool()
-async def delete_project(project_id: int) -> str:
+async def delete_project(project_id: int, workspace: Optional[str] = None) -> str:
     """Delete a project."""
     try:
-        success = await db_manager.delete_project(project_id)
-        if success:
-            return f"Project {project_id} deleted successfully"
-        return f"Failed to delete project {project_id}"
+        async with database(workspace) as db:
+            success = await db.delete_project(project_id)
+            if success:
+                return f"Project {project_id} deleted successfully"
+            return f"Failed to delete project {project_id}"
     except Exception as e:
         return f"Error deleting project: {str(e)}"
 
 
 @mcp.tool()
-async def get_project_tasks(project_id: int) -> str:
+async def get_project_tasks(project_id: int, workspace: Optional[str] = None) -> str:
     """Get all tasks for a project."""
     try:
-        tasks = await db_manager.get_project_tasks(project_id)
-        return json.dumps({"count": len(tasks), "tasks": tasks}, indent=2)
+        async with database(workspace) as db:
+            tasks = await db.get_project_tasks(project_id)
+            return json.dumps({"count": len(tasks), "tasks": tasks}, indent=2)
     except Exception as e:
         return f"Error getting project tasks: {str(e)}"
 
@@ -239,83 +420,252 @@ async def get_project_tasks(project_id: int) -> str:
 
 
 @mcp.tool()
-async def add_tag(task_id: int, tag_name: str) -> str:
+async def add_tag(task_id: int, tag_name: str, workspace: Optional[str] = None) -> str:
     """Add a tag to a task."""
     try:
-        success = await db_manager.add_tag(task_id, tag_name)
-        if success:
-            task = await db_manager.get_task(task_id)
-            return json.dumps(task, indent=2)
-        return f"Failed to add tag to task {task_id}"
+        async with database(workspace) as db:
+            success = await db.add_tag(task_id, tag_name)
+            if success:
+                task = await db.get_task(task_id)
+                return json.dumps(task, indent=2)
+            return f"Failed to add tag to task {task_id}"
     except Exception as e:
         return f"Error adding tag: {str(e)}"
 
 
 @mcp.tool()
-async def remove_tag(task_id: int, tag_name: str) -> str:
+async def remove_tag(task_id: int, tag_name: str, workspace: Optional[str] = None) -> str:
     """Remove a tag from a task."""
     try:
-        success = await db_manager.remove_tag(task_id, tag_name)
-        if success:
-            task = await db_manager.get_task(task_id)
-            return json.dumps(task, indent=2)
-        return f"Failed to remove tag from task {task_id}"
+        async with database(workspace) as db:
+            success = await db.remove_tag(task_id, tag_name)
+            if success:
+                task = await db.get_task(task_id)
+                return json.dumps(task, indent=2)
+            return f"Failed to remove tag from task {task_id}"
     except Exception as e:
         return f"Error removing tag: {str(e)}"
 
 
 @mcp.tool()
-async def list_tags() -> str:
+async def add_tags(
+    task_ids: list[int],
+    tag_names: list[str],
+    workspace: Optional[str] = None,
+) -> str:
+    """Add every listed tag to every listed task in one transaction."""
+    try:
+        async with database(workspace) as db:
+            added = await db.add_tags(task_ids, tag_names)
+            return json.dumps(
+                {"task_ids": task_ids, "tag_names": tag_names, "added": added}, indent=2
+            )
+    except Exception as e:
+        return f"Error adding tags: {str(e)}"
+
+
+@mcp.tool()
+async def remove_tags(
+    task_ids: list[int],
+    tag_names: list[str],
+    workspace: Optional[str] = None,
+) -> str:
+    """Remove every listed tag from every listed task in one transaction."""
+    try:
+        async with database(workspace) as db:
+            removed = await db.remove_tags(task_ids, tag_names)
+            return json.dumps(
+                {"task_ids": task_ids, "tag_names": tag_names, "removed": removed or 0}, indent=2
+            )
+    except Exception as e:
+        return f"Error removing tags: {str(e)}"
+
+
+@mcp.tool()
+async def list_tags(workspace: Optional[str] = None) -> str:
     """List all tags."""
     try:
-        tags = await db_manager.list_tags()
-        return json.dumps({"count": len(tags), "tags": tags}, indent=2)
+        async with database(workspace) as db:
+            tags = await db.list_tags()
+            return json.dumps({"count": len(tags), "tags": tags}, indent=2)
     except Exception as e:
         return f"Error listing tags: {str(e)}"
 
 
+# ==================== BATCH OPERATIONS ====================
+
+
+@mcp.tool()
+async def execute_batch(operations: list[dict], workspace: Optional[str] = None) -> str:
+    """Run several write operations atomically: all of them apply or none do.
+
+    Args:
+        operations: List of {"op": name, "args": {...}} objects. name is one of
+            create_project, update_project, delete_project, create_task,
+            create_tasks, update_task, delete_task, add_tag, remove_tag,
+            add_tags or remove_tags; args are that tool's arguments. A string
+            argument "$<index>.<field>" refers to an earlier result, e.g.
+            "$0.id" for the ID of the project created by the first operation.
+    """
+    try:
+        async with database(workspace) as db:
+            results = await db.execute_batch(operations)
+            return json.dumps({"count": len(results), "results": results}, indent=2)
+    except Exception as e:
+        return f"Error executing batch (no changes were applied): {str(e)}"
+
+
+# ==================== SYNC OPERATIONS ====================
+
+
+@mcp.tool()
+async def changes_since(seq: int = 0, limit: int = 100, workspace: Optional[str] = None) -> str:
+    """Get task, project and tag changes made after a change feed position.
+
+    Call with seq=0 first, then pass back next_seq to receive only new changes.
+    If reset_required is true, re-read all tasks and projects, then continue
+    from next_seq.
+
+    Args:
+        seq: Last change sequence number already applied
+        limit: Maximum number of changes to return (default: 100)
+    """
+    try:
+        async with database(workspace) as db:
+            page = await db.changes_since(seq, limit)
+            return json.dumps(page, indent=2)
+    except Exception as e:
+        return f"Error reading changes: {str(e)}"
+
+
 # ==================== ANALYTICS OPERATIONS ====================
 
 
 @mcp.tool()
-async def task_statistics() -> str:
+async def task_statistics(workspace: Optional[str] = None) -> str:
     """Get task statistics."""
     try:
-        stats = await db_manager.get_task_statistics()
-        return json.dumps(stats, indent=2)
+        async with database(workspace) as db:
+            stats = await db.get_task_statistics()
+            return json.dumps(stats, indent=2)
     except Exception as e:
         return f"Error getting statistics: {str(e)}"
 
 
 @mcp.tool()
-async def get_overdue_tasks() -> str:
+async def get_overdue_tasks(workspace: Optional[str] = None) -> str:
     """Get all overdue tasks."""
     try:
-        tasks = await db_manager.get_overdue_tasks()
-        return json.dumps({"count": len(tasks), "tasks": tasks}, indent=2)
+        async with database(workspace) as db:
+            tasks = await db.get_overdue_tasks()
+            return json.dumps({"count": len(tasks), "tasks": tasks}, indent=2)
     except Exception as e:
         return f"Error getting overdue tasks: {str(e)}"
 
 
+@mcp.tool()
+async def get_due_soon_tasks(hours: float = 24, workspace: Optional[str] = None) -> str:
+    """Get open tasks that become overdue within the next N hours."""
+    try:
+        async with database(workspace) as db:
+            tasks = await db.get_due_soon_tasks(hours)
+            return json.dumps({"count": len(tasks), "tasks": tasks}, indent=2)
+    except Exception as e:
+        return f"Error getting tasks due soon: {str(e)}"
+
+
+# ==================== ADMIN OPERATIONS ====================
+
+
+@mcp.tool()
+async def snapshot_database(path: str, workspace: Optional[str] = None) -> str:
+    """Back up the live database to a file without stopping the server.
+
+    Copies the database incrementally with the SQLite backup API while other
+    tools keep running. Progress of a running snapshot is available from the
+    stats://snapshot resource.
+
+    Args:
+        path: Destination file name, relative to the server's snapshot directory
+            (TASK_TRACKER_SNAPSHOT_DIR). An existing snapshot there is replaced;
+            other files are never overwritten.
+    """
+    try:
+        target = snapshot_path(path)
+        async with database(workspace) as db:
+            result = await db.snapshot(str(target))
+            return json.dumps(result, indent=2)
+    except Exception as e:
+        return f"Error creating snapshot: {str(e)}"
+
+
 # ==================== RESOURCES ====================
 
+# Serialized bodies of the resources below, reused while the data version is unchanged.
+resource_cache = ResourceCache()
+
+
+async def cached_resource(
+    uri: str, render: Callable[[], Awaitable[Any]], key: Optional[str] = None
+) -> str:
+    """Return the JSON body of ``uri``, rendering it only if the data changed.
+
+    ``render`` produces the body, wrapped as ``{key: result}`` when ``key`` is
+    given. The body carries the data ``version``; clients can compare it with
+    ``stats://version`` to skip re-reading the resource.
+    """
+    version = await db_manager.data_version()
+    body = resource_cache.get(uri, version)
+    if body is None:
+        result = await render()
+        document = {key: result} if key else dict(result)
+        body = dumps_task_document({**document, "version": version})
+        resource_cache.put(uri, version, body)
+    return body
+
 
 @mcp.resource("task://all")
 async def all_tasks_resource() -> str:
-    """Access all tasks as a resource."""
+    """Access all tasks as a resource (first page; follow next_cursor)."""
     try:
-        tasks = await db_manager.list_tasks(limit=1000)
-        return json.dumps({"tasks": tasks}, indent=2)
+        tasks, next_cursor = await db_manager.list_tasks_page(limit=1000, records=True)
+        return dumps_task_document({"tasks": tasks, "next_cursor": next_cursor})
     except Exception as e:
         return f"Error retrieving tasks: {str(e)}"
 
 
+@mcp.resource("task://all/{cursor}")
+async def all_tasks_page_resource(cursor: str) -> str:
+    """Access the page of all tasks that starts after cursor."""
+    try:
+        tasks, next_cursor = await db_manager.list_tasks_page(
+            limit=1000, cursor=cursor, records=True
+        )
+        return dumps_task_document({"tasks": tasks, "next_cursor": next_cursor})
+    except Exception as e:
+        return f"Error retrieving tasks: {str(e)}"
+
+
+@mcp.resource("task://export")
+async def export_tasks_resource() -> str:
+    """Access every task as a resource, encoded incrementally."""
+    try:
+        buffer = io.StringIO()
+        await write_json_document(buffer, "tasks", db_manager.iter_tasks())
+        return buffer.getvalue()
+    except Exception as e:
+        return f"Error exporting tasks: {str(e)}"
+
+
 @mcp.resource("task://pending")
 async def pending_tasks_resource() -> str:
     """Access pending tasks as a resource."""
     try:
-        tasks = await db_manager.filter_tasks(status="pending")
-        return json.dumps({"tasks": tasks}, indent=2)
+        return await cached_resource(
+            "task://pending",
+            lambda: db_manager.filter_tasks(status="pending", records=True),
+            "tasks",
+        )
     except Exception as e:
         return f"Error retrieving pending tasks: {str(e)}"
 
@@ -324,8 +674,11 @@ async def pending_tasks_resource() -> str:
 async def high_priority_tasks_resource() -> str:
     """Access high-priority tasks as a resource."""
     try:
-        tasks = await db_manager.filter_tasks(priority="high")
-        return json.dumps({"tasks": tasks}, indent=2)
+        return await cached_resource(
+            "task://high-priority",
+            lambda: db_manager.filter_tasks(priority="high", records=True),
+            "tasks",
+        )
     except Exception as e:
         return f"Error retrieving high-priority tasks: {str(e)}"
 
@@ -334,8 +687,7 @@ async def high_priority_tasks_resource() -> str:
 async def all_projects_resource() -> str:
     """Access all projects as a resource."""
     try:
-        projects = await db_manager.list_projects()
-        return json.dumps({"projects": projects}, indent=2)
+        return await cached_resource("project://all", db_manager.list_projects, "projects")
     except Exception as e:
         return f"Error retrieving projects: {str(e)}"
 
@@ -344,12 +696,60 @@ async def all_projects_resource() -> str:
 async def stats_summary_resource() -> str:
     """Access task statistics summary as a resource."""
     try:
-        stats = await db_manager.get_task_statistics()
-        return json.dumps(stats, indent=2)
+        return await cached_resource("stats://summary", db_manager.get_task_statistics)
     except Exception as e:
         return f"Error retrieving statistics: {str(e)}"
 
 
+@mcp.resource("stats://cache")
+async def cache_stats_resource() -> str:
+    """Access entity cache hit/miss counters as a resource."""
+    try:
+        stats = {**db_manager.cache_stats(), "resources": resource_cache.stats()}
+        return json.dumps(stats, indent=2)
+    except Exception as e:
+        return f"Error retrieving cache statistics: {str(e)}"
+
+
+@mcp.resource("stats://version")
+async def data_version_resource() -> str:
+    """Access the current data version, an ETag for the cached resources."""
+    try:
+        return json.dumps({"version": await db_manager.data_version()}, indent=2)
+    except Exception as e:
+        return f"Error retrieving data version: {str(e)}"
+
+
+@mcp.resource("stats://queries")
+async def query_stats_resource() -> str:
+    """Access per-statement timing counters and the slow-query log."""
+    try:
+        stats = db_manager.query_stats() or {"enabled": False}
+        return json.dumps(stats, indent=2)
+    except Exception as e:
+        return f"Error retrieving query statistics: {str(e)}"
+
+
+@mcp.resource("stats://workspaces")
+async def workspace_stats_resource() -> str:
+    """Access open/evicted counts of the workspace database pool."""
+    try:
+        stats = workspaces.stats() if workspaces else {"enabled": False}
+        return json.dumps(stats, indent=2)
+    except Exception as e:
+        return f"Error retrieving workspace statistics: {str(e)}"
+
+
+@mcp.resource("stats://snapshot")
+async def snapshot_progress_resource() -> str:
+    """Access progress and throughput of the running or last snapshot."""
+    try:
+        progress = db_manager.snapshot_progress() or {"state": "idle"}
+        return json.dumps(progress, indent=2)
+    except Exception as e:
+        return f"Error retrieving snapshot progress: {str(e)}"
+
+
 # ==================== PROMPTS ====================
 
 
@@ -479,6 +879,8 @@ async def startup() -> None:
 async def shutdown() -> None:
     """Close database on shutdown."""
     logger.info("Shutting down task tracker MCP server...")
+    if workspaces:
+        await workspaces.close()
     await db_manager.close()
     logger.info("Database closed")
 
@@ -0,0 +1,110 @@
+"""Incremental JSON, NDJSON and CSV encoding for large task result sets."""
+
+import csv
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Iterator, Sequence, TextIO
+
+# Record formats understood by write_records/read_records.
+RECORD_FORMATS = ("ndjson", "csv")
+
+# Separator for list values (task tags) inside a single CSV cell.
+CSV_LIST_SEPARATOR = ";"
+
+
+async def iter_json_document(
+    key: str, items: AsyncIterable[Any], indent: int = 2
+) -> AsyncIterator[str]:
+    """Encode ``{key: [items...]}`` chunk by chunk.
+
+    Yields one chunk per item, so only the item being encoded is held in memory.
+    The concatenated output is identical to ``json.dumps({key: list(items)},
+    indent=indent)``.
+    """
+    pad = " " * indent
+    item_pad = "\n" + pad * 2
+
+    yield "{\n" + pad + json.dumps(key) + ": ["
+    empty = True
+    async for item in items:
+        encoded = json.dumps(item, indent=indent).replace("\n", item_pad)
+        yield ("" if empty else ",") + item_pad + encoded
+        empty = False
+    yield ("]" if empty else "\n" + pad + "]") + "\n}"
+
+
+async def write_json_document(
+    fp: TextIO, key: str, items: AsyncIterable[Any], indent: int = 2
+) -> None:
+    """Write ``{key: [items...]}`` to ``fp`` without building it in memory."""
+    async for chunk in iter_json_document(key, items, indent=indent):
+        fp.write(chunk)
+
+
+async def write_records(
+    fp: TextIO, fmt: str, fields: Sequence[str], items: AsyncIterable[dict]
+) -> int:
+    """Write ``items`` to ``fp`` as NDJSON or CSV, one record at a time.
+
+    NDJSON records are compact JSON objects limited to ``fields``. CSV starts
+    with a ``fields`` header row, writes ``None`` as an empty cell and joins
+    list values with ``CSV_LIST_SEPARATOR``.
+
+    Returns:
+        The number of records written.
+    """
+    count = 0
+    if fmt == "ndjson":
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        async for item in items:
+            fp.write(encode({field: item.get(field) for field in fields}))
+            fp.write("\n")
+            count += 1
+    elif fmt == "csv":
+        writer = csv.writer(fp, lineterminator="\n")
+        writer.writerow(fields)
+        async for item in items:
+            writer.writerow([_csv_cell(item.get(field)) for field in fields])
+            count += 1
+    else:
+        raise ValueError(f"Unknown format {fmt!r}; expected one of {RECORD_FORMATS}")
+    return count
+
+
+def read_records(fp: TextIO, fmt: str, list_fields: Sequence[str] = ()) -> Iterator[dict]:
+    """Yield records from an NDJSON or CSV stream written by ``write_records``.
+
+    Blank NDJSON lines are skipped. CSV cells stay strings, except that the
+    cells of ``list_fields`` are split back into lists.
+
+    Raises:
+        ValueError: If ``fmt`` is unknown or an NDJSON line is not an object.
+    """
+    if fmt == "ndjson":
+        decode = json.JSONDecoder().decode
+        for line_number, line in enumerate(fp, 1):
+            if not line.strip():
+                continue
+            try:
+                record = decode(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Line {line_number}: invalid JSON: {e}") from e
+            if not isinstance(record, dict):
+                raise ValueError(f"Line {line_number}: expected a JSON object")
+            yield record
+    elif fmt == "csv":
+        for record in csv.DictReader(fp):
+            for field in list_fields:
+                cell = record.get(field)
+                record[field] = cell.split(CSV_LIST_SEPARATOR) if cell else []
+            yield record
+    else:
+        raise ValueError(f"Unknown format {fmt!r}; expected one of {RECORD_FORMATS}")
+
+
+def _csv_cell(value: Any) -> Any:
+    """Convert a record value to a CSV cell."""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return CSV_LIST_SEPARATOR.join(str(v) for v in value)
+    return value
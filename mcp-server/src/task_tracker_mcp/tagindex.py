@@ -0,0 +1,135 @@
+"""In-memory tag membership index of tasks."""
+
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Optional
+
+# Batches at least this fraction of a tag's size are merged by rebuilding the
+# array instead of inserting or deleting one ID at a time.
+REBUILD_RATIO = 0.125
+
+
+def _contains(ids: array, task_id: int) -> bool:
+    """Return whether the sorted ``ids`` contain ``task_id``."""
+    i = bisect_left(ids, task_id)
+    return i < len(ids) and ids[i] == task_id
+
+
+def _intersect(a: array, b: array) -> array:
+    """Return the sorted IDs in both ``a`` and ``b``.
+
+    Probes the larger set by binary search for each ID of the smaller one.
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    return array("q", (task_id for task_id in a if _contains(b, task_id)))
+
+
+class TagIndex:
+    """Sorted task-ID set per tag name.
+
+    Each tag's tasks are kept in an ascending ``array('q')``: 8 bytes per link
+    and no per-ID objects. Any/all/none tag filters are answered with set
+    operations on these arrays, so SQLite only has to read the matching rows.
+    The index holds what has been committed through the owning
+    ``DatabaseManager``; writes by other processes need ``load()`` again.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, array] = {}
+
+    def __len__(self) -> int:
+        return sum(len(ids) for ids in self._tasks.values())
+
+    def load(self, links: Iterable[tuple[str, int]]) -> None:
+        """Replace the index with ``(tag_name, task_id)`` pairs in task ID order."""
+        tasks: dict[str, array] = {}
+        for tag_name, task_id in links:
+            ids = tasks.get(tag_name)
+            if ids is None:
+                ids = tasks[tag_name] = array("q")
+            ids.append(task_id)
+        self._tasks = tasks
+
+    def add(self, tag_name: str, task_ids: Iterable[int]) -> None:
+        """Record that the tasks in ``task_ids`` have ``tag_name``."""
+        ids = self._tasks.get(tag_name)
+        new_ids = sorted(set(task_ids))
+        if ids is None:
+            if new_ids:
+                self._tasks[tag_name] = array("q", new_ids)
+            return
+        if len(new_ids) >= len(ids) * REBUILD_RATIO:
+            self._tasks[tag_name] = array("q", sorted(set(ids).union(new_ids)))
+            return
+        for task_id in new_ids:
+            i = bisect_left(ids, task_id)
+            if i == len(ids) or ids[i] != task_id:
+                ids.insert(i, task_id)
+
+    def remove(self, tag_name: str, task_ids: Iterable[int]) -> None:
+        """Record that the tasks in ``task_ids`` no longer have ``tag_name``."""
+        ids = self._tasks.get(tag_name)
+        if ids is None:
+            return
+        old_ids = set(task_ids)
+        if len(old_ids) >= len(ids) * REBUILD_RATIO:
+            ids = array("q", (task_id for task_id in ids if task_id not in old_ids))
+            self._tasks[tag_name] = ids
+        else:
+            for task_id in old_ids:
+                i = bisect_left(ids, task_id)
+                if i < len(ids) and ids[i] == task_id:
+                    del ids[i]
+        if not ids:
+            del self._tasks[tag_name]
+
+    def discard_tasks(self, task_ids: Iterable[int]) -> None:
+        """Remove the tasks in ``task_ids`` from every tag."""
+        task_ids = list(task_ids)
+        for tag_name in list(self._tasks):
+            self.remove(tag_name, task_ids)
+
+    def tasks_with_any(self, tag_names: Iterable[str]) -> array:
+        """Return the sorted IDs of tasks with at least one of ``tag_names``."""
+        sets = [self._tasks[name] for name in set(tag_names) if name in self._tasks]
+        if len(sets) == 1:
+            return array("q", sets[0])
+        return array("q", sorted(set().union(*sets)))
+
+    def match(
+        self,
+        any_of: Iterable[str] = (),
+        all_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+    ) -> Optional[array]:
+        """Return the sorted IDs of tasks matching the tag conditions.
+
+        Args:
+            any_of: Tasks must have at least one of these tags.
+            all_of: Tasks must have every one of these tags.
+            none_of: Tasks must have none of these tags.
+
+        Returns:
+            The matching IDs, or ``None`` without an ``any_of``/``all_of``
+            condition, since the index does not know untagged tasks.
+        """
+        any_of, all_of = set(any_of), set(all_of)
+        if not any_of and not all_of:
+            return None
+
+        # Intersect smallest first so every step probes the shortest result.
+        sets = [self._tasks.get(name, array("q")) for name in all_of]
+        if any_of:
+            sets.append(self.tasks_with_any(any_of))
+        sets.sort(key=len)
+        result = array("q", sets[0])
+        for ids in sets[1:]:
+            if not result:
+                break
+            result = _intersect(result, ids)
+
+        excluded = self.tasks_with_any(none_of)
+        if excluded and result:
+            result = array("q", (i for i in result if not _contains(excluded, i)))
+        return result
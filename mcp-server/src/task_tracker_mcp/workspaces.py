@@ -0,0 +1,119 @@
+"""LRU pool of per-workspace task databases."""
+
+import asyncio
+import logging
+import re
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+from .database import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+# Workspace IDs double as file names, so they are restricted to a safe alphabet.
+WORKSPACE_ID = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$")
+
+
+class WorkspacePool:
+    """Open ``DatabaseManager`` instances for many workspaces, one file each.
+
+    Each workspace ``<id>`` is stored in ``<directory>/<id>.db``. At most
+    ``max_open`` managers stay open; opening another closes the least recently
+    used one that no caller is using, so file handles, connection threads and
+    caches stay bounded however many workspaces exist.
+    """
+
+    def __init__(self, directory: str, max_open: int = 64, **manager_options: Any):
+        """Initialize the pool.
+
+        Args:
+            directory: Directory holding the workspace database files.
+            max_open: Maximum number of idle workspaces kept open.
+            manager_options: Keyword arguments for every ``DatabaseManager``.
+        """
+        self.directory = Path(directory)
+        self.max_open = max_open
+        self.manager_options = manager_options
+        self._open: OrderedDict[str, DatabaseManager] = OrderedDict()
+        self._leases: dict[str, int] = {}
+        self._opening: dict[str, asyncio.Task] = {}
+        self._opens = 0
+        self._evictions = 0
+
+    @asynccontextmanager
+    async def lease(self, workspace_id: str) -> AsyncIterator[DatabaseManager]:
+        """Yield the workspace's database manager, opening it if needed.
+
+        The manager is not closed by eviction while the block runs.
+
+        Raises:
+            ValueError: If ``workspace_id`` is not a valid workspace ID.
+        """
+        if not WORKSPACE_ID.match(workspace_id):
+            raise ValueError(f"Invalid workspace ID {workspace_id!r}")
+
+        while (manager := self._open.get(workspace_id)) is None:
+            opening = self._opening.get(workspace_id)
+            if opening is None:
+                opening = asyncio.create_task(self._open_workspace(workspace_id))
+                self._opening[workspace_id] = opening
+                opening.add_done_callback(lambda _: self._opening.pop(workspace_id, None))
+            await asyncio.shield(opening)
+
+        self._open.move_to_end(workspace_id)
+        self._leases[workspace_id] = self._leases.get(workspace_id, 0) + 1
+        try:
+            await self._evict()
+            yield manager
+        finally:
+            self._leases[workspace_id] -= 1
+            if not self._leases[workspace_id]:
+                del self._leases[workspace_id]
+            await self._evict()
+
+    async def close(self) -> None:
+        """Close every open workspace."""
+        for opening in list(self._opening.values()):
+            await asyncio.gather(opening, return_exceptions=True)
+        while self._open:
+            _, manager = self._open.popitem(last=False)
+            await manager.close()
+
+    def stats(self) -> dict:
+        """Get open, leased, opened and evicted workspace counts."""
+        return {
+            "open": len(self._open),
+            "max_open": self.max_open,
+            "leased": len(self._leases),
+            "opens": self._opens,
+            "evictions": self._evictions,
+        }
+
+    async def _open_workspace(self, workspace_id: str) -> None:
+        """Create and initialize the manager for ``workspace_id``."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        manager = DatabaseManager(
+            str(self.directory / f"{workspace_id}.db"), **self.manager_options
+        )
+        try:
+            await manager.initialize()
+        except Exception:
+            await manager.close()
+            raise
+        self._open[workspace_id] = manager
+        self._opens += 1
+        logger.info(f"Opened workspace {workspace_id}")
+
+    async def _evict(self) -> None:
+        """Close least recently used idle workspaces beyond ``max_open``."""
+        while len(self._open) > self.max_open:
+            idle = next((w for w in self._open if w not in self._leases), None)
+            if idle is None:
+                # Everything is in use; retry when a lease is released.
+                return
+            manager = self._open.pop(idle)
+            self._evictions += 1
+            await manager.close()
+            logger.info(f"Closed idle workspace {idle}")
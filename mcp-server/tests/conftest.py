@@ -0,0 +1,46 @@
+"""Shared DatabaseManager fixtures."""
+
+import pytest
+
+from task_tracker_mcp.database import DatabaseManager
+
+
+@pytest.fixture
+async def open_db(tmp_path):
+    """Return a function opening a fresh DatabaseManager, closed after the test."""
+    managers: list[DatabaseManager] = []
+
+    async def open_manager(name: str = "tasks.db", **options) -> DatabaseManager:
+        manager = DatabaseManager(str(tmp_path / name), **options)
+        await manager.initialize()
+        managers.append(manager)
+        return manager
+
+    yield open_manager
+    for manager in managers:
+        await manager.close()
+
+
+@pytest.fixture
+async def db(open_db):
+    """A database with 4 projects and 500 tasks spread over every filter value.
+
+    Task ``i`` has tag ``tag-{i % 4}`` and, when ``i`` is odd, ``tag-odd``.
+    """
+    manager = await open_db()
+    for i in range(1, 5):
+        await manager.create_project(f"Project {i}")
+    await manager.create_tasks(
+        [
+            {
+                "title": f"Task {i}",
+                "status": ("pending", "in_progress", "completed", "blocked")[i % 4],
+                "priority": ("low", "medium", "high")[i % 3],
+                "project_id": i % 5 or None,
+                "due_date": f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}" if i % 7 else None,
+                "tags": [f"tag-{i % 4}"] + (["tag-odd"] if i % 2 else []),
+            }
+            for i in range(500)
+        ]
+    )
+    return manager
@@ -0,0 +1,62 @@
+"""Archiving completed tasks, in the main database or an attached file."""
+
+import pytest
+
+ARCHIVE_SETUPS = {
+    "main": {},
+    "attached": {"archive_path": "archive.db"},
+    "attached-read-pool": {"archive_path": "archive.db", "read_pool_size": 2},
+}
+
+
+@pytest.fixture(params=list(ARCHIVE_SETUPS))
+async def db(request, open_db, tmp_path):
+    options = dict(ARCHIVE_SETUPS[request.param], change_retention_hours=0)
+    if "archive_path" in options:
+        options["archive_path"] = str(tmp_path / options["archive_path"])
+    manager = await open_db(**options)
+    await manager.create_tasks(
+        [{"title": f"Deploy step {i}", "tags": ["release"]} for i in range(1, 7)]
+    )
+    for task_id in (1, 2, 3):
+        await manager.update_task(task_id, status="completed")
+    # Only tasks 1 and 2 are old enough to archive.
+    await manager.connection.execute(
+        "UPDATE tasks SET updated_at = datetime('now', '-40 days') WHERE id IN (1, 2)"
+    )
+    await manager.connection.commit()
+    return manager
+
+
+async def test_archive_moves_old_completed_tasks(db):
+    assert (await db.get_task(1))["status"] == "completed"
+
+    assert await db.archive_tasks(older_than_days=30) == 2
+    assert await db.archive_tasks(older_than_days=30) == 0
+
+    assert [task["id"] for task in await db.list_tasks()] == [3, 4, 5, 6]
+    assert [task["id"] for task in await db.filter_tasks(tag_name="release")] == [3, 4, 5, 6]
+    assert (await db.get_task_statistics())["completed"] == 1
+
+
+async def test_archived_task_leaves_the_cache(db):
+    assert (await db.get_task(1))["title"] == "Deploy step 1"
+    await db.archive_tasks(older_than_days=30)
+
+    assert await db.get_task(1) is None
+    archived = await db.get_task(1, include_archived=True)
+    assert archived["title"] == "Deploy step 1"
+    assert archived["archived_at"]
+    assert [tag["name"] for tag in archived["tags"]] == ["release"]
+    assert (await db.get_task(3, include_archived=True)).get("archived_at") is None
+
+
+async def test_search_reads_the_archive_only_when_asked(db):
+    await db.archive_tasks(older_than_days=30)
+
+    active, _ = await db.search_tasks_page("deploy", limit=10)
+    assert sorted(task["id"] for task in active) == [3, 4, 5, 6]
+
+    everything, _ = await db.search_tasks_page("deploy", limit=10, include_archived=True)
+    assert sorted(task["id"] for task in everything) == [1, 2, 3, 4, 5, 6]
+    assert {task["id"] for task in everything if task["archived_at"]} == {1, 2}
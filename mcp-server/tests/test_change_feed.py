@@ -0,0 +1,64 @@
+"""Change feed paging, limits and gap detection."""
+
+import pytest
+
+from task_tracker_mcp.database import DatabaseManager
+
+
+async def read_feed(db: DatabaseManager, seq: int, limit: int) -> tuple[list[dict], list[dict]]:
+    """Page through the feed from ``seq``; return the changes and every page."""
+    changes, pages = [], []
+    while True:
+        page = await db.changes_since(seq, limit)
+        pages.append(page)
+        changes.extend(page["changes"])
+        seq = page["next_seq"]
+        if not page["has_more"]:
+            return changes, pages
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+async def test_limit_below_one_is_rejected(open_db, limit):
+    db = await open_db()
+    with pytest.raises(ValueError, match="limit"):
+        await db.changes_since(0, limit)
+
+
+async def test_pages_cover_every_change_once(open_db):
+    db = await open_db()
+    for i in range(5):
+        await db.create_task(f"Task {i}")
+    task = await db.update_task(1, status="completed")
+    assert task["status"] == "completed"
+
+    changes, pages = await read_feed(db, 0, 2)
+    assert [change["seq"] for change in changes] == list(range(1, 7))
+    assert [(c["entity_id"], c["op"]) for c in changes][-2:] == [(5, "insert"), (1, "update")]
+    assert [page["has_more"] for page in pages] == [True, True, False]
+    assert not any(page["reset_required"] for page in pages)
+
+    current = await db.changes_since(6, 2)
+    assert current == {"changes": [], "next_seq": 6, "has_more": False, "reset_required": False}
+
+
+async def test_compacted_gap_requires_reset(open_db):
+    db = await open_db()
+    for i in range(6):
+        await db.create_task(f"Task {i}")
+    await db.connection.execute(
+        "UPDATE changes SET changed_at = datetime('now', '-2 days') WHERE seq <= 4"
+    )
+    await db.connection.commit()
+    assert await db.compact_changes(retention_hours=24) == 4
+
+    page = await db.changes_since(2, 10)
+    assert page == {"changes": [], "next_seq": 4, "has_more": False, "reset_required": True}
+    changes, _ = await read_feed(db, page["next_seq"], 10)
+    assert [change["seq"] for change in changes] == [5, 6]
+
+
+async def test_position_past_the_feed_requires_reset(open_db):
+    db = await open_db()
+    await db.create_task("Only task")
+    page = await db.changes_since(50, 10)
+    assert page["reset_required"] and page["next_seq"] == 1
@@ -0,0 +1,83 @@
+"""Bulk import and export through the command line."""
+
+import asyncio
+
+import pytest
+
+from task_tracker_mcp.cli import main
+from task_tracker_mcp.database import DatabaseManager
+
+
+def with_db(path, operation):
+    """Open the database at ``path``, run ``operation`` on it and close it."""
+
+    async def run():
+        db = DatabaseManager(str(path))
+        await db.initialize()
+        try:
+            return await operation(db)
+        finally:
+            await db.close()
+
+    return asyncio.run(run())
+
+
+async def seed_tasks(db: DatabaseManager) -> None:
+    project = await db.create_project("Launch")
+    await db.create_tasks(
+        [
+            {
+                "title": f'Task {i}, "quoted" – ünïcode',
+                "description": "line one\nline two" if i % 2 else "",
+                "status": ("pending", "in_progress", "completed", "blocked")[i % 4],
+                "priority": ("low", "medium", "high")[i % 3],
+                "project_id": project["id"] if i % 3 else None,
+                "due_date": f"2025-{i % 12 + 1:02d}-01" if i % 5 else None,
+                "tags": [f"tag-{i % 3}", "shared"][: i % 3],
+            }
+            for i in range(40)
+        ]
+    )
+
+
+async def all_tasks(db: DatabaseManager) -> list[dict]:
+    tasks = await db.list_tasks(limit=1000)
+    for task in tasks:
+        task["tags"] = sorted(tag["name"] for tag in task["tags"])
+    return tasks
+
+
+@pytest.mark.parametrize("fmt", ["ndjson", "csv"])
+def test_export_import_round_trip(tmp_path, fmt):
+    source, target = tmp_path / "source.db", tmp_path / "target.db"
+    dump = tmp_path / f"tasks.{fmt}"
+    with_db(source, seed_tasks)
+    with_db(target, lambda db: db.create_project("Launch"))
+
+    main(["export", str(dump), "--db", str(source)])
+    main(["import", str(dump), "--db", str(target), "--batch-size", "16"])
+
+    tasks = with_db(source, all_tasks)
+    assert len(tasks) == 40
+    assert with_db(target, all_tasks) == tasks
+
+
+@pytest.mark.parametrize(
+    "fmt,content,error",
+    [
+        ("ndjson", '{"title": "Good"}\n{"title": \n', "Line 2: invalid JSON"),
+        ("ndjson", '{"title": "Good"}\n["not", "an", "object"]\n', "Line 2: expected a JSON"),
+        ("csv", "title,status\nGood,pending\nBad,unknown\n", "Record 2: invalid status"),
+        ("csv", "title,priority\nGood,low\n,high\n", "Record 2: every task requires a title"),
+    ],
+)
+def test_import_rejects_malformed_rows(tmp_path, capsys, fmt, content, error):
+    dump = tmp_path / f"tasks.{fmt}"
+    dump.write_text(content, encoding="utf-8")
+
+    with pytest.raises(SystemExit) as exit_info:
+        main(["import", str(dump), "--db", str(tmp_path / "tasks.db"), "--batch-size", "1"])
+    assert exit_info.value.code == 1
+    assert error in capsys.readouterr().err
+    # Batches committed before the failing record stay imported.
+    assert [task["title"] for task in with_db(tmp_path / "tasks.db", all_tasks)] == ["Good"]
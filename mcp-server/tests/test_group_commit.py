@@ -0,0 +1,47 @@
+"""Group commit: concurrent writes share a transaction but fail on their own."""
+
+import asyncio
+
+import aiosqlite
+import pytest
+
+
+async def test_failing_write_is_isolated_within_its_batch(open_db):
+    db = await open_db(group_commit=True, commit_window=0.05, change_retention_hours=0)
+
+    async def failing_op(conn: aiosqlite.Connection) -> None:
+        await conn.execute("INSERT INTO projects (name) VALUES ('Rolled back')")
+        raise RuntimeError("op failed")
+
+    statements: list[str] = []
+    await db.connection.set_trace_callback(statements.append)
+    try:
+        results = await asyncio.gather(
+            *(db.create_task(f"Task {i}") for i in range(3)),
+            db._run_write(failing_op),
+            *(db.create_task(f"Task {i}") for i in range(3, 6)),
+            return_exceptions=True,
+        )
+    finally:
+        await db.connection.set_trace_callback(None)
+
+    assert statements.count("SAVEPOINT group_commit_op") == 7
+    assert statements.count("COMMIT") == 1
+
+    assert isinstance(results[3], RuntimeError)
+    tasks = results[:3] + results[4:]
+    assert [task["title"] for task in tasks] == [f"Task {i}" for i in range(6)]
+    assert sorted(task["id"] for task in await db.list_tasks()) == [t["id"] for t in tasks]
+    assert await db.list_projects() == []
+
+
+async def test_writes_after_a_failed_batch_still_commit(open_db):
+    db = await open_db(group_commit=True, commit_window=0.01, change_retention_hours=0)
+
+    async def failing_op(conn: aiosqlite.Connection) -> None:
+        raise ValueError("bad write")
+
+    with pytest.raises(ValueError, match="bad write"):
+        await db._run_write(failing_op)
+    task = await db.create_task("After failure")
+    assert (await db.get_task(task["id"]))["title"] == "After failure"
@@ -0,0 +1,93 @@
+"""EXPLAIN QUERY PLAN regression tests for task listing queries.
+
+Every listing must be satisfied in index order: a ``USE TEMP B-TREE FOR ORDER
+BY`` step means SQLite sorts the whole result set before returning a page.
+"""
+
+import pytest
+
+from task_tracker_mcp.database import DatabaseManager
+
+LISTING_CALLS = [
+    ("list_tasks", {}),
+    ("list_tasks", {"limit": 20, "offset": 40}),
+    ("list_tasks_page", {"limit": 20}),
+    ("filter_tasks", {"status": "pending"}),
+    ("filter_tasks", {"priority": "high"}),
+    ("filter_tasks", {"project_id": 2}),
+    ("filter_tasks", {"status": "in_progress", "priority": "low"}),
+    ("filter_tasks", {"status": "blocked", "project_id": 3}),
+    ("get_project_tasks", {"project_id": 1}),
+    ("get_overdue_tasks", {}),
+]
+
+
+async def capture_task_queries(db: DatabaseManager, method: str, kwargs: dict) -> list[str]:
+    """Run a DatabaseManager method and return the task SELECTs it executed."""
+    statements: list[str] = []
+    await db.connection.set_trace_callback(statements.append)
+    try:
+        await getattr(db, method)(**kwargs)
+    finally:
+        await db.connection.set_trace_callback(None)
+    return [
+        sql
+        for sql in statements
+        if sql.lstrip().upper().startswith("SELECT") and "FROM tasks" in sql
+    ]
+
+
+async def query_plan(db: DatabaseManager, sql: str) -> list[str]:
+    cursor = await db.connection.execute(f"EXPLAIN QUERY PLAN {sql}")
+    return [row["detail"] for row in await cursor.fetchall()]
+
+
+@pytest.mark.parametrize("method,kwargs", LISTING_CALLS)
+async def test_listing_queries_use_index_order(db, method, kwargs):
+    queries = await capture_task_queries(db, method, kwargs)
+    assert queries, f"{method} executed no task query"
+
+    for sql in queries:
+        plan = await query_plan(db, sql)
+        assert not any("TEMP B-TREE" in step for step in plan), (sql, plan)
+
+
+async def test_cursor_page_uses_index_seek(db):
+    _, cursor = await db.list_tasks_page(limit=50)
+    queries = await capture_task_queries(db, "list_tasks_page", {"limit": 50, "cursor": cursor})
+
+    plan = await query_plan(db, queries[0])
+    assert any(step.startswith("SEARCH") and "idx_tasks_listing" in step for step in plan), plan
+    assert not any("TEMP B-TREE" in step for step in plan), plan
+
+
+async def test_cursor_pages_seek_inside_tie_groups(open_db):
+    db = await open_db("ties.db")
+    await db.create_tasks(
+        [
+            {"title": f"Task {i}", "priority": "high" if i % 10 == 0 else "low"}
+            for i in range(1200)
+        ]
+        + [{"title": "Dated", "priority": "low", "due_date": "2025-06-01"}]
+    )
+
+    pages, cursor = [], None
+    while True:
+        tasks, cursor = await db.list_tasks_page(limit=100, cursor=cursor)
+        pages.append(tasks)
+        if cursor is None:
+            break
+    seen = [task["id"] for page in pages for task in page]
+    assert seen == [task["id"] for task in await db.list_tasks(limit=2000)]
+    assert sorted(seen) == list(range(1, 1202))
+
+    _, cursor = await db.list_tasks_page(limit=500)
+    queries = await capture_task_queries(db, "list_tasks_page", {"limit": 100, "cursor": cursor})
+    plan = await query_plan(db, queries[0])
+    searches = [step for step in plan if "tasks" in step.split()]
+    assert searches == [
+        "SEARCH tasks USING INDEX idx_tasks_listing (priority_rank=? AND due_key=? AND id>?)",
+        "SEARCH tasks USING INDEX idx_tasks_listing (priority_rank=? AND due_key>?)",
+        "SEARCH tasks USING INDEX idx_tasks_listing (priority_rank>?)",
+    ], plan
+    assert not any("TEMP B-TREE" in step for step in plan), plan
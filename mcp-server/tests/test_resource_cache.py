@@ -0,0 +1,58 @@
+"""Cached resources follow the data version, including across rollbacks."""
+
+import json
+
+import aiosqlite
+import pytest
+
+from task_tracker_mcp import server
+from task_tracker_mcp.cache import ResourceCache
+
+
+@pytest.fixture
+async def db(open_db, monkeypatch):
+    manager = await open_db(change_retention_hours=0)
+    monkeypatch.setattr(server, "db_manager", manager)
+    monkeypatch.setattr(server, "resource_cache", ResourceCache())
+    return manager
+
+
+async def pending_titles() -> list[str]:
+    body = json.loads(await server.pending_tasks_resource())
+    return [task["title"] for task in body["tasks"]]
+
+
+async def test_unchanged_data_is_served_from_cache(db):
+    await db.create_task("Kept")
+    assert await pending_titles() == ["Kept"]
+    assert await pending_titles() == ["Kept"]
+    assert server.resource_cache.hits == 1
+
+    await db.create_task("Added")
+    assert await pending_titles() == ["Kept", "Added"]
+
+
+async def test_rolled_back_transaction_changes_the_version(db):
+    await db.create_task("Kept")
+    with pytest.raises(RuntimeError):
+        async with db.transaction():
+            await db.create_task("Ghost")
+            # Reads inside the transaction see, and cache, its uncommitted row.
+            assert await pending_titles() == ["Kept", "Ghost"]
+            version = await db.data_version()
+            raise RuntimeError("rolled back")
+
+    assert await db.data_version() != version
+    assert await pending_titles() == ["Kept"]
+
+
+async def test_failed_write_changes_the_version(db):
+    version = await db.data_version()
+
+    async def failing_op(conn: aiosqlite.Connection) -> None:
+        await conn.execute("INSERT INTO tasks (title) VALUES ('Ghost')")
+        raise RuntimeError("write failed")
+
+    with pytest.raises(RuntimeError):
+        await db._run_write(failing_op)
+    assert await db.data_version() != version
@@ -0,0 +1,20 @@
+"""Ranked full-text search paging."""
+
+import pytest
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+async def test_limit_below_one_is_rejected(db, limit):
+    with pytest.raises(ValueError, match="limit"):
+        await db.search_tasks_page("Task", limit=limit)
+
+
+async def test_pages_end_with_every_match(db):
+    ids, cursor = [], None
+    while True:
+        tasks, cursor = await db.search_tasks_page('tags:"tag-odd"', limit=60, cursor=cursor)
+        ids.extend(task["id"] for task in tasks)
+        if cursor is None:
+            break
+    assert len(ids) == 250
+    assert sorted(ids) == sorted(task["id"] for task in await db.filter_tasks(tag_name="tag-odd"))
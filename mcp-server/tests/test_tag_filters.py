@@ -0,0 +1,62 @@
+"""Tag filters answered from the in-memory tag index.
+
+``filter_tasks`` intersects tag sets in memory; ``filter_tasks_faceted`` applies
+the same conditions in SQL, so the two must return the same tasks.
+"""
+
+import json
+
+import pytest
+
+from task_tracker_mcp.database import DatabaseManager
+
+TAG_FILTERS = [
+    {"tag_name": "tag-1"},
+    {"tags_any": ["tag-1", "tag-2"]},
+    {"tags_all": ["tag-1", "tag-odd"]},
+    {"tags_none": ["tag-odd"]},
+    {"tags_any": ["tag-0", "tag-3"], "tags_none": ["tag-odd"], "status": "pending"},
+    {"tag_name": "tag-2", "tags_all": ["tag-odd"], "priority": "high"},
+    {"tags_any": ["missing"]},
+]
+
+
+@pytest.mark.parametrize("filters", TAG_FILTERS, ids=str)
+async def test_index_matches_sql(db: DatabaseManager, filters: dict):
+    tasks = await db.filter_tasks(**filters)
+    faceted = await db.filter_tasks_faceted([], **filters)
+    assert [task["id"] for task in tasks] == [task["id"] for task in faceted["tasks"]]
+
+
+async def test_tag_name_none_is_ignored(db: DatabaseManager):
+    tasks = await db.filter_tasks(tag_name=None, tags_any=["tag-1", "tag-2"])
+    assert tasks
+    assert tasks == await db.filter_tasks(tags_any=["tag-1", "tag-2"])
+    assert all({"tag-1", "tag-2"} & {tag["name"] for tag in task["tags"]} for task in tasks)
+
+
+async def test_index_follows_tag_writes(db: DatabaseManager):
+    await db.add_tags([1, 2], ["fresh"])
+    await db.remove_tags([2], ["fresh"])
+    await db.delete_task(1)
+    assert await db.filter_tasks(tags_any=["fresh"]) == []
+    await db.add_tags([3], ["fresh"])
+    assert [task["id"] for task in await db.filter_tasks(tags_all=["fresh"])] == [3]
+
+
+async def test_tool_combines_scalar_filters_and_tags(db: DatabaseManager, monkeypatch):
+    from task_tracker_mcp import server
+
+    monkeypatch.setattr(server, "db_manager", db)
+    arguments = {"status": "pending", "priority": "high", "tags_any": ["tag-0", "tag-odd"]}
+    expected = await db.filter_tasks(**arguments)
+    assert expected
+
+    content, _ = await server.mcp.call_tool("filter_tasks", arguments)
+    result = json.loads(content[0].text)
+    assert [task["id"] for task in result["tasks"]] == [task["id"] for task in expected]
+
+    content, _ = await server.mcp.call_tool("filter_tasks", {**arguments, "facets": ["status"]})
+    result = json.loads(content[0].text)
+    assert result["total"] == len(expected)
+    assert result["facets"]["status"]["pending"] == len(expected)
@@ -0,0 +1,48 @@
+"""Unit-of-work transactions and their nested savepoints."""
+
+import pytest
+
+
+async def titles(db) -> list[str]:
+    return sorted(task["title"] for task in await db.list_tasks())
+
+
+async def test_nested_blocks_commit_together(open_db):
+    db = await open_db()
+    async with db.transaction():
+        await db.create_task("Outer")
+        async with db.transaction():
+            await db.create_task("Inner")
+            assert await titles(db) == ["Inner", "Outer"]
+    assert await titles(db) == ["Inner", "Outer"]
+
+
+async def test_inner_failure_rolls_back_only_the_inner_block(open_db):
+    db = await open_db()
+    async with db.transaction():
+        await db.create_task("Before")
+        with pytest.raises(RuntimeError):
+            async with db.transaction():
+                await db.create_task("Inner")
+                async with db.transaction():
+                    await db.create_task("Innermost")
+                raise RuntimeError("inner failed")
+        await db.create_task("After")
+    assert await titles(db) == ["After", "Before"]
+
+
+async def test_outer_failure_discards_everything(open_db):
+    db = await open_db()
+    task = await db.create_task("Original")
+    with pytest.raises(RuntimeError):
+        async with db.transaction():
+            await db.create_task("Outer")
+            async with db.transaction():
+                await db.create_task("Inner")
+                await db.update_task(task["id"], title="Renamed")
+                await db.add_tags([task["id"]], ["rolled-back"])
+            assert (await db.get_task(task["id"]))["title"] == "Renamed"
+            raise RuntimeError("outer failed")
+    assert await titles(db) == ["Original"]
+    assert (await db.get_task(task["id"]))["title"] == "Original"
+    assert await db.filter_tasks(tags_any=["rolled-back"]) == []